@@ -89,6 +89,7 @@ async def get_db_client(
         url=config.get_db_url(),
         api_key=config.get_db_api_key(),
         logger=logger,
+        prefer_grpc=config.get_db_prefer_grpc(),
     )
 
 
@@ -1,5 +1,5 @@
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from adapters.exceptions import (
     AdapterError,
@@ -18,6 +18,9 @@ from domain.exceptions import (
     ValidationError,
 )
 
+# The generic error body never changes, serialize it once
+_GLOBAL_ERROR_BODY = b'{"detail":"An error occurred."}'
+
 
 class ExceptionHandler:
     """Class to handle exceptions in FastAPI.
@@ -96,7 +99,7 @@ class ExceptionHandler:
         self,
         request: Request,
         exc: Exception,
-    ) -> JSONResponse:
+    ) -> Response:
         """Handles unexpected exceptions and returns a generic HTTP 500 response.
 
         This method is called when an exception occurs that is not explicitly handled
@@ -108,12 +111,12 @@ class ExceptionHandler:
             exc (Exception): The exception that was raised during request processing.
 
         Returns:
-            JSONResponse: A JSON response with the error details,
+            Response: A JSON response with the error details,
                 and a generic HTTP 500 status code.
         """
-        content = {"detail": "An error occurred."}
         request.state.logger.exception("Unhandled internal error", exc, {})
-        return JSONResponse(
+        return Response(
+            content=_GLOBAL_ERROR_BODY,
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=content,
+            media_type="application/json",
         )
@@ -1,8 +1,10 @@
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from logger import LogLevel, LoguruLogger
 
 from adapters.api.dependencies import get_db_client
@@ -11,9 +13,9 @@ from adapters.api.exception_handler import ExceptionHandler
 from adapters.api.search.router import router as search_router
 from adapters.encoding.huggingface_dense import HuggingfaceEmbeddingService
 from adapters.encoding.huggingface_sparse import HuggingfaceSparseEmbeddingService
-from adapters.infrastructure.config.settings import Settings
+from adapters.infrastructure.config.settings import get_settings
 
-config = Settings()
+config = get_settings()
 
 
 @asynccontextmanager
@@ -51,6 +53,18 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[dict[str, Any]]:
         model_name=config.get_sparse_embedding_model_name(),
     )
 
+    # Run a first encoding to pay the tokenizer and model initialization costs
+    # at startup rather than on the first request
+    logger.debug("Warming up embedding models")
+    await asyncio.to_thread(
+        HuggingfaceEmbeddingService(model=model, logger=logger).encode,
+        "warmup",
+    )
+    await asyncio.to_thread(
+        HuggingfaceSparseEmbeddingService(model=sparse_model, logger=logger).encode,
+        "warmup",
+    )
+
     logger.debug("Creating DB collection if it does not exist yet")
     client = await get_db_client(logger=logger, config=config)
     client.create_db_collection_if_not_exists(
@@ -59,6 +73,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[dict[str, Any]]:
         vector_distance=config.get_db_vector_distance(),
         dense_vector_name=config.get_dense_vector_name(),
         sparse_vector_name=config.get_sparse_vector_name(),
+        quantize_dense=config.get_db_quantize_dense(),
     )
 
     logger.info("Application initialized successfully")
@@ -77,6 +92,7 @@ app = FastAPI(
     version="0.0.1",
     debug=config.get_log_level() == LogLevel.DEBUG and not config.is_env_production(),
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 app.openapi_version = "3.0.2"
 
@@ -1,19 +1,24 @@
-from typing import override
+from typing import TYPE_CHECKING, override
 
 from logger import LoggerContract
-from sentence_transformers.sparse_encoder import SparseEncoder
 
 from adapters.exceptions import EncodingError, ModelLoadingError
 from domain.contracts.sparse_embedding_service import SparseEmbeddingServiceContract
 from domain.types.vectors import SparseVector
 
+# torch and sentence_transformers are imported where they are used, so that
+# importing the service at startup pays for neither of them
+if TYPE_CHECKING:
+    from sentence_transformers.sparse_encoder import SparseEncoder
+    from torch import Tensor
+
 
 class HuggingfaceSparseEmbeddingService(SparseEmbeddingServiceContract):
     """Sparse Encoder Service using Hugging Face's SparseEncoder."""
 
     def __init__(
         self,
-        model: SparseEncoder,
+        model: "SparseEncoder",
         logger: LoggerContract,
     ) -> None:
         """Initialize the HuggingfaceSparseEmbeddingService.
@@ -27,7 +32,7 @@ class HuggingfaceSparseEmbeddingService(SparseEmbeddingServiceContract):
         self.logger = logger
 
     @staticmethod
-    def load_sparse_encoding_model(model_name: str) -> SparseEncoder:
+    def load_sparse_encoding_model(model_name: str) -> "SparseEncoder":
         """Loads a SparseEncoder model for sparse text embeddings.
 
         Args:
@@ -39,6 +44,8 @@ class HuggingfaceSparseEmbeddingService(SparseEmbeddingServiceContract):
         Returns:
             SparseEncoder: The loaded SparseEncoder model.
         """
+        from sentence_transformers.sparse_encoder import SparseEncoder  # noqa: PLC0415
+
         try:
             return SparseEncoder(model_name)
         except Exception as e:
@@ -46,6 +53,42 @@ class HuggingfaceSparseEmbeddingService(SparseEmbeddingServiceContract):
                 f"Failed to load sparse model '{model_name}': {e}",
             ) from e
 
+    @staticmethod
+    def _extract_indices_and_values(
+        sparse_tensor: "Tensor",
+    ) -> tuple["Tensor", "Tensor"]:
+        """Moves the indices and values of a sparse tensor to the CPU.
+
+        Args:
+            sparse_tensor (Tensor): The sparse tensor returned by the model.
+
+        Returns:
+            tuple[Tensor, Tensor]: The indices and values, on the CPU.
+        """
+        # Coalesce only when the encoder did not already do so
+        if (
+            hasattr(sparse_tensor, "is_coalesced")
+            and hasattr(sparse_tensor, "coalesce")
+            and not sparse_tensor.is_coalesced()
+        ):
+            sparse_tensor = sparse_tensor.coalesce()
+
+        indices_tensor = sparse_tensor.indices()
+        values_tensor = sparse_tensor.values()
+
+        # Inputs made only of stopwords give no entries, so nothing to copy
+        if values_tensor.numel() == 0:
+            return indices_tensor, values_tensor
+
+        # Queue both device to host copies before waiting on them once
+        indices_tensor = indices_tensor.to("cpu", non_blocking=True)
+        values_tensor = values_tensor.to("cpu", non_blocking=True)
+        if sparse_tensor.is_cuda:
+            from torch import cuda  # noqa: PLC0415
+
+            cuda.synchronize()
+        return indices_tensor, values_tensor
+
     @override
     def encode(self, text: str) -> SparseVector:
         """Encodes a text into a sparse vector representation.
@@ -67,25 +110,22 @@ class HuggingfaceSparseEmbeddingService(SparseEmbeddingServiceContract):
             context={"text_length": len(text)},
         )
 
-        try:
-            # Get true sparse tensor
-            sparse_tensor = self.model.encode(
-                text,
-                convert_to_tensor=True,
-                convert_to_sparse_tensor=True,
-            )
+        from torch import inference_mode  # noqa: PLC0415
 
-            # Convert sparse tensor to indices and values
-            if hasattr(sparse_tensor, "coalesce"):
-                sparse_tensor = sparse_tensor.coalesce()
+        try:
+            # Get true sparse tensor, without any autograd bookkeeping
+            with inference_mode():
+                sparse_tensor = self.model.encode(
+                    text,
+                    convert_to_tensor=True,
+                    convert_to_sparse_tensor=True,
+                )
 
-            # Extract indices and values from sparse tensor
-            indices = sparse_tensor.indices().cpu().numpy()
-            values = sparse_tensor.values().cpu().numpy()
+            indices, values = self._extract_indices_and_values(sparse_tensor)
 
-            # Create SparseVector object
+            # Create SparseVector object, converting straight to Python lists
             sparse_vector = SparseVector(
-                indices=(indices.flatten() if indices.ndim > 1 else indices).tolist(),
+                indices=indices.flatten().tolist(),
                 values=values.tolist(),
             )
         except Exception as e:
@@ -105,3 +145,60 @@ class HuggingfaceSparseEmbeddingService(SparseEmbeddingServiceContract):
         )
 
         return sparse_vector
+
+    def encode_batch(self, texts: list[str]) -> list[SparseVector]:
+        """Encodes several texts into sparse vectors with a single model call.
+
+        Args:
+            texts (list[str]): The texts to encode.
+
+        Raises:
+            EncodingError: If there is an error during the encoding process.
+
+        Returns:
+            list[SparseVector]: The sparse vectors, in the order of the texts.
+        """
+        if not self.model:
+            raise EncodingError("Sparse model not available")
+
+        if not texts:
+            return []
+
+        self.logger.debug(
+            "Encoding texts into sparse vectors",
+            context={"batch_size": len(texts)},
+        )
+
+        from torch import inference_mode  # noqa: PLC0415
+
+        try:
+            # Get one (batch, vocabulary) sparse tensor for all the texts
+            with inference_mode():
+                sparse_tensor = self.model.encode(
+                    texts,
+                    convert_to_tensor=True,
+                    convert_to_sparse_tensor=True,
+                    batch_size=len(texts),
+                )
+            indices, values = self._extract_indices_and_values(sparse_tensor)
+
+            # Dispatch each (row, column, value) entry to the vector of its text
+            rows, columns = indices.tolist()
+            sparse_vectors = [SparseVector(indices=[], values=[]) for _ in texts]
+            for row, column, value in zip(rows, columns, values.tolist(), strict=True):
+                sparse_vectors[row].indices.append(column)
+                sparse_vectors[row].values.append(value)
+        except Exception as e:
+            self.logger.exception(
+                "Error during sparse batch encoding",
+                context={"batch_size": len(texts), "error": str(e)},
+                exc=e,
+            )
+            raise EncodingError(f"Failed to encode sparse texts: {e}") from e
+
+        self.logger.debug(
+            "Batch encoding completed",
+            context={"batch_size": len(sparse_vectors)},
+        )
+
+        return sparse_vectors
@@ -51,6 +51,15 @@ class ConfigContract(CoreConfigContract):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_db_prefer_grpc(self) -> bool:
+        """Whether to talk to the database over gRPC rather than HTTP.
+
+        Returns:
+            bool: True to prefer gRPC for database requests.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_db_collection(self) -> str:
         """Name of the database collection to use.
@@ -78,6 +87,15 @@ class ConfigContract(CoreConfigContract):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_db_quantize_dense(self) -> bool:
+        """Whether the database keeps a quantized copy of the dense vectors.
+
+        Returns:
+            bool: True to search the dense vectors through an int8 quantized copy.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_dense_vector_name(self) -> str:
         """Name of the dense vector in the database.
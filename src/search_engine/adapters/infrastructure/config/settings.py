@@ -1,7 +1,8 @@
+from functools import lru_cache
 from typing import override
 
 from configcore import Settings as CoreSettings
-from pydantic import Field, model_validator
+from pydantic import ConfigDict, Field
 
 from adapters.infrastructure.config.contract import ConfigContract
 
@@ -12,6 +13,15 @@ class Settings(CoreSettings, ConfigContract):
     It extends CoreSettings and implements ConfigContract.
     """
 
+    # Settings are read-only once loaded, so the getters below always return
+    # the values validated at startup and the instance can be shared safely.
+    # Entries of the shared environment meant for other services are ignored.
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        extra="ignore",
+    )
+
     # Database configuration
     db_method: str = Field(
         default="qdrant",
@@ -35,6 +45,10 @@ class Settings(CoreSettings, ConfigContract):
         default=None,
         description="API key for Qdrant (if needed)",
     )
+    db_qdrant_prefer_grpc: bool = Field(
+        default=False,
+        description="Whether to talk to Qdrant over gRPC (port 6334) rather than HTTP",
+    )
     db_qdrant_collection: str = Field(
         default="entities",
         description="Name of the Qdrant collection",
@@ -54,6 +68,14 @@ class Settings(CoreSettings, ConfigContract):
             "Only useful if the collection doesn't exist."
         ),
     )
+    db_qdrant_quantize_dense: bool = Field(
+        default=False,
+        description=(
+            "Whether Qdrant keeps an int8 quantized copy of the dense vectors "
+            "in memory to search them. "
+            "Only useful if the collection doesn't exist."
+        ),
+    )
 
     # Vector name configuration
     db_qdrant_dense_vector_name: str = Field(
@@ -111,6 +133,10 @@ class Settings(CoreSettings, ConfigContract):
     def get_db_api_key(self) -> str | None:
         return self.db_qdrant_api_key
 
+    @override
+    def get_db_prefer_grpc(self) -> bool:
+        return self.db_qdrant_prefer_grpc
+
     @override
     def get_db_collection(self) -> str:
         return self.db_qdrant_collection
@@ -123,6 +149,10 @@ class Settings(CoreSettings, ConfigContract):
     def get_db_vector_dimensions(self) -> int:
         return self.db_qdrant_vector_dimensions
 
+    @override
+    def get_db_quantize_dense(self) -> bool:
+        return self.db_qdrant_quantize_dense
+
     @override
     def get_dense_vector_name(self) -> str:
         return self.db_qdrant_dense_vector_name
@@ -147,21 +177,40 @@ class Settings(CoreSettings, ConfigContract):
     def get_sparse_embedding_model_name(self) -> str:
         return self.sparse_embedding_model_name
 
-    @model_validator(mode="after")
-    def validate_vector_dimensions_consistency(self) -> "Settings":
-        """Validates that embedding and Qdrant vector dimensions match.
-
-        Raises:
-            ValueError: If dimensions are inconsistent.
-
-        Returns:
-            Settings: The validated settings instance.
-        """
-        if self.embedding_hf_vector_dimensions != self.db_qdrant_vector_dimensions:
-            raise ValueError(
-                f"Vector dimension mismatch: embedding_hf_vector_dimensions "
-                f"({self.embedding_hf_vector_dimensions}) "
-                f"must match db_qdrant_vector_dimensions ",
-                f"({self.db_qdrant_vector_dimensions}).",
-            )
-        return self
+
+def build_settings(**overrides: object) -> Settings:
+    """Builds the settings and checks that their vector dimensions match.
+
+    The check runs here rather than in a model validator so that plain
+    `Settings` construction stays cheap, while the application settings
+    obtained from `get_settings` are still checked once.
+
+    Args:
+        **overrides (object): Field values taking precedence over the
+            environment.
+
+    Raises:
+        ValueError: If embedding and Qdrant vector dimensions differ.
+
+    Returns:
+        Settings: The checked settings instance.
+    """
+    settings = Settings(**overrides)
+    if settings.embedding_hf_vector_dimensions != settings.db_qdrant_vector_dimensions:
+        raise ValueError(
+            f"Vector dimension mismatch: embedding_hf_vector_dimensions "
+            f"({settings.embedding_hf_vector_dimensions}) "
+            f"must match db_qdrant_vector_dimensions "
+            f"({settings.db_qdrant_vector_dimensions}).",
+        )
+    return settings
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Gets the application settings, built from the environment once.
+
+    Returns:
+        Settings: The cached settings instance.
+    """
+    return build_settings()
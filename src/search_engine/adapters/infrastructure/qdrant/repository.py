@@ -1,11 +1,14 @@
 from collections.abc import Sequence
-from typing import override
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, override
 from uuid import uuid4
 
 from logger import LoggerContract
 from pydantic import ValidationError as PydanticValidationError
 from qdrant_client import QdrantClient
 from qdrant_client.http.models import (
+    ExtendedPointId,
     FieldCondition,
     Filter,
     Fusion,
@@ -14,9 +17,15 @@ from qdrant_client.http.models import (
     MatchValue,
     NamedSparseVector,
     NamedVector,
+    OverwritePayloadOperation,
+    PointsList,
     PointStruct,
     Prefetch,
     Range,
+    ScoredPoint,
+    SearchRequest,
+    SetPayload,
+    UpsertOperation,
 )
 from qdrant_client.http.models import (
     SparseVector as QdrantSparseVector,
@@ -27,6 +36,7 @@ from domain.contracts.repository import RepositoryContract
 from domain.exceptions import ValidationError
 from domain.types.competency import Competency
 from domain.types.entity import Entity
+from domain.types.enums import CompetencyType, Language, Provider
 from domain.types.filters import DomainFilter, DomainFilterOperator
 from domain.types.identifier import Identifier
 from domain.types.service_models import (
@@ -36,6 +46,24 @@ from domain.types.service_models import (
 )
 from domain.types.vectors import DenseVector, SparseVector, VectorName
 
+# Operators whose conditions exclude the matching points
+_NEGATIVE_OPERATORS = frozenset(
+    {DomainFilterOperator.NOT_EQUAL, DomainFilterOperator.NOT_IN},
+)
+
+# Fields a stored payload must hold, as competencies are rebuilt unvalidated
+_REQUIRED_COMPETENCY_FIELDS = frozenset(
+    name for name, info in Competency.model_fields.items() if info.is_required()
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _FiltersCacheKey:
+    """Filters to translate, cached on their typed key only."""
+
+    filters: tuple[DomainFilter, ...] = field(compare=False)
+    key: tuple[tuple[Any, ...], ...]
+
 
 class QdrantRepository(RepositoryContract):
     """Implementation of RepositoryContract for Qdrant."""
@@ -74,28 +102,16 @@ class QdrantRepository(RepositoryContract):
             Entity: The created entity with a generated identifier.
         """
         new_id = uuid4()
-
-        # Convert Competency model to dict for storage in Qdrant
-        competency_payload = model.competency.model_dump(exclude_none=True)
-
-        # Store both dense and sparse vectors in Qdrant
-        vectors = {
-            self.dense_vector_name: model.dense_vector.values,
-            self.sparse_vector_name: {
-                "indices": model.sparse_vector.indices,
-                "values": model.sparse_vector.values,
-            },
-        }
-
-        point = PointStruct(
-            id=str(new_id),
-            vector=vectors,
-            payload=competency_payload,
+        point = self._build_point(
+            new_id,
+            self._competency_to_payload(model.competency),
+            model.dense_vector,
+            model.sparse_vector,
         )
 
         logger_context = {
             "id": new_id,
-            "competency": competency_payload,
+            "competency": point.payload,
             "dense_vector_length": len(model.dense_vector.values),
             "sparse_vector_dimensions": len(model.sparse_vector.indices),
         }
@@ -126,12 +142,74 @@ class QdrantRepository(RepositoryContract):
         self.logger.info("Entity created", context={"id": new_id})
         return Entity(identifier=new_id, competency=model.competency)
 
+    def create_entities(self, models: Sequence[CreateEntityModel]) -> list[Entity]:
+        """Creates several new entities in Qdrant with a single request.
+
+        Args:
+            models (Sequence[CreateEntityModel]): CreateEntityModels with
+                `competency` and `vector`.
+
+        Returns:
+            list[Entity]: The created entities with generated identifiers, in
+                the order of the given models.
+        """
+        if not models:
+            return []
+
+        new_ids = [uuid4() for _ in models]
+        points = [
+            self._build_point(
+                new_id,
+                self._competency_to_payload(model.competency),
+                model.dense_vector,
+                model.sparse_vector,
+            )
+            for new_id, model in zip(new_ids, models, strict=True)
+        ]
+
+        logger_context = {"ids": new_ids, "count": len(points)}
+
+        # Store all the entities in Qdrant at once
+        try:
+            response = self.client.upsert(
+                collection_name=self.collection_name,
+                points=points,
+            )
+        except Exception as e:
+            self.logger.exception(
+                "Failed to create entities",
+                context=logger_context,
+                exc=e,
+            )
+            raise RepositoryError(f"Failed to create entities: {e}") from e
+
+        if str(response.status).lower() != "completed":
+            self.logger.error(
+                "Failed to create entities",
+                context={"status": response.status, **logger_context},
+            )
+            raise RepositoryError(
+                f"Failed to create entities: invalid response status {response.status}",
+            )
+
+        self.logger.info("Entities created", context=logger_context)
+        return [
+            Entity(identifier=new_id, competency=model.competency)
+            for new_id, model in zip(new_ids, models, strict=True)
+        ]
+
     @override
-    def get_entity(self, identifier: Identifier) -> Entity | None:
+    def get_entity(
+        self,
+        identifier: Identifier,
+        *,
+        include_vectors: bool = False,
+    ) -> Entity | None:
         """Retrieves an entity by its identifier.
 
         Args:
             identifier (Identifier): The UUID of the entity.
+            include_vectors (bool): Whether to retrieve the vectors of the entity.
 
         Returns:
             Entity | None: The found entity or None if not found.
@@ -141,7 +219,7 @@ class QdrantRepository(RepositoryContract):
                 collection_name=self.collection_name,
                 ids=[str(identifier)],
                 with_payload=True,
-                with_vectors=True,
+                with_vectors=include_vectors,
             )
         except Exception as e:
             self.logger.exception(
@@ -162,7 +240,10 @@ class QdrantRepository(RepositoryContract):
         point = points[0]
 
         # Convert payload dict back to Competency model
-        competency = Competency(**point.payload)
+        competency = self._competency_from_payload(identifier, point.payload)
+
+        if not include_vectors:
+            return Entity(identifier=identifier, competency=competency)
 
         # Named vectors (new format)
         # Reconstruct DenseVector from stored values
@@ -197,31 +278,34 @@ class QdrantRepository(RepositoryContract):
             model (UpdateEntityModel): UpdateEntityModel with `id`,
                 `competency`, and `vector`.
 
+        Raises:
+            ValidationError: If only one of the vectors is given.
+
         Returns:
             Entity: The updated entity.
         """
-        # Convert Competency model to dict for storage in Qdrant
-        competency_payload = model.competency.model_dump(exclude_none=True)
-
-        # Store both dense and sparse vectors in Qdrant
-        vectors = {
-            self.dense_vector_name: model.dense_vector.values,
-            self.sparse_vector_name: {
-                "indices": model.sparse_vector.indices,
-                "values": model.sparse_vector.values,
-            },
-        }
+        has_vectors = self._has_vectors(model)
+        competency_payload = self._competency_to_payload(model.competency)
 
-        point = PointStruct(
-            id=str(model.identifier),
-            vector=vectors,
-            payload=competency_payload,
-        )
         try:
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=[point],
-            )
+            if not has_vectors:
+                # Keep the stored vectors and only replace the payload
+                self.client.overwrite_payload(
+                    collection_name=self.collection_name,
+                    payload=competency_payload,
+                    points=[str(model.identifier)],
+                )
+            else:
+                point = self._build_point(
+                    model.identifier,
+                    competency_payload,
+                    model.dense_vector,
+                    model.sparse_vector,
+                )
+                self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=[point],
+                )
         except Exception as e:
             self.logger.exception(
                 "Failed to update entity",
@@ -239,6 +323,72 @@ class QdrantRepository(RepositoryContract):
 
         return Entity(identifier=model.identifier, competency=model.competency)
 
+    def update_entities(self, models: Sequence[UpdateEntityModel]) -> list[Entity]:
+        """Updates several existing entities (competency + vector).
+
+        Entities given with their vectors are replaced, the others only have
+        their competency updated, all in a single request.
+
+        Args:
+            models (Sequence[UpdateEntityModel]): UpdateEntityModels with `id`,
+                `competency`, and `vector`.
+
+        Raises:
+            ValidationError: If only one of the vectors of an entity is given.
+
+        Returns:
+            list[Entity]: The updated entities, in the order of the given models.
+        """
+        with_vectors = [model for model in models if self._has_vectors(model)]
+        logger_context = {
+            "ids": [model.identifier for model in models],
+            "count": len(models),
+        }
+
+        try:
+            operations: list[UpsertOperation | OverwritePayloadOperation] = []
+            if with_vectors:
+                points = [
+                    self._build_point(
+                        model.identifier,
+                        self._competency_to_payload(model.competency),
+                        model.dense_vector,
+                        model.sparse_vector,
+                    )
+                    for model in with_vectors
+                ]
+                operations.append(UpsertOperation(upsert=PointsList(points=points)))
+            # Keep the stored vectors of the entities given without any
+            operations.extend(
+                OverwritePayloadOperation(
+                    overwrite_payload=SetPayload(
+                        payload=self._competency_to_payload(model.competency),
+                        points=[str(model.identifier)],
+                    ),
+                )
+                for model in models
+                if model.dense_vector is None
+            )
+            if operations:
+                self.client.batch_update_points(
+                    collection_name=self.collection_name,
+                    update_operations=operations,
+                )
+        except Exception as e:
+            self.logger.exception(
+                "Failed to update entities",
+                context=logger_context,
+                exc=e,
+            )
+            raise RepositoryError(f"Failed to update entities: {e}") from e
+
+        self.logger.info("Entities updated successfully", context=logger_context)
+
+        return [
+            Entity(identifier=model.identifier, competency=model.competency)
+            for model in models
+        ]
+
     @override
     def delete_entity(self, identifier: Identifier) -> None:
         """Deletes an entity from Qdrant by its identifier.
@@ -288,39 +438,9 @@ class QdrantRepository(RepositoryContract):
             context={"filters": filters, "vector_name": vector_name},
         )
 
-        try:
-            qdrant_filter = self._build_search_filters(filters)
-        except PydanticValidationError as e:
-            self.logger.exception(
-                "Validation error while building search filters",
-                context={"filters": filters},
-                exc=e,
-            )
-            raise ValidationError(f"Invalid filters: {e}") from e
-        except Exception as e:
-            self.logger.exception(
-                "Failed to build search filters",
-                context={"filters": filters},
-                exc=e,
-            )
-            raise RepositoryError(f"Failed to build search filters: {e}") from e
+        qdrant_filter = self._build_checked_search_filters(filters)
 
-        # Prepare query vector based on vector type
-        if vector_name == VectorName.SPARSE:
-            query_vector = NamedSparseVector(
-                name=self.sparse_vector_name,
-                vector={
-                    "indices": vector.indices,
-                    "values": vector.values,
-                },
-            )
-        elif vector_name == VectorName.DENSE:
-            query_vector = NamedVector(
-                name=self.dense_vector_name,
-                vector=vector.values,
-            )
-        else:
-            raise RepositoryError(f"Unsupported vector type: {vector_name}")
+        query_vector = self._build_query_vector(vector, vector_name)
 
         try:
             response = self.client.search(
@@ -329,6 +449,8 @@ class QdrantRepository(RepositoryContract):
                 query_filter=qdrant_filter,
                 limit=top,
                 with_payload=True,
+                # Results only expose the payload, skip transferring the vectors
+                with_vectors=False,
             )
         except Exception as e:
             # Prepare vector info for logging
@@ -350,17 +472,74 @@ class QdrantRepository(RepositoryContract):
             )
             raise RepositoryError(f"Failed search_by_vector : {e}") from e
 
-        return [
-            SearchResult(
-                entity=Entity(
-                    identifier=Identifier(point.id),
-                    competency=Competency(**point.payload),
-                ),
-                score=point.score,
+        return self._build_search_results(response)
+
+    def search_batch_by_vectors_and_filters(
+        self,
+        vectors: Sequence[DenseVector | SparseVector],
+        filters: Sequence[DomainFilter],
+        top: int,
+        vector_name: VectorName = VectorName.DENSE,
+    ) -> list[Sequence[SearchResult]]:
+        """Searches for similar entities to several vectors with a single request.
+
+        Args:
+            vectors (Sequence[DenseVector | SparseVector]): The vectors to
+                search for.
+            filters (Sequence[DomainFilter]): The filters criteria to apply to
+                every search.
+            top (int): The number of results to return for each vector.
+            vector_name (VectorName): The name of the vectors to search with.
+
+        Returns:
+            list[Sequence[SearchResult]]: A sequence of SearchResult objects
+                for each vector, in the order of the given vectors.
+        """
+        self.logger.info(
+            "Searching batch with filters",
+            context={
+                "filters": filters,
+                "vector_name": vector_name,
+                "count": len(vectors),
+            },
+        )
+
+        if not vectors:
+            return []
+
+        qdrant_filter = self._build_checked_search_filters(filters)
+        requests = [
+            SearchRequest(
+                vector=self._build_query_vector(vector, vector_name),
+                filter=qdrant_filter,
+                limit=top,
+                with_payload=True,
+                # Results only expose the payload, skip transferring the vectors
+                with_vector=False,
             )
-            for point in response
+            for vector in vectors
         ]
 
+        try:
+            responses = self.client.search_batch(
+                collection_name=self.collection_name,
+                requests=requests,
+            )
+        except Exception as e:
+            self.logger.exception(
+                "Failed to search batch by vectors and filters",
+                context={
+                    "count": len(vectors),
+                    "vector_name": vector_name,
+                    "filters": filters,
+                    "top": top,
+                },
+                exc=e,
+            )
+            raise RepositoryError(f"Failed search_batch_by_vectors : {e}") from e
+
+        return [self._build_search_results(response) for response in responses]
+
     @override
     def search_hybrid_by_vectors_and_filters(
         self,
@@ -389,22 +568,7 @@ class QdrantRepository(RepositoryContract):
             },
         )
 
-        try:
-            qdrant_filter = self._build_search_filters(filters)
-        except PydanticValidationError as e:
-            self.logger.exception(
-                "Validation error while building search filters",
-                context={"filters": filters},
-                exc=e,
-            )
-            raise ValidationError(f"Invalid filters: {e}") from e
-        except Exception as e:
-            self.logger.exception(
-                "Failed to build search filters",
-                context={"filters": filters},
-                exc=e,
-            )
-            raise RepositoryError(f"Failed to build search filters: {e}") from e
+        qdrant_filter = self._build_checked_search_filters(filters)
 
         # Create dense and sparse vector queries
         dense_query = Prefetch(
@@ -433,6 +597,8 @@ class QdrantRepository(RepositoryContract):
                 query_filter=qdrant_filter,
                 limit=top,
                 with_payload=True,
+                # Results only expose the payload, skip transferring the vectors
+                with_vectors=False,
             )
         except Exception as e:
             self.logger.exception(
@@ -447,21 +613,225 @@ class QdrantRepository(RepositoryContract):
             )
             raise RepositoryError(f"Failed hybrid search: {e}") from e
 
+        return self._build_search_results(response.points)
+
+    @staticmethod
+    def _has_vectors(model: UpdateEntityModel) -> bool:
+        """Tells whether an entity is updated with its vectors.
+
+        Args:
+            model (UpdateEntityModel): The update of the entity.
+
+        Raises:
+            ValidationError: If only one of the vectors is given.
+
+        Returns:
+            bool: True if both vectors are given, False if the stored ones are kept.
+        """
+        if (model.dense_vector is None) != (model.sparse_vector is None):
+            raise ValidationError(
+                f"Dense and sparse vectors must be given together ({model.identifier})",
+            )
+        return model.dense_vector is not None
+
+    def _build_point(
+        self,
+        identifier: Identifier,
+        payload: dict[str, Any],
+        dense_vector: DenseVector,
+        sparse_vector: SparseVector,
+    ) -> PointStruct:
+        """Builds the Qdrant point storing an entity.
+
+        Args:
+            identifier (Identifier): The UUID of the entity.
+            payload (dict[str, Any]): The competency payload of the entity.
+            dense_vector (DenseVector): The dense vector of the entity.
+            sparse_vector (SparseVector): The sparse vector of the entity.
+
+        Returns:
+            PointStruct: The point holding both named vectors and the payload.
+        """
+        return PointStruct(
+            id=str(identifier),
+            # Store both dense and sparse vectors in Qdrant
+            vector={
+                self.dense_vector_name: dense_vector.values,
+                self.sparse_vector_name: {
+                    "indices": sparse_vector.indices,
+                    "values": sparse_vector.values,
+                },
+            },
+            payload=payload,
+        )
+
+    def _build_query_vector(
+        self,
+        vector: DenseVector | SparseVector,
+        vector_name: VectorName,
+    ) -> NamedVector | NamedSparseVector:
+        """Builds the named Qdrant query vector for a search.
+
+        Args:
+            vector (DenseVector | SparseVector): The vector to search for.
+            vector_name (VectorName): The name of the vector to search with.
+
+        Returns:
+            NamedVector | NamedSparseVector: The query vector for Qdrant.
+
+        Raises:
+            RepositoryError: If the vector name is not supported.
+        """
+        if vector_name == VectorName.SPARSE:
+            return NamedSparseVector(
+                name=self.sparse_vector_name,
+                vector={
+                    "indices": vector.indices,
+                    "values": vector.values,
+                },
+            )
+        if vector_name == VectorName.DENSE:
+            return NamedVector(
+                name=self.dense_vector_name,
+                vector=vector.values,
+            )
+        raise RepositoryError(f"Unsupported vector type: {vector_name}")
+
+    def _build_checked_search_filters(
+        self,
+        filters: Sequence[DomainFilter],
+    ) -> Filter | None:
+        """Builds a Qdrant Filter for a search, logging any failure.
+
+        Args:
+            filters (Sequence[DomainFilter]): The filters criteria to apply.
+
+        Returns:
+            Filter | None: A Qdrant Filter object constructed from the provided
+                filters, or None to search without any filter.
+
+        Raises:
+            ValidationError: If the filters are invalid.
+            RepositoryError: If the filters cannot be built.
+        """
+        # Searches without filters send no filter at all to Qdrant
+        if not filters:
+            return None
+
+        try:
+            return self._build_search_filters(filters)
+        except PydanticValidationError as e:
+            self.logger.exception(
+                "Validation error while building search filters",
+                context={"filters": filters},
+                exc=e,
+            )
+            raise ValidationError(f"Invalid filters: {e}") from e
+        except Exception as e:
+            self.logger.exception(
+                "Failed to build search filters",
+                context={"filters": filters},
+                exc=e,
+            )
+            raise RepositoryError(f"Failed to build search filters: {e}") from e
+
+    def _build_search_results(
+        self,
+        points: Sequence[ScoredPoint],
+    ) -> list[SearchResult]:
+        """Converts the points found by Qdrant into search results.
+
+        Args:
+            points (Sequence[ScoredPoint]): The scored points returned by Qdrant.
+
+        Returns:
+            list[SearchResult]: The search results, in the order of the points.
+        """
+        competency_from_payload = self._competency_from_payload
         return [
             SearchResult(
                 entity=Entity(
                     identifier=Identifier(point.id),
-                    competency=Competency(**point.payload),
+                    competency=competency_from_payload(point.id, point.payload),
                 ),
                 score=point.score,
             )
-            for point in response.points
+            for point in points
         ]
 
+    @staticmethod
+    def _competency_to_payload(competency: Competency) -> dict[str, Any]:
+        """Converts a Competency to a dict for storage in Qdrant.
+
+        Args:
+            competency (Competency): The competency of an entity.
+
+        Returns:
+            dict[str, Any]: The JSON-compatible payload of the competency.
+        """
+        return competency.model_dump(mode="json", exclude_none=True)
+
+    def _competency_from_payload(
+        self,
+        point_id: Identifier | ExtendedPointId,
+        payload: dict[str, Any],
+    ) -> Competency:
+        """Rebuilds a Competency from a payload stored by this repository.
+
+        Payloads were validated before being stored, so the model is
+        constructed without validation once its required fields are found,
+        and only the enum fields are restored.
+
+        Args:
+            point_id (Identifier | ExtendedPointId): The id of the Qdrant point.
+            payload (dict[str, Any]): The payload of the Qdrant point.
+
+        Raises:
+            RepositoryError: If the payload lacks a required field or has
+                invalid enum fields.
+
+        Returns:
+            Competency: The stored competency.
+        """
+        missing = sorted(_REQUIRED_COMPETENCY_FIELDS - payload.keys())
+        if missing:
+            self.logger.error(
+                "Malformed entity payload",
+                context={"id": point_id, "missing": missing},
+            )
+            raise RepositoryError(
+                f"Malformed payload for entity ({point_id}): "
+                f"missing {', '.join(missing)}",
+            )
+
+        try:
+            return Competency.model_construct(
+                **{
+                    **payload,
+                    "lang": Language(payload["lang"]),
+                    "type": CompetencyType(payload["type"]),
+                    "provider": Provider(payload["provider"]),
+                },
+            )
+        except ValueError as e:
+            self.logger.exception(
+                "Malformed entity payload",
+                context={"id": point_id},
+                exc=e,
+            )
+            raise RepositoryError(
+                f"Malformed payload for entity ({point_id}): {e}",
+            ) from e
+
     @classmethod
     def _build_search_filters(cls, filters: Sequence[DomainFilter]) -> Filter:
         """Builds a Qdrant Filter from a sequence of DomainFilter objects.
 
+        Translations are cached per unique filter set, as applications usually
+        search with a small number of static filter shapes. Cached Filters are
+        shared by all the calls with the same filters, so callers must only
+        hand them to the client and never mutate them.
+
         Args:
             filters (Sequence[DomainFilter]): A sequence of
                 DomainFilter objects to convert.
@@ -472,22 +842,80 @@ class QdrantRepository(RepositoryContract):
         if not filters:
             return Filter()
 
+        cache_key = _FiltersCacheKey(
+            filters=tuple(filters),
+            key=tuple(cls._filter_cache_key(f) for f in filters),
+        )
+        try:
+            hash(cache_key)
+        except TypeError:
+            # Unhashable filter values cannot be cached
+            return cls._translate_search_filters(filters)
+
+        return cls._build_cached_search_filters(cache_key)
+
+    @staticmethod
+    def _filter_cache_key(domain_filter: DomainFilter) -> tuple[Any, ...]:
+        """Builds the cache key of a DomainFilter.
+
+        Values are keyed with their type, as equal values of different types
+        like True, 1 and 1.0 hash the same but translate to different matches.
+
+        Args:
+            domain_filter (DomainFilter): The domain filter to key.
+
+        Returns:
+            tuple[Any, ...]: The key of the filter, hashable if its value is.
+        """
+        value = domain_filter.value
+        if isinstance(value, list | tuple):
+            # List values (IN / NOT_IN operators) are frozen item by item
+            value = tuple((type(item), item) for item in value)
+        return (
+            domain_filter.field,
+            domain_filter.operator,
+            type(domain_filter.value),
+            value,
+        )
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _build_cached_search_filters(cls, cache_key: _FiltersCacheKey) -> Filter:
+        """Builds and caches a Qdrant Filter from a hashable set of DomainFilter.
+
+        Args:
+            cache_key (_FiltersCacheKey): The filters to convert, with their
+                hashable key.
+
+        Returns:
+            Filter: A Qdrant Filter object constructed from the provided filters.
+        """
+        return cls._translate_search_filters(cache_key.filters)
+
+    @classmethod
+    def _translate_search_filters(cls, filters: Sequence[DomainFilter]) -> Filter:
+        """Translates a sequence of DomainFilter objects into a Qdrant Filter.
+
+        Args:
+            filters (Sequence[DomainFilter]): A sequence of
+                DomainFilter objects to convert.
+
+        Returns:
+            Filter: A Qdrant Filter object constructed from the provided filters.
+        """
         must_conditions = []
         must_not_conditions = []
 
         for f in filters:
             condition = cls._create_field_condition(f)
-            if f.operator in (
-                DomainFilterOperator.NOT_EQUAL,
-                DomainFilterOperator.NOT_IN,
-            ):
+            if f.operator in _NEGATIVE_OPERATORS:
                 must_not_conditions.append(condition)
             else:
                 must_conditions.append(condition)
 
         return Filter(
-            must=must_conditions if must_conditions else None,
-            must_not=must_not_conditions if must_not_conditions else None,
+            must=must_conditions or None,
+            must_not=must_not_conditions or None,
         )
 
     @staticmethod
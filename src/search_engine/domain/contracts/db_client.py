@@ -15,6 +15,8 @@ class ClientWrapperContract(ABC, Generic[ClientType]):
         vector_distance: str,
         dense_vector_name: str,
         sparse_vector_name: str,
+        *,
+        quantize_dense: bool = False,
     ) -> None:
         """Checks if a collection exists in the database and creates it if not.
 
@@ -24,6 +26,8 @@ class ClientWrapperContract(ABC, Generic[ClientType]):
             vector_distance (str): The distance metric for the vectors.
             dense_vector_name (str): Name for dense vector.
             sparse_vector_name (str): Name for sparse vector.
+            quantize_dense (bool): Whether to search the dense vectors through
+                an int8 quantized copy, at a small cost in precision.
 
         Raises:
             CollectionCreationError: If there is an error
@@ -28,11 +28,17 @@ class RepositoryContract(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get_entity(self, identifier: Identifier) -> Entity | None:
+    def get_entity(
+        self,
+        identifier: Identifier,
+        *,
+        include_vectors: bool = False,
+    ) -> Entity | None:
         """Retrieves an entity by its identifier.
 
         Args:
             identifier (Identifier): The UUID of the entity.
+            include_vectors (bool): Whether to retrieve the vectors of the entity.
 
         Returns:
             Entity | None: The found entity or None if not found.
@@ -45,7 +51,8 @@ class RepositoryContract(ABC):
 
         Args:
             model (UpdateEntityModel): UpdateEntityModel with `id`,
-                `competency`, and `vector`.
+                `competency`, and `vector`. If the vectors are None,
+                only the competency is updated and the stored vectors are kept.
 
         Returns:
             Entity: The updated entity.
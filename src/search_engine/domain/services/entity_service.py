@@ -77,11 +77,17 @@ class EntityService:
         )
         return self.repository.create_entity(model=model)
 
-    def get_entity(self, identifier: Identifier) -> Entity:
+    def get_entity(
+        self,
+        identifier: Identifier,
+        *,
+        include_vectors: bool = False,
+    ) -> Entity:
         """Retrieves an entity by its identifier.
 
         Args:
             identifier (Identifier): The identifier of the entity to retrieve.
+            include_vectors (bool): Whether to retrieve the vectors of the entity.
 
         Raises:
             EntityNotFoundError: If the entity with the given identifier does not exist.
@@ -89,7 +95,10 @@ class EntityService:
         Returns:
             Entity: The retrieved entity.
         """
-        entity = self.repository.get_entity(identifier=identifier)
+        entity = self.repository.get_entity(
+            identifier=identifier,
+            include_vectors=include_vectors,
+        )
         if entity is None:
             raise EntityNotFoundError(f"Entity {identifier} not found")
         return entity
@@ -115,13 +124,14 @@ class EntityService:
         Returns:
             Entity: The updated entity.
         """
-        entity = self.get_entity(identifier=identifier)
+        # Only the payload is needed to check the existing indexed text
+        entity = self.get_entity(identifier=identifier, include_vectors=False)
 
         # If no text is provided or if it is the same as the existing one,
-        # use the existing vector.
+        # keep the stored vectors.
         if text is None or entity.competency.indexed_text == text:
-            dense_vector = entity.dense_vector
-            sparse_vector = entity.sparse_vector
+            dense_vector = None
+            sparse_vector = None
         else:
             # Ensure the text is not empty
             text = text.strip()
@@ -149,7 +159,7 @@ class EntityService:
         Args:
             identifier (Identifier): The identifier of the entity to delete.
         """
-        self.get_entity(identifier=identifier)
+        self.get_entity(identifier=identifier, include_vectors=False)
 
         self.repository.delete_entity(identifier=identifier)
 
@@ -1,6 +1,6 @@
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
 from domain.types.enums import CompetencyType, Language, Provider
 
@@ -8,9 +8,6 @@ from domain.types.enums import CompetencyType, Language, Provider
 class Competency(BaseModel):
     """Competency model representing an item from a data source."""
 
-    # Pydantic configuration for the Competency model.
-    model_config = ConfigDict(use_enum_values=True)
-
     code: str = Field(
         ...,
         title="Source Code",
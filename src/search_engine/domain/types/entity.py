@@ -5,7 +5,7 @@ from domain.types.identifier import Identifier
 from domain.types.vectors import DenseVector, SparseVector
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """Entity in the search engine."""
 
@@ -16,7 +16,7 @@ class DomainFilterOperator(Enum):
     NOT_IN = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainFilter:
     """Representation of a filter condition in the domain."""
 
@@ -6,7 +6,7 @@ from domain.types.identifier import Identifier
 from domain.types.vectors import DenseVector, SparseVector
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Represents a search result."""
 
@@ -14,7 +14,7 @@ class SearchResult:
     score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateEntityModel:
     """Model for creating an entity."""
 
@@ -23,11 +23,14 @@ class CreateEntityModel:
     sparse_vector: SparseVector
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateEntityModel:
-    """Model for updating an entity."""
+    """Model for updating an entity.
+
+    Vectors left to None keep the ones already stored for the entity.
+    """
 
     identifier: Identifier
     competency: Competency
-    dense_vector: DenseVector
-    sparse_vector: SparseVector
+    dense_vector: DenseVector | None = None
+    sparse_vector: SparseVector | None = None
@@ -2,14 +2,14 @@ from dataclasses import dataclass
 from enum import StrEnum
 
 
-@dataclass
+@dataclass(slots=True)
 class DenseVector:
     """Dataclass representing a dense vector."""
 
     values: list[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class SparseVector:
     """Dataclass representing a sparse vector with indices and values."""
 
@@ -56,9 +56,11 @@ def mock_config(mocker: MockerFixture) -> ConfigContract:
     config = mocker.Mock(spec=ConfigContract)
     config.get_db_url.return_value = "http://localhost:6333"
     config.get_db_api_key.return_value = "test_api_key"
+    config.get_db_prefer_grpc.return_value = False
     config.get_db_collection.return_value = "test_collection"
     config.get_db_vector_distance.return_value = "Cosine"
     config.get_db_vector_dimensions.return_value = 5
+    config.get_db_quantize_dense.return_value = False
     config.get_dense_vector_name.return_value = "dense"
     config.get_sparse_vector_name.return_value = "sparse"
     return config
@@ -70,9 +72,8 @@ def sample_identifier() -> Identifier:
     return uuid4()
 
 
-@pytest.fixture
-def sample_competency() -> Competency:
-    """Sample competency fixture."""
+def _build_sample_competency() -> Competency:
+    """Build the competency shared by the sample fixtures."""
     return Competency(
         code="code",
         lang="fr",
@@ -88,6 +89,18 @@ def sample_competency() -> Competency:
     )
 
 
+@pytest.fixture
+def sample_competency() -> Competency:
+    """Sample competency fixture."""
+    return _build_sample_competency()
+
+
+@pytest.fixture(scope="module")
+def sample_competency_dump() -> dict[str, object]:
+    """Sample competency dumped once per module, copy it before mutating."""
+    return _build_sample_competency().model_dump()
+
+
 @pytest.fixture
 def sample_dense_vector() -> DenseVector:
     """Sample dense vector fixture."""
@@ -62,31 +62,26 @@ class TestAPIDependencies:
         request.state.sparse_model = mock_sparse_model
         return request
 
-    @pytest.mark.asyncio
     async def test_get_config(self, mock_request: Request) -> None:
         """Test get_config dependency."""
         result = await get_config(mock_request)
         assert result == mock_request.state.config
 
-    @pytest.mark.asyncio
     async def test_get_logger(self, mock_request: Request) -> None:
         """Test get_logger dependency."""
         result = await get_logger(mock_request)
         assert result == mock_request.state.logger
 
-    @pytest.mark.asyncio
     async def test_get_embedding_model(self, mock_request: Request) -> None:
         """Test get_embedding_model dependency."""
         result = await get_embedding_model(mock_request)
         assert result == mock_request.state.model
 
-    @pytest.mark.asyncio
     async def test_get_sparse_embedding_model(self, mock_request: Request) -> None:
         """Test get_sparse_embedding_model dependency."""
         result = await get_sparse_embedding_model(mock_request)
         assert result == mock_request.state.sparse_model
 
-    @pytest.mark.asyncio
     async def test_get_db_client(
         self,
         mock_config: ConfigContract,
@@ -108,9 +103,9 @@ class TestAPIDependencies:
             url="http://localhost:6333",
             api_key="test_api_key",
             logger=mock_logger,
+            prefer_grpc=False,
         )
 
-    @pytest.mark.asyncio
     async def test_get_repository(
         self,
         mock_client: ClientWrapperContract,
@@ -136,7 +131,6 @@ class TestAPIDependencies:
             sparse_vector_name="sparse",
         )
 
-    @pytest.mark.asyncio
     async def test_get_dense_embedding_service(
         self,
         mock_embedding_model: SentenceTransformer,
@@ -158,7 +152,6 @@ class TestAPIDependencies:
             model=mock_embedding_model,
         )
 
-    @pytest.mark.asyncio
     async def test_get_sparse_embedding_service(
         self,
         mock_sparse_model: SparseEncoder,
@@ -180,7 +173,6 @@ class TestAPIDependencies:
             model=mock_sparse_model,
         )
 
-    @pytest.mark.asyncio
     async def test_get_entity_service(
         self,
         mock_repository: RepositoryContract,
@@ -209,7 +201,6 @@ class TestAPIDependencies:
             sparse_embedding_service=sparse_service,
         )
 
-    @pytest.mark.asyncio
     async def test_dependencies_chain_integration(
         self,
         mock_config: ConfigContract,
@@ -3,10 +3,9 @@
 import pytest
 from fastapi import FastAPI, status
 from fastapi.requests import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from logger import LoggerContract
 from pytest_mock import MockerFixture
-from starlette.datastructures import State
 
 from adapters.api.exception_handler import ExceptionHandler
 from adapters.exceptions import (
@@ -26,20 +25,35 @@ from domain.exceptions import (
     ValidationError,
 )
 
+_ERROR_MAPPING_CASES = [
+    (ValidationError, status.HTTP_400_BAD_REQUEST),
+    (EntityNotFoundError, status.HTTP_404_NOT_FOUND),
+    (EmbeddingError, status.HTTP_500_INTERNAL_SERVER_ERROR),
+    (EncodingError, status.HTTP_500_INTERNAL_SERVER_ERROR),
+    (ModelLoadingError, status.HTTP_500_INTERNAL_SERVER_ERROR),
+    (DBConnectionError, status.HTTP_500_INTERNAL_SERVER_ERROR),
+    (CollectionCreationError, status.HTTP_500_INTERNAL_SERVER_ERROR),
+    (RepositoryError, status.HTTP_500_INTERNAL_SERVER_ERROR),
+    (EmbeddingAdapterError, status.HTTP_500_INTERNAL_SERVER_ERROR),
+    (DBAdapterError, status.HTTP_500_INTERNAL_SERVER_ERROR),
+    (AdapterError, status.HTTP_500_INTERNAL_SERVER_ERROR),
+    (DomainError, status.HTTP_500_INTERNAL_SERVER_ERROR),
+]
+
 
 class TestExceptionHandler:
     """Test class for ExceptionHandler."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def handler(self) -> ExceptionHandler:
-        """Create ExceptionHandler instance."""
+        """Create ExceptionHandler instance, shared by the module."""
         return ExceptionHandler()
 
     @pytest.fixture
     def mock_request(self, mocker: MockerFixture) -> Request:
         """Create mock request with logger."""
-        request = mocker.Mock(spec=Request)
-        request.state = mocker.Mock(spec=State)
+        # Only `request.state.logger` is used, no need for spec introspection
+        request = mocker.Mock()
         request.state.logger = mocker.Mock(spec=LoggerContract)
         return request
 
@@ -86,27 +100,25 @@ class TestExceptionHandler:
         expected_calls = len(handler.error_mapping) + 1  # +1 for global handler
         assert mock_app.add_exception_handler.call_count == expected_calls
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("error_class", "status_code"), _ERROR_MAPPING_CASES)
     async def test_known_exception_handler_error(
         self,
         handler: ExceptionHandler,
         mock_request: Request,
+        error_class: type[Exception],
+        status_code: int,
     ) -> None:
-        """Test handling ValidationError."""
-        for error_class, status_code in handler.error_mapping.items():
-            exc = error_class("Invalid input")
-
-            response = await handler.known_exception_handler(mock_request, exc)
-
-            assert isinstance(response, JSONResponse)
-            assert response.status_code == status_code
-            assert response.body == b'{"detail":"Invalid input"}'
-
-        assert mock_request.state.logger.exception.call_count == len(
-            handler.error_mapping.keys(),
+        """Test handling known exceptions."""
+        response = await handler.known_exception_handler(
+            mock_request,
+            error_class("Invalid input"),
         )
 
-    @pytest.mark.asyncio
+        assert isinstance(response, JSONResponse)
+        assert response.status_code == status_code
+        assert response.body == b'{"detail":"Invalid input"}'
+        mock_request.state.logger.exception.assert_called_once()
+
     async def test_known_exception_handler_unknown_exception(
         self,
         handler: ExceptionHandler,
@@ -127,7 +139,6 @@ class TestExceptionHandler:
         assert response.body == b'{"detail":"Unknown error"}'
         mock_request.state.logger.exception.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_global_exception_handler(
         self,
         handler: ExceptionHandler,
@@ -138,7 +149,7 @@ class TestExceptionHandler:
 
         response = await handler.global_exception_handler(mock_request, exc)
 
-        assert isinstance(response, JSONResponse)
+        assert isinstance(response, Response)
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert response.body == b'{"detail":"An error occurred."}'
         mock_request.state.logger.exception.assert_called_once_with(
@@ -147,7 +158,6 @@ class TestExceptionHandler:
             {},
         )
 
-    @pytest.mark.asyncio
     async def test_global_exception_handler_various_exceptions(
         self,
         handler: ExceptionHandler,
@@ -165,8 +175,9 @@ class TestExceptionHandler:
         for exc in exceptions:
             response = await handler.global_exception_handler(mock_request, exc)
 
-            assert isinstance(response, JSONResponse)
+            assert isinstance(response, Response)
             assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
             assert response.body == b'{"detail":"An error occurred."}'
+            assert response.media_type == "application/json"
 
         assert mock_request.state.logger.exception.call_count == len(exceptions)
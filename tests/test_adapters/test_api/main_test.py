@@ -1,12 +1,16 @@
 """Test module for main API application."""
 
+from collections.abc import Generator
+from unittest.mock import Mock
+
 import pytest
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from logger import LoggerContract
 from pytest_mock import MockerFixture
 from sentence_transformers import SentenceTransformer, SparseEncoder
 
-from adapters.api.main import config, lifespan
+from adapters.api.main import app, config, lifespan
 from adapters.infrastructure.config.contract import ConfigContract
 from domain.contracts.db_client import ClientWrapperContract
 
@@ -14,37 +18,72 @@ from domain.contracts.db_client import ClientWrapperContract
 class TestLifespan:
     """Test suite for lifespan context manager."""
 
-    @pytest.mark.asyncio
-    async def test_lifespan_initializes_correctly(self, mocker: MockerFixture) -> None:
+    @pytest.fixture(scope="module")
+    def lifespan_mocks(self, module_mocker: MockerFixture) -> dict[str, Mock]:
+        """Patch the lifespan dependencies once for the whole module."""
+        mock_logger = module_mocker.Mock(spec=LoggerContract)
+        mock_model = module_mocker.Mock(spec=SentenceTransformer)
+        mock_sparse_model = module_mocker.Mock(spec=SparseEncoder)
+        mock_client = module_mocker.Mock(spec=ClientWrapperContract)
+        mock_client.create_db_collection_if_not_exists.return_value = None
+
+        return {
+            "logger": mock_logger,
+            "logger_class": module_mocker.patch(
+                "adapters.api.main.LoguruLogger",
+                return_value=mock_logger,
+            ),
+            "model": mock_model,
+            "load_model": module_mocker.patch(
+                "adapters.api.main.HuggingfaceEmbeddingService.load_sentence_embeddings_model",
+                return_value=mock_model,
+            ),
+            "sparse_model": mock_sparse_model,
+            "load_sparse": module_mocker.patch(
+                "adapters.api.main.HuggingfaceSparseEmbeddingService.load_sparse_encoding_model",
+                return_value=mock_sparse_model,
+            ),
+            "dense_encode": module_mocker.patch(
+                "adapters.api.main.HuggingfaceEmbeddingService.encode",
+            ),
+            "sparse_encode": module_mocker.patch(
+                "adapters.api.main.HuggingfaceSparseEmbeddingService.encode",
+            ),
+            "client": mock_client,
+            "get_client": module_mocker.patch(
+                "adapters.api.main.get_db_client",
+                new_callable=module_mocker.AsyncMock,
+                return_value=mock_client,
+            ),
+        }
+
+    @pytest.fixture(autouse=True)
+    def reset_lifespan_mocks(
+        self,
+        lifespan_mocks: dict[str, Mock],
+    ) -> Generator[None]:
+        """Reset the shared mocks call history after each test."""
+        yield
+        for mock in lifespan_mocks.values():
+            mock.reset_mock()
+
+    async def test_lifespan_initializes_correctly(
+        self,
+        lifespan_mocks: dict[str, Mock],
+    ) -> None:
         """Test that lifespan correctly initializes configuration and logger."""
         test_app = FastAPI()
 
-        # Setup mocks
-        mock_logger = mocker.Mock(spec=LoggerContract)
-        mock_logger_class = mocker.patch(
-            "adapters.api.main.LoguruLogger",
-            return_value=mock_logger,
-        )
-
-        mock_model = mocker.Mock(spec=SentenceTransformer)
-        mock_load_model = mocker.patch(
-            "adapters.api.main.HuggingfaceEmbeddingService.load_sentence_embeddings_model",
-            return_value=mock_model,
-        )
-
-        mock_sparse_model = mocker.Mock(spec=SparseEncoder)
-        mock_load_sparse = mocker.patch(
-            "adapters.api.main.HuggingfaceSparseEmbeddingService.load_sparse_encoding_model",
-            return_value=mock_sparse_model,
-        )
-
-        mock_client = mocker.Mock(spec=ClientWrapperContract)
-        mock_client.create_db_collection_if_not_exists.return_value = None
-        mock_get_client = mocker.patch(
-            "adapters.api.main.get_db_client",
-            new_callable=mocker.AsyncMock,
-            return_value=mock_client,
-        )
+        mock_logger = lifespan_mocks["logger"]
+        mock_logger_class = lifespan_mocks["logger_class"]
+        mock_model = lifespan_mocks["model"]
+        mock_load_model = lifespan_mocks["load_model"]
+        mock_sparse_model = lifespan_mocks["sparse_model"]
+        mock_load_sparse = lifespan_mocks["load_sparse"]
+        mock_dense_encode = lifespan_mocks["dense_encode"]
+        mock_sparse_encode = lifespan_mocks["sparse_encode"]
+        mock_client = lifespan_mocks["client"]
+        mock_get_client = lifespan_mocks["get_client"]
 
         async with lifespan(test_app) as state:
             # Verify state contains expected keys
@@ -75,6 +114,7 @@ class TestLifespan:
             # Verify debug logging
             mock_logger.debug.assert_any_call("Loading embedding model")
             mock_logger.debug.assert_any_call("Loading sparse embedding model")
+            mock_logger.debug.assert_any_call("Warming up embedding models")
             mock_logger.debug.assert_any_call(
                 "Creating DB collection if it does not exist yet",
             )
@@ -87,6 +127,10 @@ class TestLifespan:
                 model_name=config.get_sparse_embedding_model_name(),
             )
 
+            # Verify models were warmed up
+            mock_dense_encode.assert_called_once_with("warmup")
+            mock_sparse_encode.assert_called_once_with("warmup")
+
             # Verify DB client operations
             mock_get_client.assert_called_once_with(
                 logger=mock_logger,
@@ -98,7 +142,16 @@ class TestLifespan:
                 vector_distance=config.get_db_vector_distance(),
                 dense_vector_name=config.get_dense_vector_name(),
                 sparse_vector_name=config.get_sparse_vector_name(),
+                quantize_dense=config.get_db_quantize_dense(),
             )
 
         # Verify shutdown logging
         mock_logger.info.assert_any_call("Application shutdown")
+
+
+class TestApp:
+    """Test suite for the FastAPI application configuration."""
+
+    def test_app_uses_orjson_responses(self) -> None:
+        """Test that responses are serialized with orjson by default."""
+        assert app.router.default_response_class is ORJSONResponse
@@ -1,17 +1,18 @@
 """Test module for entity API router."""
 
 from collections.abc import Callable, Generator
+from unittest.mock import create_autospec
 
 import pytest
 from fastapi import FastAPI
 from fastapi.requests import Request
 from fastapi.testclient import TestClient
 from logger import LoggerContract
-from pytest_mock import MockerFixture
 from starlette.responses import Response
 
 from adapters.api.dependencies import get_entity_service
-from adapters.api.entity.router import router
+from adapters.api.entity.router import get_entity, router, update_entity
+from adapters.api.entity.schemas import EntityResponse, UpdateEntityRequest
 from adapters.api.exception_handler import ExceptionHandler
 from domain.exceptions import EntityNotFoundError
 from domain.services.entity_service import EntityService
@@ -19,55 +20,61 @@ from domain.types.competency import Competency
 from domain.types.entity import Entity
 from domain.types.identifier import Identifier
 
+# Built once, as spec introspection dominates the mock construction cost,
+# and reset after each test by the `mock_entity_service` fixture.
+_MOCK_ENTITY_SERVICE = create_autospec(EntityService, instance=True)
+
 
 class TestEntityRouter:
     """Test class for entity router endpoints."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def app(self) -> FastAPI:
-        """Create FastAPI app with entity router."""
+        """Create FastAPI app with entity router, shared by the module."""
         app = FastAPI()
         app.include_router(router)
         # Configure exception handler
         exception_handler = ExceptionHandler()
         exception_handler.configure(app)
-        return app
 
-    @pytest.fixture
-    def client(self, app: FastAPI, mock_logger: LoggerContract) -> TestClient:
-        """Create test client."""
-
-        # Add mock logger to request state for exception handler
+        # Add the test mock logger to request state for exception handler
         @app.middleware("http")
         async def add_mock_logger(
             request: Request,
             call_next: Callable[[Request], Response],
         ) -> Response:
-            request.state.logger = mock_logger
+            request.state.logger = request.app.state.logger
             return await call_next(request)
 
-        return TestClient(app)
+        return app
+
+    @pytest.fixture(scope="module")
+    def client(self, app: FastAPI) -> Generator[TestClient]:
+        """Create test client, started once and shared by the module."""
+        with TestClient(app) as client:
+            yield client
+
+    @pytest.fixture(autouse=True)
+    def app_logger(self, app: FastAPI, mock_logger: LoggerContract) -> None:
+        """Provide a fresh mock logger to the shared app for each test."""
+        app.state.logger = mock_logger
 
     @pytest.fixture
-    def mock_entity_service(
-        self,
-        app: FastAPI,
-        mocker: MockerFixture,
-    ) -> Generator[EntityService]:
+    def mock_entity_service(self, app: FastAPI) -> Generator[EntityService]:
         """Mock entity service dependency."""
-        mock_service = mocker.Mock(spec=EntityService)
 
         # Create an async mock function to replace the dependency
         async def get_mock_service() -> EntityService:
-            return mock_service
+            return _MOCK_ENTITY_SERVICE
 
         # Override the dependency in the app
         app.dependency_overrides[get_entity_service] = get_mock_service
 
-        yield mock_service
+        yield _MOCK_ENTITY_SERVICE
 
         # Clean up after the test
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_entity_service, None)
+        _MOCK_ENTITY_SERVICE.reset_mock(return_value=True, side_effect=True)
 
     def test_create_entity_success(
         self,
@@ -86,11 +93,12 @@ class TestEntityRouter:
 
         assert response.status_code == 201
 
-        json_response = response.json()
+        # Presence checks only, no need to parse the body
+        body = response.content
 
-        assert "identifier" in json_response
-        assert "competency" in json_response
-        assert json_response["competency"]["title"] == sample_competency.title
+        assert b'"identifier"' in body
+        assert b'"competency"' in body
+        assert f'"title":"{sample_competency.title}"'.encode() in body
 
         mock_entity_service.create_entity.assert_called_once_with(
             competency=sample_competency,
@@ -110,9 +118,8 @@ class TestEntityRouter:
         assert response.status_code == 422
         mock_entity_service.create_entity.assert_not_called()
 
-    def test_get_entity_success(
+    async def test_get_entity_success(
         self,
-        client: TestClient,
         mock_entity_service: EntityService,
         sample_entity: Entity,
         sample_identifier: Identifier,
@@ -121,17 +128,14 @@ class TestEntityRouter:
         """Test successful entity retrieval."""
         mock_entity_service.get_entity.return_value = sample_entity
 
-        response = client.get(f"/entities/{sample_identifier}")
-
-        assert response.status_code == 200
-
-        json_response = response.json()
-
-        assert "identifier" in json_response
-        assert "competency" in json_response
+        response = await get_entity(
+            entity_id=sample_identifier,
+            service=mock_entity_service,
+        )
 
-        assert json_response["identifier"] == str(sample_identifier)
-        assert json_response["competency"]["title"] == sample_competency.title
+        assert isinstance(response, EntityResponse)
+        assert response.identifier == sample_identifier
+        assert response.competency.title == sample_competency.title
 
         mock_entity_service.get_entity.assert_called_once_with(
             identifier=sample_identifier,
@@ -169,60 +173,58 @@ class TestEntityRouter:
             identifier=sample_identifier,
         )
 
-    def test_update_entity_success(
+    async def test_update_entity_success(
         self,
-        client: TestClient,
         mock_entity_service: EntityService,
         sample_competency: Competency,
         sample_entity: Entity,
         sample_identifier: Identifier,
     ) -> None:
         """Test successful entity update."""
-        mocked_competency = sample_competency.model_copy()
-        mocked_competency.indexed_text = "Advanced Python Programming"
-        updated_competency = mocked_competency.model_dump()
+        updated_competency = sample_competency.model_copy(
+            update={"indexed_text": "Advanced Python Programming"},
+        )
 
         mock_entity_service.update_entity.return_value = sample_entity
 
-        response = client.put(
-            f"/entities/{sample_identifier!s}",
-            json={"competency": updated_competency},
+        response = await update_entity(
+            entity_id=sample_identifier,
+            req=UpdateEntityRequest(competency=updated_competency),
+            service=mock_entity_service,
         )
 
-        assert response.status_code == 200
-        assert "identifier" in response.json()
+        assert isinstance(response, EntityResponse)
+        assert response.identifier == sample_entity.identifier
 
         mock_entity_service.update_entity.assert_called_once_with(
             identifier=sample_identifier,
-            competency=mocked_competency,
-            text=updated_competency["indexed_text"],
+            competency=updated_competency,
+            text=updated_competency.indexed_text,
         )
 
-    def test_update_entity_without_indexed_text(
+    async def test_update_entity_without_indexed_text(
         self,
-        client: TestClient,
         mock_entity_service: EntityService,
         sample_identifier: Identifier,
         sample_competency: Competency,
         sample_entity: Entity,
     ) -> None:
         """Test entity update without indexed_text."""
-        mocked_competency = sample_competency.model_copy()
-        mocked_competency.indexed_text = None
-        competency_without_indexed_text = mocked_competency.model_dump()
+        competency_without_indexed_text = sample_competency.model_copy(
+            update={"indexed_text": None},
+        )
 
         mock_entity_service.update_entity.return_value = sample_entity
 
-        response = client.put(
-            f"/entities/{sample_identifier}",
-            json={"competency": competency_without_indexed_text},
+        await update_entity(
+            entity_id=sample_identifier,
+            req=UpdateEntityRequest(competency=competency_without_indexed_text),
+            service=mock_entity_service,
         )
 
-        assert response.status_code == 200
-
         mock_entity_service.update_entity.assert_called_once_with(
             identifier=sample_identifier,
-            competency=mocked_competency,
+            competency=competency_without_indexed_text,
             text=None,
         )
 
@@ -230,7 +232,7 @@ class TestEntityRouter:
         self,
         client: TestClient,
         sample_identifier: Identifier,
-        sample_competency: Competency,
+        sample_competency_dump: dict[str, object],
         mock_entity_service: EntityService,
     ) -> None:
         """Test entity update with invalid request."""
@@ -245,7 +247,7 @@ class TestEntityRouter:
         invalid_identifier = "invalid-uuid"
         response = client.put(
             f"/entities/{invalid_identifier}",
-            json={"competency": sample_competency.model_dump()},
+            json={"competency": sample_competency_dump},
         )
 
         assert response.status_code == 422
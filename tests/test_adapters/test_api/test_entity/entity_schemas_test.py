@@ -12,34 +12,28 @@ from domain.types.competency import Competency
 from domain.types.identifier import Identifier
 
 
-class TestCreateEntityRequest:
-    """Test class for CreateEntityRequest."""
+class TestEntityRequest:
+    """Test class for CreateEntityRequest and UpdateEntityRequest."""
 
-    def test_create_entity_request_valid(self, sample_competency: Competency) -> None:
-        """Test valid CreateEntityRequest creation."""
-        request = CreateEntityRequest(competency=sample_competency)
-
-        assert request.competency == sample_competency
-
-    def test_create_entity_request_missing_competency(self) -> None:
-        """Test CreateEntityRequest with missing competency."""
-        with pytest.raises(ValidationError):
-            CreateEntityRequest()
-
-
-class TestUpdateEntityRequest:
-    """Test class for UpdateEntityRequest."""
-
-    def test_update_entity_request_valid(self, sample_competency: Competency) -> None:
-        """Test valid UpdateEntityRequest creation."""
-        request = UpdateEntityRequest(competency=sample_competency)
+    @pytest.mark.parametrize("model_cls", [CreateEntityRequest, UpdateEntityRequest])
+    def test_entity_request_valid(
+        self,
+        model_cls: type[CreateEntityRequest | UpdateEntityRequest],
+        sample_competency: Competency,
+    ) -> None:
+        """Test valid entity request creation."""
+        request = model_cls(competency=sample_competency)
 
-        assert request.competency == sample_competency
+        assert request.competency is sample_competency
 
-    def test_update_entity_request_missing_competency(self) -> None:
-        """Test UpdateEntityRequest with missing competency."""
+    @pytest.mark.parametrize("model_cls", [CreateEntityRequest, UpdateEntityRequest])
+    def test_entity_request_missing_competency(
+        self,
+        model_cls: type[CreateEntityRequest | UpdateEntityRequest],
+    ) -> None:
+        """Test entity request with missing competency."""
         with pytest.raises(ValidationError):
-            UpdateEntityRequest()
+            model_cls()
 
 
 class TestEntityResponse:
@@ -57,7 +51,7 @@ class TestEntityResponse:
         )
 
         assert response.identifier == sample_identifier
-        assert response.competency == sample_competency
+        assert response.competency is sample_competency
 
     def test_entity_response_missing_fields(
         self,
@@ -1,12 +1,12 @@
 """Test module for search API router."""
 
-from collections.abc import Callable, Generator
+from collections.abc import AsyncGenerator, Callable, Generator
 
 import pytest
 from fastapi import FastAPI
 from fastapi.requests import Request
-from fastapi.responses import Response
-from fastapi.testclient import TestClient
+from fastapi.responses import ORJSONResponse, Response
+from httpx import ASGITransport, AsyncClient
 from logger import LoggerContract
 from pytest_mock import MockerFixture
 
@@ -18,34 +18,96 @@ from domain.types.entity import Entity
 from domain.types.search_type import SearchType as DomainSearchType
 from domain.types.service_models import SearchResult
 
+# Valid payload shared by the tests, override fields with a dict spread
+_BASE_SEARCH_REQUEST = {
+    "text": "programming skills",
+    "filters": [],
+    "top": 10,
+    "search_type": "semantic",
+}
+
+# One character over the SearchRequest.text max_length of 10000
+_OVERSIZE_TEXT = "a" * 10001
+
+_INVALID_SEARCH_REQUESTS = [
+    pytest.param({"invalid_field": "value"}, id="invalid-structure"),
+    pytest.param(
+        {
+            "text": "programming skills",
+            "filters": [
+                {
+                    "field": "competency.type",
+                    # Missing 'operator' and 'value'
+                },
+            ],
+        },
+        id="missing-filter-fields",
+    ),
+    pytest.param(
+        {
+            "text": "programming skills",
+            "filters": {
+                "field": "competency.type",
+                "operator": "eq",
+                "value": "TECHNICAL",
+            },  # Should be a list
+        },
+        id="filters-not-a-list",
+    ),
+    pytest.param(
+        {**_BASE_SEARCH_REQUEST, "top": 0},  # Should be >= 1
+        id="top-too-low",
+    ),
+    pytest.param(
+        {**_BASE_SEARCH_REQUEST, "top": 101},  # Should be <= 100
+        id="top-too-high",
+    ),
+    pytest.param({"text": ""}, id="empty-text"),  # min_length=1
+    pytest.param({"text": _OVERSIZE_TEXT}, id="text-too-long"),
+    pytest.param(
+        {**_BASE_SEARCH_REQUEST, "search_type": "INVALID_TYPE"},
+        id="invalid-search-type",
+    ),
+]
+
 
 class TestSearchRouter:
     """Test class for search router endpoints."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def app(self) -> FastAPI:
-        """Create FastAPI app with search router."""
-        app = FastAPI()
+        """Create FastAPI app with search router, shared by the module."""
+        # Mirror the production app serialization path
+        app = FastAPI(default_response_class=ORJSONResponse)
         app.include_router(router)
         # Configure exception handler
         exception_handler = ExceptionHandler()
         exception_handler.configure(app)
-        return app
-
-    @pytest.fixture
-    def client(self, app: FastAPI, mock_logger: LoggerContract) -> TestClient:
-        """Create test client."""
 
-        # Add mock logger to request state for exception handler
+        # Add the test mock logger to request state for exception handler
         @app.middleware("http")
         async def add_mock_logger(
             request: Request,
             call_next: Callable[[Request], Response],
         ) -> Response:
-            request.state.logger = mock_logger
+            request.state.logger = request.app.state.logger
             return await call_next(request)
 
-        return TestClient(app)
+        return app
+
+    @pytest.fixture
+    async def client(self, app: FastAPI) -> AsyncGenerator[AsyncClient]:
+        """Create an async client calling the ASGI app in the test event loop."""
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+        ) as client:
+            yield client
+
+    @pytest.fixture(autouse=True)
+    def app_logger(self, app: FastAPI, mock_logger: LoggerContract) -> None:
+        """Provide a fresh mock logger to the shared app for each test."""
+        app.state.logger = mock_logger
 
     @pytest.fixture
     def mock_entity_service(
@@ -66,7 +128,7 @@ class TestSearchRouter:
         yield mock_service
 
         # Clean up after the test
-        app.dependency_overrides.clear()
+        app.dependency_overrides.pop(get_entity_service, None)
 
     @pytest.fixture
     def sample_search_results(self, sample_entity: Entity) -> list[SearchResult]:
@@ -76,101 +138,37 @@ class TestSearchRouter:
             SearchResult(entity=sample_entity, score=0.87),
         ]
 
-    def test_search_with_semantic_type(
-        self,
-        client: TestClient,
-        mock_entity_service: EntityService,
-        sample_search_results: list[SearchResult],
-    ) -> None:
-        """Test search with semantic search type."""
-        mock_entity_service.search_by_text_and_filters_with_type.return_value = (
-            sample_search_results
-        )
-
-        search_request = {
-            "text": "programming skills",
-            "search_type": "semantic",
-            "top": 10,
-            "filters": [],
-        }
-
-        response = client.post("/search/text", json=search_request)
-
-        assert response.status_code == 200
-        response_data = response.json()
-        assert "results" in response_data
-        assert len(response_data["results"]) == len(sample_search_results)
-        assert response_data["results"][0]["score"] == sample_search_results[0].score
-        assert (
-            response_data["results"][0]["competency"]["title"]
-            == sample_search_results[0].entity.competency.title
-        )
-
-        # Verify service was called with correct parameters
-        mock_entity_service.search_by_text_and_filters_with_type.assert_called_once_with(
-            text="programming skills",
-            filters=[],
-            top=10,
-            search_type=DomainSearchType.SEMANTIC,
-        )
-
-    def test_search_with_sparse_type(
+    @pytest.fixture(autouse=True)
+    def prime_search_results(
         self,
-        client: TestClient,
         mock_entity_service: EntityService,
         sample_search_results: list[SearchResult],
     ) -> None:
-        """Test search with sparse search type."""
+        """Make the mocked search return the sample results unless overridden."""
         mock_entity_service.search_by_text_and_filters_with_type.return_value = (
             sample_search_results
         )
 
-        search_request = {
-            "text": "programming skills",
-            "search_type": "sparse",
-            "top": 5,
-            "filters": [],
-        }
-
-        response = client.post("/search/text", json=search_request)
-
-        assert response.status_code == 200
-        response_data = response.json()
-        assert "results" in response_data
-        assert len(response_data["results"]) == len(sample_search_results)
-        assert response_data["results"][0]["score"] == sample_search_results[0].score
-        assert (
-            response_data["results"][0]["competency"]["title"]
-            == sample_search_results[0].entity.competency.title
-        )
-
-        # Verify service was called with correct parameters
-        mock_entity_service.search_by_text_and_filters_with_type.assert_called_once_with(
-            text="programming skills",
-            filters=[],
-            top=5,
-            search_type=DomainSearchType.SPARSE,
-        )
-
-    def test_search_with_hybrid_type(
+    @pytest.mark.parametrize(
+        ("api_type", "domain_type"),
+        [
+            ("semantic", DomainSearchType.SEMANTIC),
+            ("sparse", DomainSearchType.SPARSE),
+            ("hybrid", DomainSearchType.HYBRID),
+        ],
+    )
+    async def test_search_with_type(
         self,
-        client: TestClient,
+        client: AsyncClient,
         mock_entity_service: EntityService,
         sample_search_results: list[SearchResult],
+        api_type: str,
+        domain_type: DomainSearchType,
     ) -> None:
-        """Test search with hybrid search type."""
-        mock_entity_service.search_by_text_and_filters_with_type.return_value = (
-            sample_search_results
-        )
-
-        search_request = {
-            "text": "programming skills",
-            "search_type": "hybrid",
-            "top": 5,
-            "filters": [],
-        }
+        """Test search with each search type."""
+        search_request = {**_BASE_SEARCH_REQUEST, "search_type": api_type, "top": 5}
 
-        response = client.post("/search/text", json=search_request)
+        response = await client.post("/search/text", json=search_request)
 
         assert response.status_code == 200
         response_data = response.json()
@@ -187,22 +185,17 @@ class TestSearchRouter:
             text="programming skills",
             filters=[],
             top=5,
-            search_type=DomainSearchType.HYBRID,
+            search_type=domain_type,
         )
 
-    def test_search_with_filters(
+    async def test_search_with_filters(
         self,
-        client: TestClient,
+        client: AsyncClient,
         mock_entity_service: EntityService,
-        sample_search_results: list[SearchResult],
     ) -> None:
         """Test search with filters."""
-        mock_entity_service.search_by_text_and_filters_with_type.return_value = (
-            sample_search_results
-        )
-
         search_request = {
-            "text": "programming skills",
+            **_BASE_SEARCH_REQUEST,
             "filters": [
                 {
                     "field": "competency.type",
@@ -217,7 +210,7 @@ class TestSearchRouter:
             ],
         }
 
-        response = client.post("/search/text", json=search_request)
+        response = await client.post("/search/text", json=search_request)
 
         assert response.status_code == 200
 
@@ -227,110 +220,36 @@ class TestSearchRouter:
         filters = call_args[1]["filters"]
         assert len(filters) == 2
 
-    def test_search_empty_results(
+    async def test_search_empty_results(
         self,
-        client: TestClient,
+        client: AsyncClient,
         mock_entity_service: EntityService,
     ) -> None:
         """Test search that returns no results."""
         mock_entity_service.search_by_text_and_filters_with_type.return_value = []
 
-        search_request = {
-            "text": "programming skills",
-        }
-
-        response = client.post("/search/text", json=search_request)
+        response = await client.post("/search/text", json=_BASE_SEARCH_REQUEST)
 
         assert response.status_code == 200
         response_data = response.json()
         assert response_data["results"] == []
 
-    def test_search_invalid_request(
+    @pytest.mark.parametrize("payload", _INVALID_SEARCH_REQUESTS)
+    async def test_search_invalid_request(
         self,
-        client: TestClient,
+        client: AsyncClient,
         mock_entity_service: EntityService,
+        payload: dict[str, object],
     ) -> None:
         """Test search with invalid request."""
-        # Test with completely invalid structure
-        invalid_request = {"invalid_field": "value"}
-
-        response = client.post("/search/text", json=invalid_request)
-
-        assert response.status_code == 422
-        mock_entity_service.search_by_text_and_filters_with_type.assert_not_called()
-
-        # Test with invalid filter structure
-        invalid_filter_request = {
-            "text": "programming skills",
-            "filters": [
-                {
-                    "field": "competency.type",
-                    # Missing 'operator' and 'value'
-                },
-            ],
-        }
-        response = client.post("/search/text", json=invalid_filter_request)
-        assert response.status_code == 422
-        mock_entity_service.search_by_text_and_filters_with_type.assert_not_called()
+        response = await client.post("/search/text", json=payload)
 
-        # Test with invalid filter structure (not a list)
-        invalid_filter_request_type = {
-            "text": "programming skills",
-            "filters": {
-                "field": "competency.type",
-                "operator": "eq",
-                "value": "TECHNICAL",
-            },  # Should be a list
-        }
-        response = client.post("/search/text", json=invalid_filter_request_type)
-        assert response.status_code == 422
-        mock_entity_service.search_by_text_and_filters_with_type.assert_not_called()
-
-        # Test with invalid top value
-        invalid_top_request = {
-            "text": "programming skills",
-            "top": 0,  # Invalid, should be >= 1
-        }
-        response = client.post("/search/text", json=invalid_top_request)
         assert response.status_code == 422
         mock_entity_service.search_by_text_and_filters_with_type.assert_not_called()
 
-        # Test with invalid top value (too high)
-        invalid_top_request_high = {
-            "text": "programming skills",
-            "top": 101,  # Invalid, should be <= 100
-        }
-        response = client.post("/search/text", json=invalid_top_request_high)
-        assert response.status_code == 422
-        mock_entity_service.search_by_text_and_filters_with_type.assert_not_called()
-
-        # Test with empty text
-        empty_text_request = {
-            "text": "",  # Invalid, min_length=1
-        }
-        response = client.post("/search/text", json=empty_text_request)
-        assert response.status_code == 422
-        mock_entity_service.search_by_text_and_filters_with_type.assert_not_called()
-
-        # Test with too long text
-        too_long_text_request = {
-            "text": "a" * 10001,  # Invalid, max_length=10000
-        }
-        response = client.post("/search/text", json=too_long_text_request)
-        assert response.status_code == 422
-        mock_entity_service.search_by_text_and_filters_with_type.assert_not_called()
-
-        # Test with invalid search type
-        invalid_request = {"text": "programming skills", "search_type": "INVALID_TYPE"}
-
-        response = client.post("/search/text", json=invalid_request)
-
-        assert response.status_code == 422
-        mock_entity_service.search_by_text_and_filters_with_type.assert_not_called()
-
-    def test_search_missing_required_fields(
+    async def test_search_missing_required_fields(
         self,
-        client: TestClient,
+        client: AsyncClient,
         mock_entity_service: EntityService,
     ) -> None:
         """Test search with missing required fields."""
@@ -339,25 +258,20 @@ class TestSearchRouter:
             # Missing 'text' field
         }
 
-        response = client.post("/search/text", json=incomplete_request)
+        response = await client.post("/search/text", json=incomplete_request)
 
         assert response.status_code == 422
         mock_entity_service.search_by_text_and_filters_with_type.assert_not_called()
 
-    def test_search_default_values(
+    async def test_search_default_values(
         self,
-        client: TestClient,
+        client: AsyncClient,
         mock_entity_service: EntityService,
-        sample_search_results: list[SearchResult],
     ) -> None:
         """Test search with minimal request using default values."""
-        mock_entity_service.search_by_text_and_filters_with_type.return_value = (
-            sample_search_results
-        )
-
         minimal_request = {"text": "programming skills"}
 
-        response = client.post("/search/text", json=minimal_request)
+        response = await client.post("/search/text", json=minimal_request)
 
         assert response.status_code == 200
 
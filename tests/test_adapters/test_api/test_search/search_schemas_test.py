@@ -1,7 +1,9 @@
 """Test module for search API schemas."""
 
+from collections.abc import Callable
+
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from adapters.api.search.schemas import (
     APIFilter,
@@ -14,6 +16,79 @@ from adapters.api.search.schemas import (
 from domain.types.competency import Competency
 from domain.types.identifier import Identifier
 
+_IDENTIFIER = "00000000-0000-0000-0000-000000000001"
+_COMPETENCY = Competency(
+    code="code",
+    lang="fr",
+    type="skill",
+    provider="esco",
+    title="Title / Label",
+)
+
+# (model factory, expected subset of its model_dump())
+_SERIALIZATION_CASES = [
+    pytest.param(
+        lambda: APIFilter(
+            field="category",
+            operator=APIFilterOperator.IN,
+            value=["tech", "science"],
+        ),
+        {"field": "category", "operator": "in", "value": ["tech", "science"]},
+        id="api-filter",
+    ),
+    pytest.param(
+        lambda: SearchRequest(
+            text="test query",
+            top=15,
+            search_type=SearchType.SPARSE,
+        ),
+        {"text": "test query", "top": 15, "search_type": "sparse"},
+        id="search-request",
+    ),
+    pytest.param(
+        lambda: SearchResultResponse(
+            identifier=_IDENTIFIER,
+            competency=_COMPETENCY,
+            score=0.85,
+        ),
+        {
+            "identifier": _IDENTIFIER,
+            "competency": _COMPETENCY.model_dump(),
+            "score": 0.85,
+        },
+        id="search-result-response",
+    ),
+    pytest.param(
+        lambda: SearchResponse(
+            results=[
+                SearchResultResponse(
+                    identifier=_IDENTIFIER,
+                    competency=_COMPETENCY,
+                    score=0.8,
+                ),
+            ],
+        ),
+        {
+            "results": [
+                {
+                    "identifier": _IDENTIFIER,
+                    "competency": _COMPETENCY.model_dump(),
+                    "score": 0.8,
+                },
+            ],
+        },
+        id="search-response",
+    ),
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_schemas() -> None:
+    """Validate one instance of each model so first-use costs are paid once."""
+    SearchRequest(text="x")
+    APIFilter(field="x", operator=APIFilterOperator.EQUAL, value="x")
+    SearchResponse(results=[])
+
 
 class TestAPIFilterOperator:
     """Test class for APIFilterOperator enum."""
@@ -81,19 +156,6 @@ class TestAPIFilter:
         with pytest.raises(ValidationError):
             APIFilter(field="category", operator="invalid_operator", value="technology")
 
-    def test_api_filter_serialization(self) -> None:
-        """Test APIFilter serialization."""
-        filter_obj = APIFilter(
-            field="category",
-            operator=APIFilterOperator.IN,
-            value=["tech", "science"],
-        )
-        data = filter_obj.model_dump()
-
-        assert data["field"] == "category"
-        assert data["operator"] == "in"
-        assert data["value"] == ["tech", "science"]
-
 
 class TestSearchRequest:
     """Test class for SearchRequest."""
@@ -147,19 +209,6 @@ class TestSearchRequest:
         with pytest.raises(ValidationError):
             SearchRequest(text="test", search_type="invalid_type")
 
-    def test_search_request_serialization(self) -> None:
-        """Test SearchRequest serialization."""
-        request = SearchRequest(
-            text="test query",
-            top=15,
-            search_type=SearchType.SPARSE,
-        )
-        data = request.model_dump()
-
-        assert data["text"] == "test query"
-        assert data["top"] == 15
-        assert data["search_type"] == "sparse"
-
 
 class TestSearchResultResponse:
     """Test class for SearchResultResponse."""
@@ -177,7 +226,7 @@ class TestSearchResultResponse:
         )
 
         assert response.identifier == str(sample_identifier)
-        assert response.competency == sample_competency
+        assert response.competency is sample_competency
         assert response.score == 0.95
 
     def test_search_result_response_missing_fields(
@@ -200,24 +249,6 @@ class TestSearchResultResponse:
         with pytest.raises(ValidationError):
             SearchResultResponse(competency=sample_competency, score=0.95)
 
-    def test_search_result_response_serialization(
-        self,
-        sample_identifier: Identifier,
-        sample_competency: Competency,
-    ) -> None:
-        """Test SearchResultResponse serialization."""
-        identifier = str(sample_identifier)
-        response = SearchResultResponse(
-            identifier=identifier,
-            competency=sample_competency,
-            score=0.85,
-        )
-        data = response.model_dump()
-
-        assert data["identifier"] == identifier
-        assert data["score"] == 0.85
-        assert "competency" in data
-
 
 class TestSearchResponse:
     """Test class for SearchResponse."""
@@ -243,24 +274,20 @@ class TestSearchResponse:
         response = SearchResponse(results=[result])
 
         assert len(response.results) == 1
-        assert response.results[0] == result
+        assert response.results[0] is result
+
+
+class TestSchemaSerialization:
+    """Test class for the search schemas serialization."""
 
-    def test_search_response_serialization(
+    @pytest.mark.parametrize(("factory", "expected"), _SERIALIZATION_CASES)
+    def test_model_dump(
         self,
-        sample_identifier: Identifier,
-        sample_competency: Competency,
+        factory: Callable[[], BaseModel],
+        expected: dict[str, object],
     ) -> None:
-        """Test SearchResponse serialization."""
-        result = SearchResultResponse(
-            identifier=str(sample_identifier),
-            competency=sample_competency,
-            score=0.8,
-        )
-
-        response = SearchResponse(results=[result])
-        data = response.model_dump()
+        """Test that model_dump outputs the expected field values."""
+        data = factory().model_dump()
 
-        assert "results" in data
-        assert len(data["results"]) == 1
-        assert data["results"][0]["score"] == 0.8
-        assert data["results"][0]["identifier"] == str(sample_identifier)
+        for key, value in expected.items():
+            assert data[key] == value
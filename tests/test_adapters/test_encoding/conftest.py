@@ -0,0 +1,16 @@
+"""This file contains pytest fixtures available to the encoding tests."""
+
+import pytest
+from torch import set_num_interop_threads, set_num_threads
+
+
+@pytest.fixture(scope="session", autouse=True)
+def single_threaded_torch() -> None:
+    """Run torch on a single thread for the encoding tests.
+
+    Tests only handle tiny tensors, so torch thread pools sized on the core
+    count would cost more in synchronization than they save. The application
+    keeps torch defaults, sized for real model inference.
+    """
+    set_num_threads(1)
+    set_num_interop_threads(1)
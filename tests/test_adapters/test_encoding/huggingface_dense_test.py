@@ -1,8 +1,14 @@
 """Test module for HuggingfaceEmbeddingService."""
 
+from collections.abc import Generator
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import Mock
+
 import pytest
 from logger import LoggerContract
 from numpy import array as np_array
+from numpy import float32 as np_float32
 from pytest_mock import MockerFixture
 from sentence_transformers import SentenceTransformer
 
@@ -11,16 +17,49 @@ from adapters.exceptions import EncodingError, ModelLoadingError
 from domain.types.vectors import DenseVector
 
 
+def _fast_logger() -> LoggerContract:
+    """Build a logger double without introspecting the LoggerContract spec."""
+    return cast(
+        "LoggerContract",
+        SimpleNamespace(
+            debug=Mock(),
+            info=Mock(),
+            warning=Mock(),
+            error=Mock(),
+            exception=Mock(),
+        ),
+    )
+
+
 class TestHuggingfaceEmbeddingService:
     """Test class for HuggingfaceEmbeddingService."""
 
     @pytest.fixture
-    def mock_sentence_transformer(self, mocker: MockerFixture) -> SentenceTransformer:
-        """Mock SentenceTransformer fixture."""
-        mock_model = mocker.Mock(spec=SentenceTransformer)
-        mock_model.encode.return_value = np_array([0.1, 0.2, 0.3, 0.4, 0.5])
+    def mock_logger(self) -> LoggerContract:
+        """Override the shared mock logger with a lightweight double."""
+        return _fast_logger()
+
+    @pytest.fixture(scope="module")
+    def mock_sentence_transformer(self) -> SentenceTransformer:
+        """Mock SentenceTransformer fixture, shared by the module."""
+        # A list spec avoids introspecting the torch-backed class
+        mock_model = Mock(spec=["encode"])
+        # SentenceTransformer returns float32 embeddings
+        mock_model.encode.return_value = np_array(
+            [0.1, 0.2, 0.3, 0.4, 0.5],
+            dtype=np_float32,
+        )
         return mock_model
 
+    @pytest.fixture(autouse=True)
+    def reset_mock_sentence_transformer(
+        self,
+        mock_sentence_transformer: SentenceTransformer,
+    ) -> Generator[None]:
+        """Clear calls and side effects left by a test on the shared model mock."""
+        yield
+        mock_sentence_transformer.reset_mock(side_effect=True)
+
     @pytest.fixture
     def service(
         self,
@@ -33,6 +72,11 @@ class TestHuggingfaceEmbeddingService:
             logger=mock_logger,
         )
 
+    @pytest.fixture
+    def patched_sentence_transformer(self, mocker: MockerFixture) -> Mock:
+        """Patch the SentenceTransformer class used by the model loader."""
+        return mocker.patch("adapters.encoding.huggingface_dense.SentenceTransformer")
+
     def test_initialization(
         self,
         mock_sentence_transformer: SentenceTransformer,
@@ -59,7 +103,8 @@ class TestHuggingfaceEmbeddingService:
         result = service.encode(text)
 
         assert isinstance(result, DenseVector)
-        assert result.values == [0.1, 0.2, 0.3, 0.4, 0.5]
+        assert result.values == pytest.approx([0.1, 0.2, 0.3, 0.4, 0.5])
+        assert all(type(value) is float for value in result.values)
 
         # Verify model was called correctly
         mock_sentence_transformer.encode.assert_called_once_with(
@@ -69,7 +114,14 @@ class TestHuggingfaceEmbeddingService:
         )
 
         # Verify logging
-        mock_logger.debug.assert_called()
+        mock_logger.debug.assert_any_call(
+            "Encoding text into vector",
+            context={"text_length": len(text)},
+        )
+        mock_logger.debug.assert_called_with(
+            "Text encoding completed",
+            context={"vector_dimensions": 5, "embedding_type": DenseVector},
+        )
 
     def test_encode_with_model_not_available(self, mock_logger: LoggerContract) -> None:
         """Test encoding when model is None."""
@@ -102,29 +154,24 @@ class TestHuggingfaceEmbeddingService:
     def test_load_dense_encoding_model_success(
         self,
         mocker: MockerFixture,
+        patched_sentence_transformer: Mock,
     ) -> None:
         """Test successful model loading."""
-        mock_sentence_transformer_class = mocker.patch(
-            "adapters.encoding.huggingface_dense.SentenceTransformer",
-        )
-        mock_model = mocker.Mock(spec=SentenceTransformer)
-        mock_sentence_transformer_class.return_value = mock_model
+        mock_model = mocker.Mock(spec=["encode"])
+        patched_sentence_transformer.return_value = mock_model
 
         model_name = "test-model"
         result = HuggingfaceEmbeddingService.load_sentence_embeddings_model(model_name)
 
         assert result == mock_model
-        mock_sentence_transformer_class.assert_called_once_with(model_name)
+        patched_sentence_transformer.assert_called_once_with(model_name)
 
     def test_load_dense_encoding_model_failure(
         self,
-        mocker: MockerFixture,
+        patched_sentence_transformer: Mock,
     ) -> None:
         """Test model loading failure."""
-        mock_sentence_transformer_class = mocker.patch(
-            "adapters.encoding.huggingface_dense.SentenceTransformer",
-        )
-        mock_sentence_transformer_class.side_effect = RuntimeError(
+        patched_sentence_transformer.side_effect = RuntimeError(
             "Failed to load model",
         )
 
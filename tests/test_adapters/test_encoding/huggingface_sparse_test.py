@@ -1,43 +1,105 @@
 """Test module for HuggingfaceSparseEmbeddingService."""
 
+import sys
+from importlib import import_module
+
 import pytest
 from logger import LoggerContract
-from numpy import array as np_array
 from pytest_mock import MockerFixture
-from sentence_transformers import SparseEncoder
-from torch import Tensor
-
+from torch import (
+    Tensor,
+    empty,
+    float64,
+    int64,
+    sparse_coo_tensor,
+    tensor,
+)
+
+import adapters.encoding
 from adapters.encoding.huggingface_sparse import HuggingfaceSparseEmbeddingService
 from adapters.exceptions import EncodingError, ModelLoadingError
 from domain.types.vectors import SparseVector
 
+_MODULE = "adapters.encoding.huggingface_sparse"
+# Packages the adapter only imports once they are needed
+_LAZY_PACKAGES = frozenset({"sentence_transformers", "torch"})
+_ENCODE_KWARGS = {"convert_to_tensor": True, "convert_to_sparse_tensor": True}
+
+
+class _FakeSparseEncoder:
+    """Stand-in for SparseEncoder returning a preset tensor and recording calls."""
+
+    def __init__(self, tensor: Tensor) -> None:
+        self.tensor = tensor
+        self.error: Exception | None = None
+        self.calls: list[tuple[str | list[str], dict[str, object]]] = []
+
+    def encode(self, texts: str | list[str], **kwargs: object) -> Tensor:
+        self.calls.append((texts, kwargs))
+        if self.error is not None:
+            raise self.error
+        return self.tensor
+
+
+class _PlainSparseTensor:
+    """Sparse tensor stand-in exposing only real indices and values tensors."""
+
+    def __init__(
+        self,
+        indices: list[list[int]],
+        values: list[float],
+        *,
+        is_cuda: bool = False,
+    ) -> None:
+        self._indices = tensor(indices, dtype=int64)
+        self._values = tensor(values, dtype=float64)
+        self.is_cuda = is_cuda
+
+    def indices(self) -> Tensor:
+        return self._indices
+
+    def values(self) -> Tensor:
+        return self._values
+
+
+class _FakeSparseTensor(_PlainSparseTensor):
+    """Sparse tensor stand-in also recording how often it gets coalesced."""
+
+    def __init__(
+        self,
+        indices: list[list[int]],
+        values: list[float],
+        *,
+        is_cuda: bool = False,
+        coalesced: bool = False,
+    ) -> None:
+        super().__init__(indices, values, is_cuda=is_cuda)
+        self.coalesced = coalesced
+        self.coalesce_calls = 0
+
+    def is_coalesced(self) -> bool:
+        return self.coalesced
+
+    def coalesce(self) -> "_FakeSparseTensor":
+        self.coalesce_calls += 1
+        self.coalesced = True
+        return self
+
 
 class TestHuggingfaceSparseEmbeddingService:
     """Test class for HuggingfaceSparseEmbeddingService."""
 
     @pytest.fixture
-    def mock_sparse_encoder(self, mocker: MockerFixture) -> SparseEncoder:
-        """Mock SparseEncoder fixture."""
-        mock_encoder = mocker.Mock(spec=SparseEncoder)
-
-        # Create a mock sparse tensor
-        mock_tensor = mocker.Mock(spec=Tensor)
-        mock_tensor.coalesce.return_value = mock_tensor
-        mock_tensor.indices.return_value.cpu.return_value.numpy.return_value = np_array(
-            [[0, 2, 4]],
-        )
-        mock_tensor.values.return_value.cpu.return_value.numpy.return_value = np_array(
-            [0.1, 0.3, 0.5],
+    def mock_sparse_encoder(self) -> _FakeSparseEncoder:
+        """Fake SparseEncoder returning an uncoalesced sparse tensor."""
+        return _FakeSparseEncoder(
+            sparse_coo_tensor([[0, 2, 4]], [0.1, 0.3, 0.5], size=(8,), dtype=float64),
         )
-        mock_tensor.shape = (3,)
-
-        mock_encoder.encode.return_value = mock_tensor
-        return mock_encoder
 
     @pytest.fixture
     def service(
         self,
-        mock_sparse_encoder: SparseEncoder,
+        mock_sparse_encoder: _FakeSparseEncoder,
         mock_logger: LoggerContract,
     ) -> HuggingfaceSparseEmbeddingService:
         """HuggingfaceSparseEmbeddingService fixture."""
@@ -48,7 +110,7 @@ class TestHuggingfaceSparseEmbeddingService:
 
     def test_initialization(
         self,
-        mock_sparse_encoder: SparseEncoder,
+        mock_sparse_encoder: _FakeSparseEncoder,
         mock_logger: LoggerContract,
     ) -> None:
         """Test service initialization."""
@@ -63,7 +125,7 @@ class TestHuggingfaceSparseEmbeddingService:
     def test_encode_success(
         self,
         service: HuggingfaceSparseEmbeddingService,
-        mock_sparse_encoder: SparseEncoder,
+        mock_sparse_encoder: _FakeSparseEncoder,
         mock_logger: LoggerContract,
     ) -> None:
         """Test successful text encoding."""
@@ -76,15 +138,121 @@ class TestHuggingfaceSparseEmbeddingService:
         assert result.values == [0.1, 0.3, 0.5]
 
         # Verify model was called correctly
-        mock_sparse_encoder.encode.assert_called_once_with(
-            text,
-            convert_to_tensor=True,
-            convert_to_sparse_tensor=True,
-        )
+        assert mock_sparse_encoder.calls == [(text, _ENCODE_KWARGS)]
 
         # Verify logging
         mock_logger.debug.assert_called()
 
+    def test_encode_uses_inference_mode(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that the model is called with autograd disabled."""
+        mock_inference_mode = mocker.patch(
+            "torch.inference_mode",
+        )
+
+        service.encode("test text")
+
+        mock_inference_mode.assert_called_once_with()
+        mock_inference_mode.return_value.__enter__.assert_called_once_with()
+
+    def test_encode_coalesces_duplicate_indices(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
+    ) -> None:
+        """Test that an uncoalesced tensor is coalesced before extraction."""
+        mock_sparse_encoder.tensor = sparse_coo_tensor(
+            [[2, 0, 2]],
+            [0.1, 0.2, 0.3],
+            size=(8,),
+            dtype=float64,
+        )
+
+        result = service.encode("test text")
+
+        assert result.indices == [0, 2]
+        assert result.values == pytest.approx([0.2, 0.4])
+
+    def test_encode_empty_sparse_vector(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
+    ) -> None:
+        """Test that a tensor without entries gives an empty sparse vector."""
+        mock_sparse_encoder.tensor = sparse_coo_tensor(
+            empty((1, 0), dtype=int64),
+            [],
+            size=(8,),
+            dtype=float64,
+        )
+
+        result = service.encode("the and of")
+
+        assert result == SparseVector(indices=[], values=[])
+
+    def test_encode_empty_sparse_vector_skips_synchronize(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that no device sync happens for a tensor without entries."""
+        mock_synchronize = mocker.patch("torch.cuda.synchronize")
+        mock_sparse_encoder.tensor = _FakeSparseTensor([[]], [], is_cuda=True)
+
+        result = service.encode("the and of")
+
+        assert result == SparseVector(indices=[], values=[])
+        mock_synchronize.assert_not_called()
+
+    def test_encode_skips_coalesce_when_already_coalesced(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
+    ) -> None:
+        """Test that an already coalesced tensor is not coalesced again."""
+        sparse_tensor = _FakeSparseTensor([[0, 2, 4]], [0.1, 0.3, 0.5], coalesced=True)
+        mock_sparse_encoder.tensor = sparse_tensor
+
+        result = service.encode("test text")
+
+        assert result.indices == [0, 2, 4]
+        assert sparse_tensor.coalesce_calls == 0
+
+    def test_encode_copies_to_cpu_with_single_synchronize(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that device tensors are copied to CPU with a single sync."""
+        mock_synchronize = mocker.patch("torch.cuda.synchronize")
+        mock_sparse_encoder.tensor = _FakeSparseTensor(
+            [[0, 2, 4]],
+            [0.1, 0.3, 0.5],
+            is_cuda=True,
+        )
+
+        result = service.encode("test text")
+
+        assert result == SparseVector(indices=[0, 2, 4], values=[0.1, 0.3, 0.5])
+        mock_synchronize.assert_called_once_with()
+
+    def test_encode_on_cpu_skips_synchronize(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that no device synchronization happens for CPU tensors."""
+        mock_synchronize = mocker.patch("torch.cuda.synchronize")
+
+        service.encode("test text")
+
+        mock_synchronize.assert_not_called()
+
     def test_encode_with_model_not_available(self, mock_logger: LoggerContract) -> None:
         """Test encoding when model is None."""
         service = HuggingfaceSparseEmbeddingService(
@@ -97,16 +265,12 @@ class TestHuggingfaceSparseEmbeddingService:
 
     def test_encode_with_encoding_error(
         self,
-        mock_sparse_encoder: SparseEncoder,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
         mock_logger: LoggerContract,
     ) -> None:
         """Test encoding when model raises an exception."""
-        mock_sparse_encoder.encode.side_effect = RuntimeError("Model error")
-
-        service = HuggingfaceSparseEmbeddingService(
-            model=mock_sparse_encoder,
-            logger=mock_logger,
-        )
+        mock_sparse_encoder.error = RuntimeError("Model error")
 
         with pytest.raises(EncodingError, match="Failed to encode sparse text"):
             service.encode("test text")
@@ -115,30 +279,11 @@ class TestHuggingfaceSparseEmbeddingService:
 
     def test_encode_without_coalesce(
         self,
-        mock_logger: LoggerContract,
-        mocker: MockerFixture,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
     ) -> None:
         """Test encoding with tensor that doesn't have coalesce method."""
-        mock_encoder = mocker.Mock(spec=SparseEncoder)
-
-        # Create a mock sparse tensor without coalesce
-        mock_tensor = mocker.Mock(
-            spec=["indices", "values", "shape"],
-        )  # Only has indices, values, shape - no coalesce
-        mock_tensor.indices.return_value.cpu.return_value.numpy.return_value = np_array(
-            [0, 1, 3],
-        )
-        mock_tensor.values.return_value.cpu.return_value.numpy.return_value = np_array(
-            [0.2, 0.4, 0.6],
-        )
-        mock_tensor.shape = (4,)
-
-        mock_encoder.encode.return_value = mock_tensor
-
-        service = HuggingfaceSparseEmbeddingService(
-            model=mock_encoder,
-            logger=mock_logger,
-        )
+        mock_sparse_encoder.tensor = _PlainSparseTensor([[0, 1, 3]], [0.2, 0.4, 0.6])
 
         result = service.encode("test text")
 
@@ -147,43 +292,121 @@ class TestHuggingfaceSparseEmbeddingService:
         assert result.values == [0.2, 0.4, 0.6]
 
         # Verify encode was called with correct parameters
-        mock_encoder.encode.assert_called_once_with(
-            "test text",
-            convert_to_tensor=True,
-            convert_to_sparse_tensor=True,
-        )
+        assert mock_sparse_encoder.calls == [("test text", _ENCODE_KWARGS)]
 
     def test_encode_with_multidimensional_indices(
         self,
-        mock_logger: LoggerContract,
-        mocker: MockerFixture,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
     ) -> None:
         """Test encoding with multidimensional indices array."""
-        mock_encoder = mocker.Mock(spec=SparseEncoder)
+        sparse_tensor = _FakeSparseTensor([[0, 2, 4]], [0.1, 0.3, 0.5])
+        mock_sparse_encoder.tensor = sparse_tensor
+
+        result = service.encode("test text")
 
-        mock_tensor = mocker.Mock(spec=Tensor)
-        mock_tensor.coalesce.return_value = mock_tensor
-        # Return 2D indices array
-        mock_tensor.indices.return_value.cpu.return_value.numpy.return_value = np_array(
-            [[0, 1, 2]],
+        # The (1, nnz) indices are flattened into a plain list
+        assert result.indices == [0, 2, 4]
+        assert result.values == [0.1, 0.3, 0.5]
+        assert sparse_tensor.coalesce_calls == 1
+
+    @pytest.fixture
+    def batch_tensor(self) -> Tensor:
+        """(batch, vocabulary) sparse tensor with entries in three rows."""
+        return sparse_coo_tensor(
+            [[0, 0, 1, 1, 2], [0, 2, 1, 4, 3]],
+            [0.1, 0.2, 0.3, 0.4, 0.5],
+            size=(4, 8),
+            dtype=float64,
         )
-        mock_tensor.values.return_value.cpu.return_value.numpy.return_value = np_array(
-            [0.1, 0.2, 0.3],
+
+    def test_encode_batch_success(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
+        batch_tensor: Tensor,
+    ) -> None:
+        """Test encoding several texts with a single model call."""
+        texts = ["first", "second", "third"]
+        mock_sparse_encoder.tensor = batch_tensor
+
+        result = service.encode_batch(texts)
+
+        assert result == [
+            SparseVector(indices=[0, 2], values=[0.1, 0.2]),
+            SparseVector(indices=[1, 4], values=[0.3, 0.4]),
+            SparseVector(indices=[3], values=[0.5]),
+        ]
+        assert mock_sparse_encoder.calls == [
+            (texts, {**_ENCODE_KWARGS, "batch_size": 3}),
+        ]
+
+    def test_encode_batch_uses_inference_mode(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
+        batch_tensor: Tensor,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that the batch model call is made with autograd disabled."""
+        mock_inference_mode = mocker.patch(
+            "torch.inference_mode",
         )
-        mock_tensor.shape = (3,)
+        mock_sparse_encoder.tensor = batch_tensor
+
+        service.encode_batch(["first", "second", "third"])
+
+        mock_inference_mode.return_value.__enter__.assert_called_once_with()
 
-        mock_encoder.encode.return_value = mock_tensor
+    def test_encode_batch_preserves_order(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
+        batch_tensor: Tensor,
+    ) -> None:
+        """Test that rows without entries still get a vector in input order."""
+        mock_sparse_encoder.tensor = batch_tensor
+
+        result = service.encode_batch(["first", "second", "third", "empty"])
+
+        assert [vector.indices for vector in result] == [[0, 2], [1, 4], [3], []]
+        assert result[3].values == []
+
+    def test_encode_batch_empty(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
+    ) -> None:
+        """Test that an empty batch does not call the model."""
+        assert service.encode_batch([]) == []
+        assert mock_sparse_encoder.calls == []
 
+    def test_encode_batch_with_model_not_available(
+        self,
+        mock_logger: LoggerContract,
+    ) -> None:
+        """Test batch encoding when model is None."""
         service = HuggingfaceSparseEmbeddingService(
-            model=mock_encoder,
+            model=None,
             logger=mock_logger,
         )
 
-        result = service.encode("test text")
+        with pytest.raises(EncodingError, match="Sparse model not available"):
+            service.encode_batch(["test text"])
 
-        assert isinstance(result, SparseVector)
-        assert result.indices == [0, 1, 2]  # Should be flattened
-        assert result.values == [0.1, 0.2, 0.3]
+    def test_encode_batch_with_encoding_error(
+        self,
+        service: HuggingfaceSparseEmbeddingService,
+        mock_sparse_encoder: _FakeSparseEncoder,
+        mock_logger: LoggerContract,
+    ) -> None:
+        """Test batch encoding when model raises an exception."""
+        mock_sparse_encoder.error = RuntimeError("Model error")
+
+        with pytest.raises(EncodingError, match="Failed to encode sparse texts"):
+            service.encode_batch(["test text"])
+
+        mock_logger.exception.assert_called()
 
     def test_load_sparse_encoding_model_success(
         self,
@@ -191,9 +414,9 @@ class TestHuggingfaceSparseEmbeddingService:
     ) -> None:
         """Test successful model loading."""
         mock_sparse_encoder_class = mocker.patch(
-            "adapters.encoding.huggingface_sparse.SparseEncoder",
+            "sentence_transformers.sparse_encoder.SparseEncoder",
         )
-        mock_model = mocker.Mock(spec=SparseEncoder)
+        mock_model = mocker.Mock(spec=["encode"])
         mock_sparse_encoder_class.return_value = mock_model
 
         model_name = "test-model"
@@ -210,7 +433,7 @@ class TestHuggingfaceSparseEmbeddingService:
     ) -> None:
         """Test model loading failure."""
         mock_sparse_encoder_class = mocker.patch(
-            "adapters.encoding.huggingface_sparse.SparseEncoder",
+            "sentence_transformers.sparse_encoder.SparseEncoder",
         )
         mock_sparse_encoder_class.side_effect = RuntimeError(
             "Failed to load sparse model",
@@ -220,3 +443,23 @@ class TestHuggingfaceSparseEmbeddingService:
 
         with pytest.raises(ModelLoadingError, match="Failed to load sparse model"):
             HuggingfaceSparseEmbeddingService.load_sparse_encoding_model(model_name)
+
+    def test_heavy_dependencies_not_imported_at_module_load(
+        self,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that importing the adapter imports neither torch nor its models."""
+        # Import the adapter afresh, restoring the original modules afterwards,
+        # along with the adapter attribute the import sets on its package
+        modules = {
+            name: module
+            for name, module in sys.modules.items()
+            if name != _MODULE and name.partition(".")[0] not in _LAZY_PACKAGES
+        }
+        mocker.patch.object(adapters.encoding, "huggingface_sparse")
+        mocker.patch.dict(sys.modules, modules, clear=True)
+
+        import_module(_MODULE)
+
+        assert "sentence_transformers" not in sys.modules
+        assert "torch" not in sys.modules
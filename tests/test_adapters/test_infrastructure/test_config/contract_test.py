@@ -7,122 +7,132 @@ import pytest
 from adapters.infrastructure.config.contract import ConfigContract
 
 
-class TestConfigContract:
-    """Test class for ConfigContract."""
+class _CompleteConfig(ConfigContract):
+    """Config implementing every abstract method of the contract."""
 
-    def test_config_contract_is_abstract(self) -> None:
-        """Test that ConfigContract is an abstract class."""
-        assert isinstance(ConfigContract, ABCMeta)
+    def get_db_method(self) -> str:
+        return "qdrant"
 
-        # Should not be able to instantiate directly
-        with pytest.raises(TypeError):
-            ConfigContract()
+    def get_db_host(self) -> str:
+        return "localhost"
 
-    def test_config_contract_abstract_methods(self) -> None:
-        """Test that ConfigContract has all required abstract methods."""
-        expected_methods = [
-            "get_db_method",
-            "get_db_host",
-            "get_db_port",
-            "get_db_url",
-            "get_db_api_key",
-            "get_db_collection",
-            "get_db_vector_distance",
-            "get_db_vector_dimensions",
-            "get_dense_vector_name",
-            "get_sparse_vector_name",
-            "get_embedding_method",
-            "get_embedding_model_name",
-            "get_embedding_vector_dimensions",
-            "get_sparse_embedding_model_name",
-        ]
-
-        abstract_methods = ConfigContract.__abstractmethods__
-
-        for method in expected_methods:
-            assert method in abstract_methods, f"Method {method} should be abstract"
+    def get_db_port(self) -> int:
+        return 6333
 
-    def test_config_contract_inheritance(self) -> None:
-        """Test that ConfigContract properly inherits from CoreConfigContract."""
-        from configcore import ConfigContract as CoreConfigContract
+    def get_db_url(self) -> str:
+        return "http://localhost:6333"
 
-        assert issubclass(ConfigContract, CoreConfigContract)
+    def get_db_api_key(self) -> str | None:
+        return None
 
-    def test_concrete_implementation_requirement(self) -> None:
-        """Test that concrete implementations must implement all abstract methods."""
+    def get_db_prefer_grpc(self) -> bool:
+        return True
 
-        # Create a partial implementation missing some methods
-        class PartialConfig(ConfigContract):
-            def get_db_method(self) -> str:
-                return "qdrant"
+    def get_db_collection(self) -> str:
+        return "test"
 
-            def get_db_host(self) -> str:
-                return "localhost"
+    def get_db_vector_distance(self) -> str:
+        return "Cosine"
 
-            # Missing other required methods
+    def get_db_vector_dimensions(self) -> int:
+        return 1024
 
-        # Should not be able to instantiate incomplete implementation
-        with pytest.raises(TypeError):
-            PartialConfig()
+    def get_db_quantize_dense(self) -> bool:
+        return False
 
-    def test_complete_implementation(self) -> None:  # noqa: C901
-        """Test that a complete implementation can be instantiated."""
+    def get_dense_vector_name(self) -> str:
+        return "dense"
 
-        class CompleteConfig(ConfigContract):
-            def get_db_method(self) -> str:
-                return "qdrant"
+    def get_sparse_vector_name(self) -> str:
+        return "sparse"
 
-            def get_db_host(self) -> str:
-                return "localhost"
+    def get_embedding_method(self) -> str:
+        return "hf"
 
-            def get_db_port(self) -> int:
-                return 6333
+    def get_embedding_model_name(self) -> str:
+        return "test-model"
 
-            def get_db_url(self) -> str:
-                return "http://localhost:6333"
+    def get_embedding_vector_dimensions(self) -> int:
+        return 768
 
-            def get_db_api_key(self) -> str | None:
-                return None
+    def get_sparse_embedding_model_name(self) -> str:
+        return "test-sparse-model"
 
-            def get_db_collection(self) -> str:
-                return "test"
+    # Required by CoreConfigContract
+    def get_environment(self) -> str:
+        return "test"
 
-            def get_db_vector_distance(self) -> str:
-                return "Cosine"
+    def get_log_level(self) -> str:
+        return "DEBUG"
 
-            def get_db_vector_dimensions(self) -> int:
-                return 1024
 
-            def get_dense_vector_name(self) -> str:
-                return "dense"
+class _PartialConfig(ConfigContract):
+    """Config missing most of the abstract methods of the contract."""
 
-            def get_sparse_vector_name(self) -> str:
-                return "sparse"
+    def get_db_method(self) -> str:
+        return "qdrant"
 
-            def get_embedding_method(self) -> str:
-                return "hf"
+    def get_db_host(self) -> str:
+        return "localhost"
 
-            def get_embedding_model_name(self) -> str:
-                return "test-model"
 
-            def get_embedding_vector_dimensions(self) -> int:
-                return 768
+class TestConfigContract:
+    """Test class for ConfigContract."""
 
-            def get_sparse_embedding_model_name(self) -> str:
-                return "test-sparse-model"
+    @pytest.fixture(scope="module")
+    def complete_config(self) -> _CompleteConfig:
+        """Complete configuration, shared by the module."""
+        return _CompleteConfig()
 
-            # Required by CoreConfigContract
-            def get_environment(self) -> str:
-                return "test"
+    def test_config_contract_is_abstract(self) -> None:
+        """Test that ConfigContract is an abstract class."""
+        assert isinstance(ConfigContract, ABCMeta)
+
+        # Should not be able to instantiate directly
+        with pytest.raises(TypeError):
+            ConfigContract()
+
+    def test_config_contract_abstract_methods(self) -> None:
+        """Test that ConfigContract has all required abstract methods."""
+        expected_methods = frozenset(
+            {
+                "get_db_method",
+                "get_db_host",
+                "get_db_port",
+                "get_db_url",
+                "get_db_api_key",
+                "get_db_prefer_grpc",
+                "get_db_collection",
+                "get_db_vector_distance",
+                "get_db_vector_dimensions",
+                "get_db_quantize_dense",
+                "get_dense_vector_name",
+                "get_sparse_vector_name",
+                "get_embedding_method",
+                "get_embedding_model_name",
+                "get_embedding_vector_dimensions",
+                "get_sparse_embedding_model_name",
+            },
+        )
+
+        missing = expected_methods - ConfigContract.__abstractmethods__
+        assert not missing, f"Abstract methods missing: {missing}"
 
-            def get_log_level(self) -> str:
-                return "DEBUG"
+    def test_config_contract_inheritance(self) -> None:
+        """Test that ConfigContract properly inherits from CoreConfigContract."""
+        from configcore import ConfigContract as CoreConfigContract
+
+        assert issubclass(ConfigContract, CoreConfigContract)
 
-        # Should be able to instantiate complete implementation
-        config = CompleteConfig()
+    def test_concrete_implementation_requirement(self) -> None:
+        """Test that concrete implementations must implement all abstract methods."""
+        # Should not be able to instantiate incomplete implementation
+        with pytest.raises(TypeError):
+            _PartialConfig()
 
-        # Test some methods work
-        assert config.get_db_method() == "qdrant"
-        assert config.get_db_host() == "localhost"
-        assert config.get_db_port() == 6333
-        assert config.get_db_api_key() is None
+    def test_complete_implementation(self, complete_config: _CompleteConfig) -> None:
+        """Test that a complete implementation can be instantiated."""
+        assert complete_config.get_db_method() == "qdrant"
+        assert complete_config.get_db_host() == "localhost"
+        assert complete_config.get_db_port() == 6333
+        assert complete_config.get_db_api_key() is None
@@ -1,177 +1,187 @@
 """Test module for configuration settings."""
 
+from collections.abc import Generator
+from unittest.mock import patch
+
 import pytest
+from pydantic import ValidationError
 from pytest_mock import MockerFixture
 
-from adapters.infrastructure.config.settings import Settings
+from adapters.infrastructure.config.settings import (
+    Settings,
+    build_settings,
+    get_settings,
+)
+
+# (getter, field) pairs of the ConfigContract implementation
+_GETTER_FIELDS = [
+    pytest.param(getter, field, id=field)
+    for getter, field in [
+        ("get_db_method", "db_method"),
+        ("get_db_host", "db_qdrant_host"),
+        ("get_db_port", "db_qdrant_port"),
+        ("get_db_url", "db_qdrant_url"),
+        ("get_db_api_key", "db_qdrant_api_key"),
+        ("get_db_prefer_grpc", "db_qdrant_prefer_grpc"),
+        ("get_db_collection", "db_qdrant_collection"),
+        ("get_db_vector_distance", "db_qdrant_vector_distance"),
+        ("get_db_vector_dimensions", "db_qdrant_vector_dimensions"),
+        ("get_db_quantize_dense", "db_qdrant_quantize_dense"),
+        ("get_dense_vector_name", "db_qdrant_dense_vector_name"),
+        ("get_sparse_vector_name", "db_qdrant_sparse_vector_name"),
+        ("get_embedding_method", "embedding_method"),
+        ("get_embedding_model_name", "embedding_hf_model_name"),
+        ("get_embedding_vector_dimensions", "embedding_hf_vector_dimensions"),
+        ("get_sparse_embedding_model_name", "sparse_embedding_model_name"),
+    ]
+]
+
+_DEFAULT_VALUES = {
+    "db_method": "qdrant",
+    "db_qdrant_host": "qdrant",
+    "db_qdrant_port": 6333,
+    "db_qdrant_url": "http://qdrant:6333",
+    "db_qdrant_api_key": None,
+    "db_qdrant_prefer_grpc": False,
+    "db_qdrant_collection": "entities",
+    "db_qdrant_vector_distance": "Cosine",
+    "db_qdrant_vector_dimensions": 1024,
+    "db_qdrant_quantize_dense": False,
+    "db_qdrant_dense_vector_name": "dense",
+    "db_qdrant_sparse_vector_name": "sparse",
+    "embedding_method": "hf",
+    "embedding_hf_model_name": "Qwen/Qwen3-Embedding-0.6B",
+    "embedding_hf_vector_dimensions": 1024,
+    "sparse_embedding_model_name": (
+        "opensearch-project/opensearch-neural-sparse-encoding-multilingual-v1"
+    ),
+}
+
+_CUSTOM_VALUES = {
+    "db_method": "qdrant",
+    "db_qdrant_host": "localhost",
+    "db_qdrant_port": 6334,
+    "db_qdrant_url": "http://localhost:6334",
+    "db_qdrant_api_key": "test-api-key",
+    "db_qdrant_prefer_grpc": True,
+    "db_qdrant_collection": "test-collection",
+    "db_qdrant_vector_distance": "Dot",
+    "db_qdrant_vector_dimensions": 768,
+    "db_qdrant_quantize_dense": True,
+    "db_qdrant_dense_vector_name": "custom_dense",
+    "db_qdrant_sparse_vector_name": "custom_sparse",
+    "embedding_method": "hf",
+    "embedding_hf_model_name": "test-model",
+    "embedding_hf_vector_dimensions": 768,
+    "sparse_embedding_model_name": "test-sparse-model",
+}
+
+# Environment variables are the upper-cased field names
+_ENV_VALUES = {
+    "db_method": "qdrant",
+    "db_qdrant_host": "env-host",
+    "db_qdrant_port": 6335,
+    "db_qdrant_url": "http://env-host:6335",
+    "db_qdrant_api_key": "env-api-key",
+    "db_qdrant_prefer_grpc": True,
+    "db_qdrant_collection": "env-collection",
+    "db_qdrant_vector_distance": "Euclid",
+    "db_qdrant_vector_dimensions": 512,
+    "db_qdrant_quantize_dense": True,
+    "db_qdrant_dense_vector_name": "env-dense",
+    "db_qdrant_sparse_vector_name": "env-sparse",
+    "embedding_method": "hf",
+    "embedding_hf_model_name": "env-model",
+    "embedding_hf_vector_dimensions": 512,
+    "sparse_embedding_model_name": "env-sparse-model",
+}
 
 
 class TestSettings:
     """Test class for Settings configuration."""
 
-    def test_default_values(self, mocker: MockerFixture) -> None:
-        """Test that Settings has correct default values."""
-        mocker.patch.dict("os.environ", {}, clear=True)
-        settings = Settings(_env_file=None)
+    @pytest.fixture(autouse=True)
+    def clear_settings_cache(self) -> Generator[None]:
+        """Clear the cached settings so each test reads its own environment."""
+        get_settings.cache_clear()
+        yield
+        get_settings.cache_clear()
 
-        assert settings.get_db_method() == "qdrant"
-        assert settings.get_db_host() == "qdrant"
-        assert settings.get_db_port() == 6333
-        assert settings.get_db_url() == "http://qdrant:6333"
-        assert settings.get_db_api_key() is None
-        assert settings.get_db_collection() == "entities"
-        assert settings.get_db_vector_distance() == "Cosine"
-        assert settings.get_db_vector_dimensions() == 1024
-        assert settings.get_dense_vector_name() == "dense"
-        assert settings.get_sparse_vector_name() == "sparse"
-        assert settings.get_embedding_method() == "hf"
-        assert settings.get_embedding_model_name() == "Qwen/Qwen3-Embedding-0.6B"
-        assert settings.get_embedding_vector_dimensions() == 1024
-        assert (
-            settings.get_sparse_embedding_model_name()
-            == "opensearch-project/opensearch-neural-sparse-encoding-multilingual-v1"
-        )
+    @pytest.fixture(scope="module")
+    def default_settings(self) -> Settings:
+        """Settings built without any environment, shared by the module."""
+        with patch.dict("os.environ", {}, clear=True):
+            return Settings(_env_file=None)
 
-    def test_direct_field_access(self, mocker: MockerFixture) -> None:
-        """Test direct access to Settings fields."""
-        mocker.patch.dict("os.environ", {}, clear=True)
-        settings = Settings(_env_file=None)
-
-        assert settings.db_method == "qdrant"
-        assert settings.db_qdrant_host == "qdrant"
-        assert settings.db_qdrant_port == 6333
-        assert settings.db_qdrant_url == "http://qdrant:6333"
-        assert settings.db_qdrant_api_key is None
-        assert settings.db_qdrant_collection == "entities"
-        assert settings.db_qdrant_vector_distance == "Cosine"
-        assert settings.db_qdrant_vector_dimensions == 1024
-        assert settings.db_qdrant_dense_vector_name == "dense"
-        assert settings.db_qdrant_sparse_vector_name == "sparse"
-        assert settings.embedding_method == "hf"
-        assert settings.embedding_hf_model_name == "Qwen/Qwen3-Embedding-0.6B"
-        assert settings.embedding_hf_vector_dimensions == 1024
-        assert (
-            settings.sparse_embedding_model_name
-            == "opensearch-project/opensearch-neural-sparse-encoding-multilingual-v1"
-        )
+    @pytest.fixture(scope="module")
+    def custom_settings(self) -> Settings:
+        """Settings built from custom init values, shared by the module."""
+        return Settings(**_CUSTOM_VALUES)
 
-    def test_custom_values_via_init(self) -> None:
-        """Test Settings with custom values via initialization."""
-        custom_settings = Settings(
-            db_method="qdrant",
-            db_qdrant_host="localhost",
-            db_qdrant_port=6334,
-            db_qdrant_url="http://localhost:6334",
-            db_qdrant_api_key="test-api-key",
-            db_qdrant_collection="test-collection",
-            db_qdrant_vector_distance="Dot",
-            db_qdrant_vector_dimensions=768,
-            db_qdrant_dense_vector_name="custom_dense",
-            db_qdrant_sparse_vector_name="custom_sparse",
-            embedding_method="hf",
-            embedding_hf_model_name="test-model",
-            embedding_hf_vector_dimensions=768,
-            sparse_embedding_model_name="test-sparse-model",
-        )
+    @pytest.fixture(scope="module")
+    def env_settings(self) -> Settings:
+        """Settings loaded from environment variables, shared by the module."""
+        env = {field.upper(): str(value) for field, value in _ENV_VALUES.items()}
+        with patch.dict("os.environ", env):
+            return Settings()
+
+    @pytest.mark.parametrize(("getter", "field"), _GETTER_FIELDS)
+    def test_default_values(
+        self,
+        default_settings: Settings,
+        getter: str,
+        field: str,
+    ) -> None:
+        """Test that Settings has correct default values."""
+        assert getattr(default_settings, field) == _DEFAULT_VALUES[field]
+        assert getattr(default_settings, getter)() == _DEFAULT_VALUES[field]
+
+    @pytest.mark.parametrize(("getter", "field"), _GETTER_FIELDS)
+    def test_custom_values_via_init(
+        self,
+        custom_settings: Settings,
+        getter: str,
+        field: str,
+    ) -> None:
+        """Test that getters return the custom values given at initialization."""
+        assert getattr(custom_settings, field) == _CUSTOM_VALUES[field]
+        assert getattr(custom_settings, getter)() == _CUSTOM_VALUES[field]
 
-        assert custom_settings.get_db_method() == "qdrant"
-        assert custom_settings.get_db_host() == "localhost"
-        assert custom_settings.get_db_port() == 6334
-        assert custom_settings.get_db_url() == "http://localhost:6334"
-        assert custom_settings.get_db_api_key() == "test-api-key"
-        assert custom_settings.get_db_collection() == "test-collection"
-        assert custom_settings.get_db_vector_distance() == "Dot"
-        assert custom_settings.get_db_vector_dimensions() == 768
-        assert custom_settings.get_dense_vector_name() == "custom_dense"
-        assert custom_settings.get_sparse_vector_name() == "custom_sparse"
-        assert custom_settings.get_embedding_method() == "hf"
-        assert custom_settings.get_embedding_model_name() == "test-model"
-        assert custom_settings.get_embedding_vector_dimensions() == 768
-        assert custom_settings.get_sparse_embedding_model_name() == "test-sparse-model"
-
-    def test_environment_variables(self, mocker: MockerFixture) -> None:
+    @pytest.mark.parametrize(("getter", "field"), _GETTER_FIELDS)
+    def test_environment_variables(
+        self,
+        env_settings: Settings,
+        getter: str,
+        field: str,
+    ) -> None:
         """Test Settings loading from environment variables."""
-        mocker.patch.dict(
-            "os.environ",
-            {
-                "DB_METHOD": "qdrant",
-                "DB_QDRANT_HOST": "env-host",
-                "DB_QDRANT_PORT": "6335",
-                "DB_QDRANT_URL": "http://env-host:6335",
-                "DB_QDRANT_API_KEY": "env-api-key",
-                "DB_QDRANT_COLLECTION": "env-collection",
-                "DB_QDRANT_VECTOR_DISTANCE": "Euclid",
-                "DB_QDRANT_VECTOR_DIMENSIONS": "512",
-                "DB_QDRANT_DENSE_VECTOR_NAME": "env-dense",
-                "DB_QDRANT_SPARSE_VECTOR_NAME": "env-sparse",
-                "EMBEDDING_METHOD": "hf",
-                "EMBEDDING_HF_MODEL_NAME": "env-model",
-                "EMBEDDING_HF_VECTOR_DIMENSIONS": "512",
-                "SPARSE_EMBEDDING_MODEL_NAME": "env-sparse-model",
-            },
-        )
-        settings = Settings()
-
-        assert settings.get_db_method() == "qdrant"
-        assert settings.get_db_host() == "env-host"
-        assert settings.get_db_port() == 6335
-        assert settings.get_db_url() == "http://env-host:6335"
-        assert settings.get_db_api_key() == "env-api-key"
-        assert settings.get_db_collection() == "env-collection"
-        assert settings.get_db_vector_distance() == "Euclid"
-        assert settings.get_db_vector_dimensions() == 512
-        assert settings.get_dense_vector_name() == "env-dense"
-        assert settings.get_sparse_vector_name() == "env-sparse"
-        assert settings.get_embedding_method() == "hf"
-        assert settings.get_embedding_model_name() == "env-model"
-        assert settings.get_embedding_vector_dimensions() == 512
-        assert settings.get_sparse_embedding_model_name() == "env-sparse-model"
-
-    def test_method_consistency(self) -> None:
-        """Test that getter methods return the same values as direct field access."""
-        settings = Settings(
-            db_method="qdrant",
-            db_qdrant_host="test-host",
-            db_qdrant_port=1234,
-            db_qdrant_url="http://test:1234",
-            db_qdrant_api_key="test-key",
-            db_qdrant_collection="test-coll",
-            db_qdrant_vector_distance="Manhattan",
-            db_qdrant_vector_dimensions=256,
-            db_qdrant_dense_vector_name="test-dense",
-            db_qdrant_sparse_vector_name="test-sparse",
-            embedding_method="hf",
-            embedding_hf_model_name="test-embed",
-            embedding_hf_vector_dimensions=256,
-            sparse_embedding_model_name="test-sparse",
-        )
+        assert getattr(env_settings, getter)() == _ENV_VALUES[field]
 
-        # Test that getter methods match field values
-        assert settings.get_db_method() == settings.db_method
-        assert settings.get_db_host() == settings.db_qdrant_host
-        assert settings.get_db_port() == settings.db_qdrant_port
-        assert settings.get_db_url() == settings.db_qdrant_url
-        assert settings.get_db_api_key() == settings.db_qdrant_api_key
-        assert settings.get_db_collection() == settings.db_qdrant_collection
-        assert settings.get_db_vector_distance() == settings.db_qdrant_vector_distance
-        assert (
-            settings.get_db_vector_dimensions() == settings.db_qdrant_vector_dimensions
-        )
-        assert settings.get_dense_vector_name() == settings.db_qdrant_dense_vector_name
-        assert (
-            settings.get_sparse_vector_name() == settings.db_qdrant_sparse_vector_name
-        )
-        assert settings.get_embedding_method() == settings.embedding_method
-        assert settings.get_embedding_model_name() == settings.embedding_hf_model_name
-        assert (
-            settings.get_embedding_vector_dimensions()
-            == settings.embedding_hf_vector_dimensions
-        )
-        assert (
-            settings.get_sparse_embedding_model_name()
-            == settings.sparse_embedding_model_name
+    def test_settings_is_frozen(self, default_settings: Settings) -> None:
+        """Test that settings fields cannot be reassigned."""
+        with pytest.raises(ValidationError, match="frozen"):
+            default_settings.db_qdrant_port = 9999
+
+        assert default_settings.get_db_port() == 6333
+
+    def test_unknown_fields_are_ignored(self) -> None:
+        """Test that values meant for other services are ignored."""
+        settings = Settings(search_engine_port=8000)
+
+        assert not hasattr(settings, "search_engine_port")
+
+    def test_get_settings_built_once(self, mocker: MockerFixture) -> None:
+        """Test that the settings are built once for all the getters."""
+        build_spy = mocker.patch(
+            "adapters.infrastructure.config.settings.build_settings",
+            wraps=build_settings,
         )
 
+        get_settings()
+        get_settings()
+
+        build_spy.assert_called_once_with()
+
     def test_api_key_none_handling(self) -> None:
         """Test that API key can be None and is handled properly."""
         settings = Settings(db_qdrant_api_key=None)
@@ -200,35 +210,76 @@ class TestSettings:
         assert settings.get_db_vector_dimensions() == 1024
         assert settings.get_embedding_vector_dimensions() == 1024
 
-    def test_vector_dimension_mismatch_validation(self) -> None:
-        """Test that dimension mismatch raises ValueError."""
-        import pytest
-
-        with pytest.raises(ValueError, match="Vector dimension mismatch") as exc_info:
-            Settings(
-                db_qdrant_vector_dimensions=512,
-                embedding_hf_vector_dimensions=1024,
+    @pytest.mark.parametrize(("db_dim", "emb_dim"), [(512, 1024), (1024, 768)])
+    def test_vector_dimension_mismatch(self, db_dim: int, emb_dim: int) -> None:
+        """Test that mismatching dimensions fail validation."""
+        with pytest.raises(ValueError, match="Vector dimension mismatch") as exc:
+            build_settings(
+                db_qdrant_vector_dimensions=db_dim,
+                embedding_hf_vector_dimensions=emb_dim,
             )
 
-        error_message = str(exc_info.value)
-        assert "Vector dimension mismatch" in error_message
-        assert "1024" in error_message
-        assert "512" in error_message
+        error_message = str(exc.value)
+        assert str(db_dim) in error_message
+        assert str(emb_dim) in error_message
 
-    def test_vector_dimension_match_validation_success(self) -> None:
+    @pytest.mark.parametrize("dim", [768, 1024])
+    def test_vector_dimension_match(self, dim: int) -> None:
         """Test that matching dimensions pass validation."""
-        # Should not raise any exception
+        settings = build_settings(
+            db_qdrant_vector_dimensions=dim,
+            embedding_hf_vector_dimensions=dim,
+        )
+
+        assert settings.get_db_vector_dimensions() == dim
+        assert settings.get_embedding_vector_dimensions() == dim
+
+    def test_raw_construction_skips_dimension_check(self) -> None:
+        """Test that only build_settings checks the vector dimensions."""
         settings = Settings(
-            db_qdrant_vector_dimensions=768,
-            embedding_hf_vector_dimensions=768,
+            db_qdrant_vector_dimensions=512,
+            embedding_hf_vector_dimensions=1024,
+        )
+
+        assert settings.get_db_vector_dimensions() == 512
+        assert settings.get_embedding_vector_dimensions() == 1024
+
+    def test_get_settings_checks_dimensions(self, mocker: MockerFixture) -> None:
+        """Test that the application settings are built with the check."""
+        mocker.patch.dict(
+            "os.environ",
+            {"DB_QDRANT_VECTOR_DIMENSIONS": "512"},
         )
-        assert settings.get_db_vector_dimensions() == 768
-        assert settings.get_embedding_vector_dimensions() == 768
+
+        with pytest.raises(ValueError, match="Vector dimension mismatch"):
+            get_settings()
 
     def test_vector_dimension_default_match(self, mocker: MockerFixture) -> None:
         """Test that default dimensions match and pass validation."""
         mocker.patch.dict("os.environ", {}, clear=True)
-        settings = Settings(_env_file=None)
-        # Default values should match
+        settings = build_settings(_env_file=None)
+
         assert settings.get_db_vector_dimensions() == 1024
         assert settings.get_embedding_vector_dimensions() == 1024
+
+    def test_get_settings_is_cached(self) -> None:
+        """Test that get_settings builds the settings only once."""
+        assert get_settings() is get_settings()
+
+    def test_get_settings_cache_cleared_picks_up_env(
+        self,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that clearing the cache reloads the settings from the env."""
+        mocker.patch.dict("os.environ", {"DB_QDRANT_HOST": "first-host"})
+        first = get_settings()
+
+        mocker.patch.dict("os.environ", {"DB_QDRANT_HOST": "second-host"})
+        assert get_settings() is first
+
+        get_settings.cache_clear()
+        second = get_settings()
+
+        assert second is not first
+        assert first.get_db_host() == "first-host"
+        assert second.get_db_host() == "second-host"
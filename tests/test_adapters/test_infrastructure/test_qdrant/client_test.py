@@ -1,376 +1,366 @@
 """Test module for Qdrant client wrapper."""
 
+from collections.abc import Generator
+from unittest.mock import Mock
+
 import pytest
 from logger import LoggerContract
 from pytest_mock import MockerFixture
 from qdrant_client import QdrantClient
-from qdrant_client.models import (
-    CollectionInfo,
-    CollectionsResponse,
-    SparseVectorParams,
-    VectorParams,
-)
+from qdrant_client.models import SparseVectorParams, VectorParams
 
 from adapters.exceptions import CollectionCreationError, DBConnectionError
-from adapters.infrastructure.qdrant.client import QdrantClientWrapper
+from adapters.infrastructure.qdrant.client import (
+    _HTTP_LIMITS,
+    _INT8_QUANTIZATION,
+    QdrantClientWrapper,
+    _get_client,
+    _known_collections,
+)
+
+_CONNECT_KWARGS = {"url": "http://localhost:6333", "api_key": "test-key"}
+# Transport options the wrapper always gives to QdrantClient
+_TRANSPORT_KWARGS = {"http2": True, "limits": _HTTP_LIMITS}
+
+_COLLECTION_NAME = "test-collection"
+_COLLECTION_KWARGS = {
+    "collection_name": _COLLECTION_NAME,
+    "vector_dimensions": 768,
+    "vector_distance": "Cosine",
+    "dense_vector_name": "dense",
+    "sparse_vector_name": "sparse",
+}
+# Built once, as the client models validate their fields on construction
+_EXPECTED_VECTORS_CONFIG = {"dense": VectorParams(size=768, distance="Cosine")}
+_EXPECTED_SPARSE_VECTORS_CONFIG = {"sparse": SparseVectorParams()}
 
 
 class TestQdrantClientWrapper:
     """Test class for QdrantClientWrapper."""
 
+    @pytest.fixture(autouse=True)
+    def clear_client_cache(self) -> Generator[None]:
+        """Clear the shared clients and known collections between tests."""
+        _get_client.cache_clear()
+        _known_collections.clear()
+        yield
+        _get_client.cache_clear()
+        _known_collections.clear()
+
     @pytest.fixture
     def mock_qdrant_client(self, mocker: MockerFixture) -> QdrantClient:
         """Create mock QdrantClient."""
-        return mocker.Mock(spec=QdrantClient)
+        # Only the methods the wrapper uses or must not use, rather than a spec
+        # built by introspecting the whole QdrantClient class
+        return mocker.Mock(
+            spec_set=(
+                "collection_exists",
+                "create_collection",
+                "update_collection",
+                "create_payload_index",
+            ),
+        )
 
-    def test_init_successful_connection(
+    @pytest.fixture
+    def wrapper_ctor_kwargs(self, mock_logger: LoggerContract) -> dict[str, object]:
+        """Keyword arguments building a wrapper around the test connection."""
+        return {**_CONNECT_KWARGS, "logger": mock_logger}
+
+    @pytest.fixture
+    def wrapper(self, wrapper_ctor_kwargs: dict[str, object]) -> QdrantClientWrapper:
+        """Wrapper around the mock Qdrant client."""
+        return QdrantClientWrapper(**wrapper_ctor_kwargs)
+
+    @pytest.fixture(autouse=True)
+    def patched_qdrant(
         self,
-        mock_logger: LoggerContract,
         mock_qdrant_client: QdrantClient,
         mocker: MockerFixture,
-    ) -> None:
-        """Test successful initialization and connection."""
-        mock_client_class = mocker.patch(
+    ) -> Mock:
+        """Patch the QdrantClient class to build the mock client."""
+        return mocker.patch(
             "adapters.infrastructure.qdrant.client.QdrantClient",
+            return_value=mock_qdrant_client,
         )
-        mock_client_class.return_value = mock_qdrant_client
 
-        wrapper = QdrantClientWrapper(
-            url="http://localhost:6333",
-            api_key="test-key",
-            logger=mock_logger,
-        )
+    def test_init_successful_connection(
+        self,
+        wrapper_ctor_kwargs: dict[str, object],
+        mock_logger: LoggerContract,
+        mock_qdrant_client: QdrantClient,
+        patched_qdrant: Mock,
+    ) -> None:
+        """Test successful initialization and connection."""
+        wrapper = QdrantClientWrapper(**wrapper_ctor_kwargs)
 
-        assert wrapper.url == "http://localhost:6333"
-        assert wrapper.api_key == "test-key"
+        assert wrapper.url == _CONNECT_KWARGS["url"]
+        assert wrapper.api_key == _CONNECT_KWARGS["api_key"]
         assert wrapper.logger == mock_logger
         assert wrapper.client == mock_qdrant_client
 
-        mock_client_class.assert_called_once_with(
-            url="http://localhost:6333",
-            api_key="test-key",
+        patched_qdrant.assert_called_once_with(
+            **_CONNECT_KWARGS,
+            prefer_grpc=False,
+            **_TRANSPORT_KWARGS,
         )
 
+    def test_init_reuses_client_with_same_settings(
+        self,
+        wrapper_ctor_kwargs: dict[str, object],
+        mock_qdrant_client: QdrantClient,
+        patched_qdrant: Mock,
+    ) -> None:
+        """Test that wrappers with the same settings share one client."""
+        first = QdrantClientWrapper(**wrapper_ctor_kwargs)
+        second = QdrantClientWrapper(**wrapper_ctor_kwargs)
+        other = QdrantClientWrapper(**{**wrapper_ctor_kwargs, "api_key": "other-key"})
+
+        assert second.client is first.client
+        assert other.client is mock_qdrant_client
+        assert patched_qdrant.call_count == 2
+
     def test_init_connection_failure(
         self,
+        wrapper_ctor_kwargs: dict[str, object],
         mock_logger: LoggerContract,
-        mocker: MockerFixture,
+        patched_qdrant: Mock,
     ) -> None:
         """Test initialization with connection failure."""
-        mock_client_class = mocker.patch(
-            "adapters.infrastructure.qdrant.client.QdrantClient",
-        )
-        mock_client_class.side_effect = Exception("Connection failed")
+        patched_qdrant.side_effect = Exception("Connection failed")
 
         with pytest.raises(DBConnectionError) as exc_info:
-            QdrantClientWrapper(
-                url="http://localhost:6333",
-                api_key="test-key",
-                logger=mock_logger,
-            )
+            QdrantClientWrapper(**wrapper_ctor_kwargs)
 
-        assert "Failed to connect to Qdrant at 'http://localhost:6333'" in str(
-            exc_info.value,
-        )
+        url = _CONNECT_KWARGS["url"]
+        assert f"Failed to connect to Qdrant at '{url}'" in str(exc_info.value)
         mock_logger.exception.assert_called_once()
 
     def test_init_without_api_key(
         self,
-        mock_logger: LoggerContract,
-        mock_qdrant_client: QdrantClient,
-        mocker: MockerFixture,
+        wrapper_ctor_kwargs: dict[str, object],
+        patched_qdrant: Mock,
     ) -> None:
         """Test initialization without API key."""
-        mock_client_class = mocker.patch(
-            "adapters.infrastructure.qdrant.client.QdrantClient",
-        )
-        mock_client_class.return_value = mock_qdrant_client
+        wrapper = QdrantClientWrapper(**{**wrapper_ctor_kwargs, "api_key": None})
 
-        wrapper = QdrantClientWrapper(
-            url="http://localhost:6333",
+        assert wrapper.api_key is None
+        patched_qdrant.assert_called_once_with(
+            url=_CONNECT_KWARGS["url"],
             api_key=None,
-            logger=mock_logger,
+            prefer_grpc=False,
+            **_TRANSPORT_KWARGS,
         )
 
-        assert wrapper.api_key is None
-        mock_client_class.assert_called_once_with(
-            url="http://localhost:6333",
-            api_key=None,
+    def test_init_with_grpc(
+        self,
+        wrapper_ctor_kwargs: dict[str, object],
+        patched_qdrant: Mock,
+    ) -> None:
+        """Test initialization preferring gRPC over HTTP."""
+        wrapper = QdrantClientWrapper(**wrapper_ctor_kwargs, prefer_grpc=True)
+
+        assert wrapper.prefer_grpc is True
+        patched_qdrant.assert_called_once_with(
+            **_CONNECT_KWARGS,
+            prefer_grpc=True,
+            **_TRANSPORT_KWARGS,
         )
 
     def test_get_client(
         self,
-        mock_logger: LoggerContract,
+        wrapper: QdrantClientWrapper,
         mock_qdrant_client: QdrantClient,
-        mocker: MockerFixture,
     ) -> None:
         """Test get_client method."""
-        mock_client_class = mocker.patch(
-            "adapters.infrastructure.qdrant.client.QdrantClient",
-        )
-        mock_client_class.return_value = mock_qdrant_client
-
-        wrapper = QdrantClientWrapper(
-            url="http://localhost:6333",
-            api_key="test-key",
-            logger=mock_logger,
-        )
-
         result = wrapper.get_client()
-        assert result == mock_qdrant_client
+        assert result is wrapper.client
+        assert result is mock_qdrant_client
+        assert wrapper.get_client() is wrapper.get_client()
 
     def test_create_collection_already_exists(
         self,
-        mock_logger: LoggerContract,
+        wrapper: QdrantClientWrapper,
         mock_qdrant_client: QdrantClient,
-        mocker: MockerFixture,
     ) -> None:
-        """Test create_db_collection_if_not_exists when collection already exists."""
-        # Mock collections response
-        mock_collection = mocker.Mock(spec=CollectionInfo)
-        mock_collection.name = "test-collection"
-
-        mock_collections_response = mocker.Mock(spec=CollectionsResponse)
-        mock_collections_response.collections = [mock_collection]
-
-        mock_qdrant_client.get_collections.return_value = mock_collections_response
+        """Test that an existing collection is not created again."""
+        mock_qdrant_client.collection_exists.return_value = True
 
-        mock_client_class = mocker.patch(
-            "adapters.infrastructure.qdrant.client.QdrantClient",
-        )
-        mock_client_class.return_value = mock_qdrant_client
+        wrapper.create_db_collection_if_not_exists(**_COLLECTION_KWARGS)
 
-        wrapper = QdrantClientWrapper(
-            url="http://localhost:6333",
-            api_key="test-key",
-            logger=mock_logger,
+        mock_qdrant_client.collection_exists.assert_called_once_with(
+            collection_name=_COLLECTION_NAME,
         )
-
-        wrapper.create_db_collection_if_not_exists(
-            collection_name="test-collection",
-            vector_dimensions=768,
-            vector_distance="Cosine",
-            dense_vector_name="dense",
-            sparse_vector_name="sparse",
-        )
-
-        mock_qdrant_client.get_collections.assert_called_once()
         mock_qdrant_client.create_collection.assert_not_called()
 
-    def test_create_collection_new_collection(
+    def test_create_collection_created(
         self,
-        mock_logger: LoggerContract,
+        wrapper: QdrantClientWrapper,
         mock_qdrant_client: QdrantClient,
-        mocker: MockerFixture,
+        mock_logger: LoggerContract,
     ) -> None:
-        """Test create_db_collection_if_not_exists when creating new collection."""
-        # Mock collections response (empty)
-        mock_collections_response = mocker.Mock(spec=CollectionsResponse)
-        mock_collections_response.collections = []
-
-        mock_qdrant_client.get_collections.return_value = mock_collections_response
+        """Test that a missing collection is created in a single request."""
+        mock_qdrant_client.collection_exists.return_value = False
         mock_qdrant_client.create_collection.return_value = True
 
-        mock_client_class = mocker.patch(
-            "adapters.infrastructure.qdrant.client.QdrantClient",
-        )
-        mock_client_class.return_value = mock_qdrant_client
-
-        wrapper = QdrantClientWrapper(
-            url="http://localhost:6333",
-            api_key="test-key",
-            logger=mock_logger,
-        )
-        collection_name = "new-collection"
-        vector_dimensions = 768
-        vector_distance = "Cosine"
-        dense_vector_name = "dense"
-        sparse_vector_name = "sparse"
+        wrapper.create_db_collection_if_not_exists(**_COLLECTION_KWARGS)
 
-        wrapper.create_db_collection_if_not_exists(
-            collection_name=collection_name,
-            vector_dimensions=vector_dimensions,
-            vector_distance=vector_distance,
-            dense_vector_name=dense_vector_name,
-            sparse_vector_name=sparse_vector_name,
-        )
-
-        mock_qdrant_client.get_collections.assert_called_once()
         mock_qdrant_client.create_collection.assert_called_once_with(
-            collection_name=collection_name,
-            vectors_config={
-                dense_vector_name: VectorParams(
-                    size=vector_dimensions,
-                    distance=vector_distance,
-                ),
-            },
-            sparse_vectors_config={
-                sparse_vector_name: SparseVectorParams(),
-            },
+            collection_name=_COLLECTION_NAME,
+            vectors_config=_EXPECTED_VECTORS_CONFIG,
+            sparse_vectors_config=_EXPECTED_SPARSE_VECTORS_CONFIG,
+            quantization_config=None,
+        )
+        # Dense and sparse vectors are configured in a single request
+        mock_qdrant_client.update_collection.assert_not_called()
+        mock_qdrant_client.create_payload_index.assert_not_called()
+        mock_logger.debug.assert_called_with(
+            "Collection created successfully in Qdrant",
+            context={"collection_name": _COLLECTION_NAME},
         )
 
     def test_create_collection_check_error(
         self,
-        mock_logger: LoggerContract,
+        wrapper: QdrantClientWrapper,
         mock_qdrant_client: QdrantClient,
-        mocker: MockerFixture,
+        mock_logger: LoggerContract,
     ) -> None:
-        """Test create_db_collection_if_not_exists when checking collections fails."""
-        mock_qdrant_client.get_collections.side_effect = Exception("Check failed")
+        """Test collection creation when checking the collection fails."""
+        mock_qdrant_client.collection_exists.side_effect = Exception("Check failed")
 
-        mock_client_class = mocker.patch(
-            "adapters.infrastructure.qdrant.client.QdrantClient",
-        )
-        mock_client_class.return_value = mock_qdrant_client
-
-        wrapper = QdrantClientWrapper(
-            url="http://localhost:6333",
-            api_key="test-key",
-            logger=mock_logger,
-        )
+        with pytest.raises(
+            CollectionCreationError,
+            match=f"Error checking collection '{_COLLECTION_NAME}'",
+        ):
+            wrapper.create_db_collection_if_not_exists(**_COLLECTION_KWARGS)
 
-        with pytest.raises(CollectionCreationError) as exc_info:
-            wrapper.create_db_collection_if_not_exists(
-                collection_name="test-collection",
-                vector_dimensions=768,
-                vector_distance="Cosine",
-                dense_vector_name="dense",
-                sparse_vector_name="sparse",
-            )
-
-        assert "Error checking collection 'test-collection'" in str(exc_info.value)
-        mock_logger.exception.assert_called()
+        mock_qdrant_client.create_collection.assert_not_called()
+        mock_logger.exception.assert_called_once()
 
     def test_create_collection_creation_error(
         self,
-        mock_logger: LoggerContract,
+        wrapper: QdrantClientWrapper,
         mock_qdrant_client: QdrantClient,
-        mocker: MockerFixture,
+        mock_logger: LoggerContract,
     ) -> None:
-        """Test create_db_collection_if_not_exists when collection creation fails."""
-        # Mock collections response (empty)
-        mock_collections_response = mocker.Mock(spec=CollectionsResponse)
-        mock_collections_response.collections = []
+        """Test collection creation when the client fails to create it."""
+        mock_qdrant_client.collection_exists.return_value = False
+        mock_qdrant_client.create_collection.side_effect = Exception(
+            "Creation failed",
+        )
 
-        mock_qdrant_client.get_collections.return_value = mock_collections_response
-        mock_qdrant_client.create_collection.side_effect = Exception("Creation failed")
+        with pytest.raises(
+            CollectionCreationError,
+            match=f"Error creating collection '{_COLLECTION_NAME}'",
+        ):
+            wrapper.create_db_collection_if_not_exists(**_COLLECTION_KWARGS)
 
-        mock_client_class = mocker.patch(
-            "adapters.infrastructure.qdrant.client.QdrantClient",
-        )
-        mock_client_class.return_value = mock_qdrant_client
+        mock_logger.exception.assert_called_once()
 
-        wrapper = QdrantClientWrapper(
-            url="http://localhost:6333",
-            api_key="test-key",
-            logger=mock_logger,
-        )
+    def test_create_collection_false_response(
+        self,
+        wrapper: QdrantClientWrapper,
+        mock_qdrant_client: QdrantClient,
+        mock_logger: LoggerContract,
+    ) -> None:
+        """Test collection creation when the client reports a failure."""
+        mock_qdrant_client.collection_exists.return_value = False
+        mock_qdrant_client.create_collection.return_value = False
 
-        with pytest.raises(CollectionCreationError) as exc_info:
-            wrapper.create_db_collection_if_not_exists(
-                collection_name="test-collection",
-                vector_dimensions=768,
-                vector_distance="Cosine",
-                dense_vector_name="dense",
-                sparse_vector_name="sparse",
-            )
+        with pytest.raises(
+            CollectionCreationError,
+            match=f"Failed to create collection '{_COLLECTION_NAME}'",
+        ):
+            wrapper.create_db_collection_if_not_exists(**_COLLECTION_KWARGS)
 
-        assert "Error creating collection 'test-collection'" in str(exc_info.value)
-        mock_logger.exception.assert_called()
+        mock_logger.error.assert_called_once()
 
-    def test_create_collection_creation_false_response(
+    def test_create_collection_quantized(
         self,
-        mock_logger: LoggerContract,
+        wrapper: QdrantClientWrapper,
         mock_qdrant_client: QdrantClient,
-        mocker: MockerFixture,
     ) -> None:
-        """Test create_db_collection_if_not_exists when creation returns False."""
-        # Mock collections response (empty)
-        mock_collections_response = mocker.Mock(spec=CollectionsResponse)
-        mock_collections_response.collections = []
-
-        mock_qdrant_client.get_collections.return_value = mock_collections_response
-        mock_qdrant_client.create_collection.return_value = False
+        """Test that dense vectors can be quantized to int8 on creation."""
+        mock_qdrant_client.collection_exists.return_value = False
+        mock_qdrant_client.create_collection.return_value = True
 
-        mock_client_class = mocker.patch(
-            "adapters.infrastructure.qdrant.client.QdrantClient",
+        wrapper.create_db_collection_if_not_exists(
+            **_COLLECTION_KWARGS,
+            quantize_dense=True,
         )
-        mock_client_class.return_value = mock_qdrant_client
 
-        wrapper = QdrantClientWrapper(
-            url="http://localhost:6333",
-            api_key="test-key",
-            logger=mock_logger,
+        mock_qdrant_client.create_collection.assert_called_once_with(
+            collection_name=_COLLECTION_NAME,
+            vectors_config=_EXPECTED_VECTORS_CONFIG,
+            sparse_vectors_config=_EXPECTED_SPARSE_VECTORS_CONFIG,
+            quantization_config=_INT8_QUANTIZATION,
         )
+        assert _INT8_QUANTIZATION.scalar.type == "int8"
+
+    @pytest.mark.parametrize("exists", [True, False])
+    def test_create_collection_cached_skip(
+        self,
+        wrapper: QdrantClientWrapper,
+        mock_qdrant_client: QdrantClient,
+        exists: bool,
+    ) -> None:
+        """Test that a collection known to exist is not checked again."""
+        mock_qdrant_client.collection_exists.return_value = exists
+        mock_qdrant_client.create_collection.return_value = True
+
+        wrapper.create_db_collection_if_not_exists(**_COLLECTION_KWARGS)
+        wrapper.create_db_collection_if_not_exists(**_COLLECTION_KWARGS)
 
-        with pytest.raises(CollectionCreationError) as exc_info:
-            wrapper.create_db_collection_if_not_exists(
-                collection_name="test-collection",
-                vector_dimensions=768,
-                vector_distance="Cosine",
-                dense_vector_name="dense",
-                sparse_vector_name="sparse",
-            )
-
-        assert "Failed to create collection 'test-collection'" in str(
-            exc_info.value,
+        mock_qdrant_client.collection_exists.assert_called_once_with(
+            collection_name=_COLLECTION_NAME,
         )
-        mock_logger.error.assert_called()
+        assert mock_qdrant_client.create_collection.call_count == int(not exists)
 
-    def test_create_collection_successful_creation(
+    def test_create_collection_cached_across_wrappers(
         self,
-        mock_logger: LoggerContract,
         mock_qdrant_client: QdrantClient,
-        mocker: MockerFixture,
+        wrapper_ctor_kwargs: dict[str, object],
     ) -> None:
-        """Test successful collection creation with all logging."""
-        # Mock collections response (empty)
-        mock_collections_response = mocker.Mock(spec=CollectionsResponse)
-        mock_collections_response.collections = []
+        """Test that wrappers built for each request share the known collections."""
+        mock_qdrant_client.collection_exists.return_value = True
 
-        mock_qdrant_client.get_collections.return_value = mock_collections_response
-        mock_qdrant_client.create_collection.return_value = True
+        for _ in range(2):
+            QdrantClientWrapper(
+                **wrapper_ctor_kwargs,
+            ).create_db_collection_if_not_exists(**_COLLECTION_KWARGS)
 
-        mock_client_class = mocker.patch(
-            "adapters.infrastructure.qdrant.client.QdrantClient",
-        )
-        mock_client_class.return_value = mock_qdrant_client
+        mock_qdrant_client.collection_exists.assert_called_once()
 
-        wrapper = QdrantClientWrapper(
-            url="http://localhost:6333",
-            api_key="test-key",
-            logger=mock_logger,
-        )
+    def test_create_collection_cached_by_url(
+        self,
+        mock_qdrant_client: QdrantClient,
+        mock_logger: LoggerContract,
+    ) -> None:
+        """Test that a collection known on one instance is checked on another."""
+        mock_qdrant_client.collection_exists.return_value = True
 
-        collection_name = "test-collection"
-        vector_dimensions = 768
-        vector_distance = "Cosine"
-        dense_vector_name = "dense"
-        sparse_vector_name = "sparse"
+        for url in ("http://localhost:6333", "http://other:6333"):
+            QdrantClientWrapper(
+                url=url,
+                api_key=None,
+                logger=mock_logger,
+            ).create_db_collection_if_not_exists(**_COLLECTION_KWARGS)
 
-        wrapper.create_db_collection_if_not_exists(
-            collection_name=collection_name,
-            vector_dimensions=vector_dimensions,
-            vector_distance=vector_distance,
-            dense_vector_name=dense_vector_name,
-            sparse_vector_name=sparse_vector_name,
-        )
+        assert mock_qdrant_client.collection_exists.call_count == 2
 
-        mock_qdrant_client.get_collections.assert_called_once()
-        mock_qdrant_client.create_collection.assert_called_once_with(
-            collection_name=collection_name,
-            vectors_config={
-                dense_vector_name: VectorParams(
-                    size=vector_dimensions,
-                    distance=vector_distance,
-                ),
-            },
-            sparse_vectors_config={
-                sparse_vector_name: SparseVectorParams(),
-            },
+    def test_create_collection_checks_again_after_ttl(
+        self,
+        wrapper: QdrantClientWrapper,
+        mock_qdrant_client: QdrantClient,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that a collection is checked again once the TTL has elapsed."""
+        mocker.patch(
+            "adapters.infrastructure.qdrant.client.monotonic",
+            side_effect=[100.0, 160.0, 160.0],
         )
+        mock_qdrant_client.collection_exists.return_value = True
 
-        mock_logger.debug.assert_called_with(
-            "Collection created successfully in Qdrant",
-            context={"collection_name": "test-collection"},
-        )
+        wrapper.create_db_collection_if_not_exists(**_COLLECTION_KWARGS)
+        wrapper.create_db_collection_if_not_exists(**_COLLECTION_KWARGS)
+
+        assert mock_qdrant_client.collection_exists.call_count == 2
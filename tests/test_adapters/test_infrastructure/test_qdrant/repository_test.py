@@ -1,18 +1,24 @@
 """Test module for Qdrant repository implementation."""
 
-from uuid import UUID
+from collections.abc import Generator
+from dataclasses import replace
+from uuid import UUID, uuid4
 
 import pytest
 from logger import LoggerContract
 from pydantic import ValidationError as PydanticValidationError
 from pytest_mock import MockerFixture
 from qdrant_client import QdrantClient
+from qdrant_client.http.models import QueryResponse
 from qdrant_client.models import (
     NamedSparseVector,
     NamedVector,
-    QueryResponse,
+    OverwritePayloadOperation,
+    Record,
     ScoredPoint,
+    SetPayload,
     UpdateResult,
+    UpsertOperation,
 )
 from qdrant_client.models import (
     SparseVector as QdrantSparseVector,
@@ -36,6 +42,13 @@ from domain.types.vectors import DenseVector, SparseVector, VectorName
 class TestQdrantRepository:
     """Test class for QdrantRepository."""
 
+    @pytest.fixture(autouse=True)
+    def clear_filters_cache(self) -> Generator[None]:
+        """Clear the cached filter translations so each test starts empty."""
+        QdrantRepository._build_cached_search_filters.cache_clear()
+        yield
+        QdrantRepository._build_cached_search_filters.cache_clear()
+
     @pytest.fixture
     def mock_client(self, mocker: MockerFixture) -> QdrantClient:
         """Create mock Qdrant client."""
@@ -147,6 +160,11 @@ class TestQdrantRepository:
             points=mocker.ANY,
         )
 
+        # Verify the payload only holds JSON-compatible values
+        point = mock_client.upsert.call_args.kwargs["points"][0]
+        assert type(point.payload["lang"]) is str
+        assert type(point.payload["provider"]) is str
+
         # Verify logging
         mock_logger.info.assert_called_once_with(
             "Entity created",
@@ -188,6 +206,77 @@ class TestQdrantRepository:
         assert "invalid response status" in str(exc_info.value)
         mock_logger.error.assert_called_once()
 
+    def test_create_entities_success(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        create_entity_model: CreateEntityModel,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test creation of several entities with a single upsert."""
+        mock_response = mocker.Mock(spec=UpdateResult)
+        mock_response.status = "completed"
+        mock_client.upsert.return_value = mock_response
+        models = [create_entity_model] * 3
+
+        result = repository.create_entities(models)
+
+        assert len(result) == len(models)
+        assert len({entity.identifier for entity in result}) == len(models)
+        assert all(
+            entity.competency == create_entity_model.competency for entity in result
+        )
+
+        mock_client.upsert.assert_called_once_with(
+            collection_name="test-collection",
+            points=mocker.ANY,
+        )
+        points = mock_client.upsert.call_args.kwargs["points"]
+        assert len(points) == len(models)
+        assert [point.id for point in points] == [str(e.identifier) for e in result]
+
+    def test_create_entities_empty(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+    ) -> None:
+        """Test that creating no entities does not call Qdrant."""
+        assert repository.create_entities([]) == []
+        mock_client.upsert.assert_not_called()
+
+    def test_create_entities_client_error(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        mock_logger: LoggerContract,
+        create_entity_model: CreateEntityModel,
+    ) -> None:
+        """Test creation of several entities with client error."""
+        mock_client.upsert.side_effect = Exception("Client error")
+
+        with pytest.raises(RepositoryError, match="Failed to create entities"):
+            repository.create_entities([create_entity_model])
+
+        mock_logger.exception.assert_called_once()
+
+    def test_create_entities_invalid_status(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        mock_logger: LoggerContract,
+        create_entity_model: CreateEntityModel,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test creation of several entities with invalid status response."""
+        mock_response = mocker.Mock(spec=UpdateResult)
+        mock_response.status = "failed"
+        mock_client.upsert.return_value = mock_response
+
+        with pytest.raises(RepositoryError, match="invalid response status"):
+            repository.create_entities([create_entity_model])
+
+        mock_logger.error.assert_called_once()
+
     # Get
     def test_get_entity_success(
         self,
@@ -210,7 +299,7 @@ class TestQdrantRepository:
 
         mock_client.retrieve.return_value = [mock_point]
 
-        result = repository.get_entity(entity_id)
+        result = repository.get_entity(entity_id, include_vectors=True)
 
         assert isinstance(result, Entity)
         assert result.identifier == entity_id
@@ -225,6 +314,29 @@ class TestQdrantRepository:
             with_vectors=True,
         )
 
+    def test_get_entity_skips_payload_validation(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        sample_competency: Competency,
+        sample_identifier: Identifier,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that stored payloads are rebuilt without validation."""
+        mock_point = mocker.Mock(spec=object)
+        mock_point.payload = sample_competency.model_dump(mode="json")
+        mock_client.retrieve.return_value = [mock_point]
+        construct_spy = mocker.spy(Competency, "model_construct")
+        validate_spy = mocker.spy(Competency, "model_validate")
+
+        result = repository.get_entity(sample_identifier, include_vectors=False)
+
+        construct_spy.assert_called_once()
+        validate_spy.assert_not_called()
+        # Enum fields are restored from their stored JSON values
+        assert result.competency == sample_competency
+        assert type(result.competency.lang) is type(sample_competency.lang)
+
     def test_get_entity_success_qdrant_sparse_vector(
         self,
         repository: QdrantRepository,
@@ -246,7 +358,7 @@ class TestQdrantRepository:
 
         mock_client.retrieve.return_value = [mock_point]
 
-        result = repository.get_entity(entity_id)
+        result = repository.get_entity(entity_id, include_vectors=True)
 
         assert isinstance(result, Entity)
         assert result.identifier == entity_id
@@ -261,6 +373,62 @@ class TestQdrantRepository:
             with_vectors=True,
         )
 
+    def test_get_entity_no_vectors_skips_transfer(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        sample_competency: Competency,
+        sample_identifier: Identifier,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that entities are retrieved without their vectors by default."""
+        mock_point = mocker.Mock(spec=object)
+        mock_point.payload = sample_competency.model_dump()
+        mock_point.vector = None
+
+        mock_client.retrieve.return_value = [mock_point]
+
+        result = repository.get_entity(sample_identifier)
+
+        assert isinstance(result, Entity)
+        assert result.identifier == sample_identifier
+        assert result.competency == sample_competency
+        assert result.dense_vector is None
+        assert result.sparse_vector is None
+
+        mock_client.retrieve.assert_called_once_with(
+            collection_name="test-collection",
+            ids=[str(sample_identifier)],
+            with_payload=True,
+            with_vectors=False,
+        )
+
+    @pytest.mark.parametrize("missing", ["title", "code", "lang"])
+    def test_get_entity_malformed_payload(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        mock_logger: LoggerContract,
+        sample_competency: Competency,
+        sample_identifier: Identifier,
+        missing: str,
+    ) -> None:
+        """Test that a payload missing a required field raises RepositoryError."""
+        payload = sample_competency.model_dump(mode="json")
+        del payload[missing]
+        mock_client.retrieve.return_value = [
+            Record(id=str(sample_identifier), payload=payload),
+        ]
+
+        with pytest.raises(RepositoryError, match=f"missing {missing}") as exc_info:
+            repository.get_entity(sample_identifier)
+
+        assert str(sample_identifier) in str(exc_info.value)
+        mock_logger.error.assert_called_once_with(
+            "Malformed entity payload",
+            context={"id": sample_identifier, "missing": [missing]},
+        )
+
     def test_get_entity_not_found(
         self,
         repository: QdrantRepository,
@@ -313,11 +481,71 @@ class TestQdrantRepository:
         assert result.competency == update_entity_model.competency
 
         mock_client.upsert.assert_called_once()
+        mock_client.overwrite_payload.assert_not_called()
         mock_logger.info.assert_called_with(
             "Entity updated successfully",
             context={"id": update_entity_model.identifier},
         )
 
+    def test_update_entity_dumps_competency_once(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        update_entity_model: UpdateEntityModel,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that the competency is dumped once and reused as is."""
+        dump_spy = mocker.spy(Competency, "model_dump")
+
+        result = repository.update_entity(update_entity_model)
+
+        assert result.competency is update_entity_model.competency
+        dump_spy.assert_called_once()
+        point = mock_client.upsert.call_args.kwargs["points"][0]
+        assert point.payload == dump_spy.spy_return
+
+    def test_update_entity_without_vectors(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        sample_identifier: Identifier,
+        sample_competency: Competency,
+    ) -> None:
+        """Test entity update keeping the stored vectors."""
+        model = UpdateEntityModel(
+            identifier=sample_identifier,
+            competency=sample_competency,
+        )
+
+        result = repository.update_entity(model)
+
+        assert result.identifier == sample_identifier
+        assert result.competency == sample_competency
+
+        mock_client.upsert.assert_not_called()
+        mock_client.overwrite_payload.assert_called_once_with(
+            collection_name="test-collection",
+            payload=sample_competency.model_dump(mode="json", exclude_none=True),
+            points=[str(sample_identifier)],
+        )
+
+    @pytest.mark.parametrize("missing", ["dense_vector", "sparse_vector"])
+    def test_update_entity_one_vector_missing(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        update_entity_model: UpdateEntityModel,
+        missing: str,
+    ) -> None:
+        """Test that an entity given with only one of its vectors is rejected."""
+        model = replace(update_entity_model, **{missing: None})
+
+        with pytest.raises(ValidationError, match="must be given together"):
+            repository.update_entity(model)
+
+        mock_client.upsert.assert_not_called()
+        mock_client.overwrite_payload.assert_not_called()
+
     def test_update_entity_client_error(
         self,
         repository: QdrantRepository,
@@ -334,6 +562,108 @@ class TestQdrantRepository:
         assert "Failed to update entity" in str(exc_info.value)
         mock_logger.exception.assert_called_once()
 
+    def test_update_entities_success(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        update_entity_model: UpdateEntityModel,
+    ) -> None:
+        """Test update of several entities with a single upsert."""
+        models = [update_entity_model] * 3
+
+        result = repository.update_entities(models)
+
+        assert [entity.identifier for entity in result] == [
+            model.identifier for model in models
+        ]
+
+        mock_client.batch_update_points.assert_called_once()
+        call_kwargs = mock_client.batch_update_points.call_args.kwargs
+        assert call_kwargs["collection_name"] == "test-collection"
+        [operation] = call_kwargs["update_operations"]
+        assert isinstance(operation, UpsertOperation)
+        assert len(operation.upsert.points) == len(models)
+        mock_client.upsert.assert_not_called()
+        mock_client.overwrite_payload.assert_not_called()
+
+    def test_update_entities_without_vectors(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        update_entity_model: UpdateEntityModel,
+        sample_competency: Competency,
+    ) -> None:
+        """Test that entities without vectors keep their stored vectors."""
+        without_vectors = [
+            UpdateEntityModel(identifier=uuid4(), competency=sample_competency)
+            for _ in range(2)
+        ]
+
+        result = repository.update_entities([update_entity_model, *without_vectors])
+
+        assert len(result) == 3
+        mock_client.batch_update_points.assert_called_once()
+        upsert, *overwrites = mock_client.batch_update_points.call_args.kwargs[
+            "update_operations"
+        ]
+        assert [point.id for point in upsert.upsert.points] == [
+            str(update_entity_model.identifier),
+        ]
+        assert overwrites == [
+            OverwritePayloadOperation(
+                overwrite_payload=SetPayload(
+                    payload=sample_competency.model_dump(
+                        mode="json",
+                        exclude_none=True,
+                    ),
+                    points=[str(model.identifier)],
+                ),
+            )
+            for model in without_vectors
+        ]
+        mock_client.overwrite_payload.assert_not_called()
+
+    @pytest.mark.parametrize("missing", ["dense_vector", "sparse_vector"])
+    def test_update_entities_one_vector_missing(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        update_entity_model: UpdateEntityModel,
+        missing: str,
+    ) -> None:
+        """Test that an entity given with only one of its vectors is rejected."""
+        model = replace(update_entity_model, **{missing: None})
+
+        with pytest.raises(ValidationError, match="must be given together"):
+            repository.update_entities([update_entity_model, model])
+
+        mock_client.batch_update_points.assert_not_called()
+
+    def test_update_entities_empty(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+    ) -> None:
+        """Test that updating no entities sends no request."""
+        assert repository.update_entities([]) == []
+
+        mock_client.batch_update_points.assert_not_called()
+
+    def test_update_entities_client_error(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        mock_logger: LoggerContract,
+        update_entity_model: UpdateEntityModel,
+    ) -> None:
+        """Test update of several entities with client error."""
+        mock_client.batch_update_points.side_effect = Exception("Update error")
+
+        with pytest.raises(RepositoryError, match="Failed to update entities"):
+            repository.update_entities([update_entity_model])
+
+        mock_logger.exception.assert_called_once()
+
     # Delete
     def test_delete_entity_success(
         self,
@@ -409,6 +739,34 @@ class TestQdrantRepository:
         for call_args in mock_client.search.call_args_list:
             query_vector = call_args.kwargs.get("query_vector")
             assert isinstance(query_vector, NamedVector)
+            assert call_args.kwargs.get("with_vectors") is False
+
+    def test_search_by_vector_malformed_payload(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        mock_logger: LoggerContract,
+        sample_dense_vector: DenseVector,
+        returned_scored_point: ScoredPoint,
+    ) -> None:
+        """Test that a found payload with an invalid enum raises RepositoryError."""
+        returned_scored_point.payload["type"] = "unknown"
+        mock_client.search.return_value = [returned_scored_point]
+
+        with pytest.raises(RepositoryError, match="unknown") as exc_info:
+            repository.search_by_vector_and_filters(
+                vector=sample_dense_vector,
+                filters=[],
+                top=10,
+                vector_name=VectorName.DENSE,
+            )
+
+        assert returned_scored_point.id in str(exc_info.value)
+        mock_logger.exception.assert_called_once_with(
+            "Malformed entity payload",
+            context={"id": returned_scored_point.id},
+            exc=exc_info.value.__cause__,
+        )
 
     def test_search_by_vector_sparse(
         self,
@@ -600,6 +958,68 @@ class TestQdrantRepository:
                 vector_name=VectorName.SPARSE,
             )
 
+    # Search Batch
+    def test_search_batch_issues_one_call(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        sample_dense_vector: DenseVector,
+        returned_scored_point: ScoredPoint,
+    ) -> None:
+        """Test that a batch of searches is sent in a single request."""
+        vectors = [sample_dense_vector] * 10
+        mock_client.search_batch.return_value = [[returned_scored_point]] * 10
+
+        results = repository.search_batch_by_vectors_and_filters(
+            vectors=vectors,
+            filters=[],
+            top=5,
+        )
+
+        assert len(results) == len(vectors)
+        for result in results:
+            assert [r.entity.identifier for r in result] == [
+                Identifier(returned_scored_point.id),
+            ]
+
+        mock_client.search.assert_not_called()
+        mock_client.search_batch.assert_called_once()
+        requests = mock_client.search_batch.call_args.kwargs["requests"]
+        assert len(requests) == len(vectors)
+        for request in requests:
+            assert isinstance(request.vector, NamedVector)
+            assert request.limit == 5
+            assert request.with_vector is False
+
+    def test_search_batch_empty(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+    ) -> None:
+        """Test that an empty batch does not call Qdrant."""
+        assert repository.search_batch_by_vectors_and_filters([], [], 5) == []
+        mock_client.search_batch.assert_not_called()
+
+    def test_search_batch_client_error(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        mock_logger: LoggerContract,
+        sample_sparse_vector: SparseVector,
+    ) -> None:
+        """Test batch search with client error."""
+        mock_client.search_batch.side_effect = Exception("Search error")
+
+        with pytest.raises(RepositoryError, match="Failed search_batch_by_vectors"):
+            repository.search_batch_by_vectors_and_filters(
+                vectors=[sample_sparse_vector],
+                filters=[],
+                top=5,
+                vector_name=VectorName.SPARSE,
+            )
+
+        mock_logger.exception.assert_called_once()
+
     # Search Hybrid
     def test_search_hybrid_success(
         self,
@@ -626,8 +1046,11 @@ class TestQdrantRepository:
         assert isinstance(result[0], SearchResult)
         assert result[0].entity.identifier == Identifier(returned_scored_point.id)
         assert result[0].score == returned_scored_point.score
+        assert result[0].entity.dense_vector is None
+        assert result[0].entity.sparse_vector is None
 
         mock_client.query_points.assert_called_once()
+        assert mock_client.query_points.call_args.kwargs.get("with_vectors") is False
 
     def test_search_hybrid_client_error(
         self,
@@ -719,6 +1142,33 @@ class TestQdrantRepository:
         mock_client.query_points.assert_not_called()
 
     # Build Search
+    def test_empty_filters_skips_builder(
+        self,
+        repository: QdrantRepository,
+        mock_client: QdrantClient,
+        sample_dense_vector: DenseVector,
+        sample_sparse_vector: SparseVector,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that searches without filters send no filter to Qdrant."""
+        build_filters = mocker.patch.object(repository, "_build_search_filters")
+        mock_client.search.return_value = []
+        mock_client.query_points.return_value = QueryResponse(points=[])
+
+        repository.search_by_vector_and_filters(sample_dense_vector, [], 10)
+        repository.search_hybrid_by_vectors_and_filters(
+            sample_dense_vector,
+            sample_sparse_vector,
+            [],
+            10,
+        )
+
+        build_filters.assert_not_called()
+        assert mock_client.search.call_args.kwargs["query_filter"] is None
+        query_kwargs = mock_client.query_points.call_args.kwargs
+        assert query_kwargs["query_filter"] is None
+        assert all(prefetch.filter is None for prefetch in query_kwargs["prefetch"])
+
     def test_build_search_filters_empty(self, repository: QdrantRepository) -> None:
         """Test building search filters with empty list."""
         result = repository._build_search_filters([])
@@ -795,6 +1245,96 @@ class TestQdrantRepository:
         assert result.must_not is not None
         assert len(result.must_not) == 1  # NOT_EQUAL
 
+    def test_build_search_filters_cached(
+        self,
+        repository: QdrantRepository,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that identical filter sets are only translated once."""
+        filters = [
+            DomainFilter(
+                field="provider",
+                value="esco",
+                operator=DomainFilterOperator.EQUAL,
+            ),
+            DomainFilter(
+                field="lang",
+                value=["fr", "en"],
+                operator=DomainFilterOperator.IN,
+            ),
+        ]
+        spy = mocker.spy(QdrantRepository, "_translate_search_filters")
+
+        first = repository._build_search_filters(filters)
+        second = repository._build_search_filters(list(filters))
+
+        assert second is first
+        assert first.must[1].match.any == ["fr", "en"]
+        assert spy.call_count == 1
+
+    def test_build_search_filters_cached_by_value_type(
+        self,
+        repository: QdrantRepository,
+    ) -> None:
+        """Test that equal values of different types are not cached together."""
+        values = [True, 1]
+
+        results = [
+            repository._build_search_filters(
+                [
+                    DomainFilter(
+                        field="level",
+                        value=value,
+                        operator=DomainFilterOperator.EQUAL,
+                    ),
+                ],
+            )
+            for value in values
+        ]
+
+        for result, value in zip(results, values, strict=True):
+            assert type(result.must[0].match.value) is type(value)
+
+    def test_build_search_filters_translation_error(
+        self,
+        repository: QdrantRepository,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that errors raised by the translation itself are not swallowed."""
+        mocker.patch.object(
+            QdrantRepository,
+            "_translate_search_filters",
+            side_effect=TypeError("Translation failed"),
+        )
+        filters = [
+            DomainFilter(
+                field="provider",
+                value="esco",
+                operator=DomainFilterOperator.EQUAL,
+            ),
+        ]
+
+        with pytest.raises(TypeError, match="Translation failed"):
+            repository._build_search_filters(filters)
+
+    def test_build_search_filters_unhashable_value(
+        self,
+        repository: QdrantRepository,
+    ) -> None:
+        """Test building search filters with values that cannot be cached."""
+        filters = [
+            DomainFilter(
+                field="category",
+                value={"PROGRAMMING"},
+                operator=DomainFilterOperator.NOT_IN,
+            ),
+        ]
+
+        result = repository._build_search_filters(filters)
+
+        assert result.must is None
+        assert result.must_not[0].match.any == ["PROGRAMMING"]
+
     # Create Field Condition
     def test_create_field_condition_equal(self) -> None:
         """Test creating field condition with equal operator."""
@@ -0,0 +1,58 @@
+"""Test module for the abstract methods shared by all the domain contracts."""
+
+from abc import ABCMeta
+
+import pytest
+
+from domain.contracts.db_client import ClientWrapperContract
+from domain.contracts.embedding_service import EmbeddingServiceContract
+from domain.contracts.repository import RepositoryContract
+from domain.contracts.sparse_embedding_service import SparseEmbeddingServiceContract
+
+_CLIENT_WRAPPER_ABSTRACTS = frozenset(
+    {"create_db_collection_if_not_exists", "get_client"},
+)
+_ENCODER_ABSTRACTS = frozenset({"encode"})
+_REPOSITORY_ABSTRACTS = frozenset(
+    {
+        "create_entity",
+        "get_entity",
+        "update_entity",
+        "delete_entity",
+        "search_by_vector_and_filters",
+        "search_hybrid_by_vectors_and_filters",
+    },
+)
+
+
+@pytest.mark.parametrize(
+    ("contract", "abstract_methods"),
+    [
+        pytest.param(
+            ClientWrapperContract,
+            _CLIENT_WRAPPER_ABSTRACTS,
+            id="client-wrapper",
+        ),
+        pytest.param(
+            EmbeddingServiceContract,
+            _ENCODER_ABSTRACTS,
+            id="embedding-service",
+        ),
+        pytest.param(RepositoryContract, _REPOSITORY_ABSTRACTS, id="repository"),
+        pytest.param(
+            SparseEmbeddingServiceContract,
+            _ENCODER_ABSTRACTS,
+            id="sparse-embedding-service",
+        ),
+    ],
+)
+def test_contract_is_abstract(
+    contract: ABCMeta,
+    abstract_methods: frozenset[str],
+) -> None:
+    """Test that a contract is abstract and cannot be instantiated directly."""
+    assert isinstance(contract, ABCMeta)
+    assert contract.__abstractmethods__ == abstract_methods
+
+    with pytest.raises(TypeError):
+        contract()
@@ -19,6 +19,7 @@ from domain.types.search_type import SearchType
 from domain.types.service_models import (
     CreateEntityModel,
     SearchResult,
+    UpdateEntityModel,
 )
 from domain.types.vectors import DenseVector, SparseVector
 
@@ -26,6 +27,20 @@ from domain.types.vectors import DenseVector, SparseVector
 class TestEntityService:
     """Test class for EntityService."""
 
+    @pytest.fixture
+    def service(
+        self,
+        mock_repository: RepositoryContract,
+        mock_embedding_service: EmbeddingServiceContract,
+        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
+    ) -> EntityService:
+        """Entity service wired to the mock repository and encoders."""
+        return EntityService(
+            mock_repository,
+            mock_embedding_service,
+            mock_sparse_embedding_service,
+        )
+
     # Init
     def test_entity_service_initialization(
         self,
@@ -44,46 +59,40 @@ class TestEntityService:
         assert service.dense_embedding_service == mock_embedding_service
         assert service.sparse_embedding_service == mock_sparse_embedding_service
 
+    @pytest.mark.parametrize(
+        "given",
+        [
+            (),
+            ("repository",),
+            ("dense_embedding_service",),
+            ("sparse_embedding_service",),
+            ("repository", "dense_embedding_service"),
+            ("repository", "sparse_embedding_service"),
+            ("dense_embedding_service", "sparse_embedding_service"),
+        ],
+        ids=lambda given: "+".join(given) or "none",
+    )
     def test_entity_service_initialization_missing_input_variables(
         self,
         mock_repository: RepositoryContract,
         mock_embedding_service: EmbeddingServiceContract,
         mock_sparse_embedding_service: SparseEmbeddingServiceContract,
+        given: tuple[str, ...],
     ) -> None:
         """Test EntityService initialization missing input variables."""
-        with pytest.raises(TypeError):
-            EntityService()
-
-        with pytest.raises(TypeError):
-            EntityService(repository=mock_repository)
-
-        with pytest.raises(TypeError):
-            EntityService(dense_embedding_service=mock_embedding_service)
-
-        with pytest.raises(TypeError):
-            EntityService(sparse_embedding_service=mock_sparse_embedding_service)
-
-        with pytest.raises(TypeError):
-            EntityService(
-                repository=mock_repository,
-                dense_embedding_service=mock_embedding_service,
-            )
+        dependencies = {
+            "repository": mock_repository,
+            "dense_embedding_service": mock_embedding_service,
+            "sparse_embedding_service": mock_sparse_embedding_service,
+        }
 
         with pytest.raises(TypeError):
-            EntityService(
-                repository=mock_repository,
-                sparse_embedding_service=mock_sparse_embedding_service,
-            )
-
-        with pytest.raises(TypeError):
-            EntityService(
-                dense_embedding_service=mock_embedding_service,
-                sparse_embedding_service=mock_sparse_embedding_service,
-            )
+            EntityService(**{name: dependencies[name] for name in given})
 
     # Create Entity
     def test_create_entity_success(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
         mock_embedding_service: EmbeddingServiceContract,
         mock_sparse_embedding_service: SparseEmbeddingServiceContract,
@@ -98,11 +107,6 @@ class TestEntityService:
         mock_repository.create_entity.return_value = sample_entity
 
         # Execute
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
         result = service.create_entity(sample_entity.competency, text)
         expected_output_model = CreateEntityModel(
             competency=sample_entity.competency,
@@ -120,31 +124,19 @@ class TestEntityService:
             model=expected_output_model,
         )
 
+    @pytest.mark.parametrize("text", ["", None, "   "])
     def test_create_entity_empty_text_validation(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
         mock_embedding_service: EmbeddingServiceContract,
         mock_sparse_embedding_service: SparseEmbeddingServiceContract,
         sample_competency: Competency,
+        text: str | None,
     ) -> None:
         """Test ValidationError for empty text."""
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
-        # Test with empty string
-        with pytest.raises(ValidationError):
-            service.create_entity(sample_competency, "")
-
-        # Test with None
-        with pytest.raises(ValidationError):
-            service.create_entity(sample_competency, None)
-
-        # Test with whitespace only
         with pytest.raises(ValidationError):
-            service.create_entity(sample_competency, "   ")
+            service.create_entity(sample_competency, text)
 
         # Verify embedding service was not called
         mock_embedding_service.encode.assert_not_called()
@@ -153,9 +145,9 @@ class TestEntityService:
 
     def test_create_entity_encoding_error(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
         mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
         sample_competency: Competency,
     ) -> None:
         """Test EmbeddingError when encoding fails."""
@@ -164,12 +156,6 @@ class TestEntityService:
         # Setup encoding error
         mock_embedding_service.encode.side_effect = Exception("Encoding failed")
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
         # Should raise EmbeddingError
         with pytest.raises(EmbeddingError):
             service.create_entity(sample_competency, text)
@@ -181,67 +167,69 @@ class TestEntityService:
     # Get Entity
     def test_get_entity_success(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
         sample_entity: Entity,
     ) -> None:
         """Test successful entity retrieval."""
         mock_repository.get_entity.return_value = sample_entity
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
         result = service.get_entity(sample_entity.identifier)
 
         assert result == sample_entity
         mock_repository.get_entity.assert_called_once_with(
             identifier=sample_entity.identifier,
+            include_vectors=False,
+        )
+
+    def test_get_entity_with_vectors(
+        self,
+        service: EntityService,
+        mock_repository: RepositoryContract,
+        sample_entity: Entity,
+    ) -> None:
+        """Test entity retrieval with its vectors."""
+        mock_repository.get_entity.return_value = sample_entity
+
+        service.get_entity(sample_entity.identifier, include_vectors=True)
+
+        mock_repository.get_entity.assert_called_once_with(
+            identifier=sample_entity.identifier,
+            include_vectors=True,
         )
 
     def test_get_entity_not_found(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
     ) -> None:
         """Test EntityNotFoundError when entity doesn't exist."""
         identifier = uuid4()
         mock_repository.get_entity.return_value = None
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
         with pytest.raises(EntityNotFoundError):
             service.get_entity(identifier)
 
-        mock_repository.get_entity.assert_called_once_with(identifier=identifier)
+        mock_repository.get_entity.assert_called_once_with(
+            identifier=identifier,
+            include_vectors=False,
+        )
 
     # Delete Entity
     def test_delete_entity_success(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
         sample_entity: Entity,
     ) -> None:
         """Test successful entity deletion."""
         mock_repository.get_entity.return_value = sample_entity
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
         service.delete_entity(sample_entity.identifier)
 
         mock_repository.get_entity.assert_called_once_with(
             identifier=sample_entity.identifier,
+            include_vectors=False,
         )
         mock_repository.delete_entity.assert_called_once_with(
             identifier=sample_entity.identifier,
@@ -249,20 +237,13 @@ class TestEntityService:
 
     def test_delete_entity_not_found(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
     ) -> None:
         """Test deleting non-existent entity."""
         identifier = uuid4()
         mock_repository.get_entity.return_value = None
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
         with pytest.raises(EntityNotFoundError):
             service.delete_entity(identifier)
 
@@ -272,6 +253,7 @@ class TestEntityService:
     # Update Entity
     def test_update_entity_success(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
         mock_embedding_service: EmbeddingServiceContract,
         mock_sparse_embedding_service: SparseEmbeddingServiceContract,
@@ -299,21 +281,27 @@ class TestEntityService:
         mock_sparse_embedding_service.encode.return_value = sample_sparse_vector
         mock_repository.update_entity.return_value = updated_entity
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
         result = service.update_entity(identifier, sample_competency, new_text)
 
         assert result == updated_entity
-        mock_repository.get_entity.assert_called_once_with(identifier=identifier)
+        mock_repository.get_entity.assert_called_once_with(
+            identifier=identifier,
+            include_vectors=False,
+        )
         mock_embedding_service.encode.assert_called_once_with(text=new_text)
         mock_sparse_embedding_service.encode.assert_called_once_with(text=new_text)
-        mock_repository.update_entity.assert_called_once()
+        mock_repository.update_entity.assert_called_once_with(
+            model=UpdateEntityModel(
+                identifier=identifier,
+                competency=sample_competency,
+                dense_vector=sample_dense_vector,
+                sparse_vector=sample_sparse_vector,
+            ),
+        )
 
     def test_update_entity_no_text_reuse_vectors(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
         mock_embedding_service: EmbeddingServiceContract,
         mock_sparse_embedding_service: SparseEmbeddingServiceContract,
@@ -326,158 +314,154 @@ class TestEntityService:
         mock_repository.get_entity.return_value = sample_entity
         mock_repository.update_entity.return_value = sample_entity
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
         result = service.update_entity(identifier, sample_competency, None)
 
         assert result == sample_entity
-        mock_repository.get_entity.assert_called_once_with(identifier=identifier)
+        mock_repository.get_entity.assert_called_once_with(
+            identifier=identifier,
+            include_vectors=False,
+        )
         mock_embedding_service.encode.assert_not_called()
         mock_sparse_embedding_service.encode.assert_not_called()
-        mock_repository.update_entity.assert_called_once()
+        mock_repository.update_entity.assert_called_once_with(
+            model=UpdateEntityModel(
+                identifier=identifier,
+                competency=sample_competency,
+            ),
+        )
 
-    def test_update_entity_empty_text_validation(
+    def test_update_entity_same_text_keeps_vectors(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
         mock_embedding_service: EmbeddingServiceContract,
         mock_sparse_embedding_service: SparseEmbeddingServiceContract,
         sample_entity: Entity,
         sample_competency: Competency,
     ) -> None:
-        """Test ValidationError for empty text in update."""
+        """Test entity update with unchanged text keeps the stored vectors."""
         identifier = uuid4()
+        text = "Indexed text"
+        sample_entity.competency.indexed_text = text
 
         mock_repository.get_entity.return_value = sample_entity
+        mock_repository.update_entity.return_value = sample_entity
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
-        with pytest.raises(ValidationError):
-            service.update_entity(identifier, sample_competency, "")
+        service.update_entity(identifier, sample_competency, text)
 
-        with pytest.raises(ValidationError):
-            service.update_entity(identifier, sample_competency, "   ")
+        mock_embedding_service.encode.assert_not_called()
+        mock_sparse_embedding_service.encode.assert_not_called()
+        model = mock_repository.update_entity.call_args.kwargs["model"]
+        assert model.dense_vector is None
+        assert model.sparse_vector is None
 
-    def test_update_entity_encoding_error(
+    @pytest.mark.parametrize("text", ["", "   "])
+    def test_update_entity_empty_text_validation(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
         sample_entity: Entity,
         sample_competency: Competency,
+        text: str,
     ) -> None:
-        """Test EmbeddingError during update."""
-        identifier = uuid4()
-        new_text = "Updated text"
-
+        """Test ValidationError for empty text in update."""
         mock_repository.get_entity.return_value = sample_entity
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
-        mock_sparse_embedding_service.encode.side_effect = Exception(
-            "Sparse encoding failed",
-        )
-        with pytest.raises(EmbeddingError):
-            service.update_entity(identifier, sample_competency, new_text)
-
-        mock_embedding_service.encode.side_effect = Exception("Encoding failed")
-        with pytest.raises(EmbeddingError):
-            service.update_entity(identifier, sample_competency, new_text)
+        with pytest.raises(ValidationError):
+            service.update_entity(uuid4(), sample_competency, text)
 
-    # Search
-    # NOTE: J'en suis ICI
-    def test_search_by_text_semantic(
+    @pytest.mark.parametrize(
+        "failing_encoder",
+        ["mock_embedding_service", "mock_sparse_embedding_service"],
+    )
+    def test_update_entity_encoding_error(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
-        sample_dense_vector: DenseVector,
-        sample_search_result: SearchResult,
+        request: pytest.FixtureRequest,
+        sample_entity: Entity,
+        sample_competency: Competency,
+        failing_encoder: str,
     ) -> None:
-        """Test semantic search."""
-        text = "search text"
-        filters = []
-        top = 10
-
-        mock_embedding_service.encode.return_value = sample_dense_vector
-        mock_repository.search_by_vector_and_filters.return_value = [
-            sample_search_result,
-        ]
-
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
-        result = service.search_by_text_and_filters_with_type(
-            text=text,
-            filters=filters,
-            top=top,
-            search_type=SearchType.SEMANTIC,
+        """Test EmbeddingError when either encoder fails during update."""
+        mock_repository.get_entity.return_value = sample_entity
+        request.getfixturevalue(failing_encoder).encode.side_effect = Exception(
+            "Encoding failed",
         )
 
-        assert result == [sample_search_result]
-        mock_embedding_service.encode.assert_called_once_with(text)
-        mock_repository.search_by_vector_and_filters.assert_called_once_with(
-            vector=sample_dense_vector,
-            filters=filters,
-            top=top,
-            vector_name="dense",
-        )
+        with pytest.raises(EmbeddingError, match="Encoding error"):
+            service.update_entity(uuid4(), sample_competency, "Updated text")
+        mock_repository.update_entity.assert_not_called()
 
-    def test_search_by_text_sparse(
+    # Search
+    # NOTE: J'en suis ICI
+    @pytest.mark.parametrize(
+        ("search_type", "used_encoder", "unused_encoder", "vector", "vector_name"),
+        [
+            pytest.param(
+                SearchType.SEMANTIC,
+                "mock_embedding_service",
+                "mock_sparse_embedding_service",
+                "sample_dense_vector",
+                "dense",
+                id="semantic",
+            ),
+            pytest.param(
+                SearchType.SPARSE,
+                "mock_sparse_embedding_service",
+                "mock_embedding_service",
+                "sample_sparse_vector",
+                "sparse",
+                id="sparse",
+            ),
+        ],
+    )
+    def test_search_by_text_single_vector(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
-        sample_sparse_vector: SparseVector,
+        request: pytest.FixtureRequest,
         sample_search_result: SearchResult,
+        search_type: SearchType,
+        used_encoder: str,
+        unused_encoder: str,
+        vector: str,
+        vector_name: str,
     ) -> None:
-        """Test sparse search."""
+        """Test that a single vector search encodes and searches with its vector."""
         text = "search text"
         filters = []
         top = 10
 
-        mock_sparse_embedding_service.encode.return_value = sample_sparse_vector
+        used = request.getfixturevalue(used_encoder)
+        unused = request.getfixturevalue(unused_encoder)
+        query_vector = request.getfixturevalue(vector)
+        used.encode.return_value = query_vector
         mock_repository.search_by_vector_and_filters.return_value = [
             sample_search_result,
         ]
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
         result = service.search_by_text_and_filters_with_type(
             text=text,
             filters=filters,
             top=top,
-            search_type=SearchType.SPARSE,
+            search_type=search_type,
         )
 
         assert result == [sample_search_result]
-        mock_sparse_embedding_service.encode.assert_called_once_with(text)
+        used.encode.assert_called_once_with(text)
+        unused.encode.assert_not_called()
+        mock_repository.search_hybrid_by_vectors_and_filters.assert_not_called()
         mock_repository.search_by_vector_and_filters.assert_called_once_with(
-            vector=sample_sparse_vector,
+            vector=query_vector,
             filters=filters,
             top=top,
-            vector_name="sparse",
+            vector_name=vector_name,
         )
 
     def test_search_by_text_hybrid(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
         mock_embedding_service: EmbeddingServiceContract,
         mock_sparse_embedding_service: SparseEmbeddingServiceContract,
@@ -485,7 +469,7 @@ class TestEntityService:
         sample_sparse_vector: SparseVector,
         sample_search_result: SearchResult,
     ) -> None:
-        """Test hybrid search."""
+        """Test that a hybrid search encodes and searches with both vectors."""
         text = "search text"
         filters = []
         top = 10
@@ -496,12 +480,6 @@ class TestEntityService:
             sample_search_result,
         ]
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
         result = service.search_by_text_and_filters_with_type(
             text=text,
             filters=filters,
@@ -512,6 +490,7 @@ class TestEntityService:
         assert result == [sample_search_result]
         mock_embedding_service.encode.assert_called_once_with(text)
         mock_sparse_embedding_service.encode.assert_called_once_with(text)
+        mock_repository.search_by_vector_and_filters.assert_not_called()
         mock_repository.search_hybrid_by_vectors_and_filters.assert_called_once_with(
             dense_vector=sample_dense_vector,
             sparse_vector=sample_sparse_vector,
@@ -519,82 +498,83 @@ class TestEntityService:
             top=top,
         )
 
+    @pytest.mark.parametrize("text", ["", "   "])
     def test_search_by_text_empty_validation(
         self,
-        mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
+        service: EntityService,
+        text: str,
     ) -> None:
         """Test ValidationError for empty search text."""
-        filters = []
-        top = 10
-
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
-        with pytest.raises(ValidationError, match="Searched text cannot be empty"):
-            service.search_by_text_and_filters_with_type(
-                text="",
-                filters=filters,
-                top=top,
-                search_type=SearchType.SEMANTIC,
-            )
-
         with pytest.raises(ValidationError, match="Searched text cannot be empty"):
             service.search_by_text_and_filters_with_type(
-                text="   ",
-                filters=filters,
-                top=top,
+                text=text,
+                filters=[],
+                top=10,
                 search_type=SearchType.SEMANTIC,
             )
 
+    @pytest.mark.parametrize(
+        ("search_type", "failing_encoder", "message"),
+        [
+            pytest.param(
+                SearchType.SEMANTIC,
+                "mock_embedding_service",
+                "Dense encoding error",
+                id="semantic",
+            ),
+            pytest.param(
+                SearchType.SPARSE,
+                "mock_sparse_embedding_service",
+                "Sparse encoding error",
+                id="sparse",
+            ),
+            pytest.param(
+                SearchType.HYBRID,
+                "mock_embedding_service",
+                "Encoding error",
+                id="hybrid-dense",
+            ),
+            pytest.param(
+                SearchType.HYBRID,
+                "mock_sparse_embedding_service",
+                "Encoding error",
+                id="hybrid-sparse",
+            ),
+        ],
+    )
     def test_search_by_text_encoding_error(
         self,
+        service: EntityService,
         mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
+        request: pytest.FixtureRequest,
+        search_type: SearchType,
+        failing_encoder: str,
+        message: str,
     ) -> None:
-        """Test EmbeddingError during search encoding."""
-        text = "search text"
-        filters = []
-        top = 10
-
-        mock_embedding_service.encode.side_effect = Exception("Encoding failed")
-
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
+        """Test EmbeddingError when an encoder used by the search fails."""
+        request.getfixturevalue(failing_encoder).encode.side_effect = Exception(
+            "Encoding failed",
         )
 
-        with pytest.raises(EmbeddingError, match="Dense encoding error"):
+        with pytest.raises(EmbeddingError, match=message):
             service.search_by_text_and_filters_with_type(
-                text=text,
-                filters=filters,
-                top=top,
-                search_type=SearchType.SEMANTIC,
+                text="search text",
+                filters=[],
+                top=10,
+                search_type=search_type,
             )
+        mock_repository.search_by_vector_and_filters.assert_not_called()
+        mock_repository.search_hybrid_by_vectors_and_filters.assert_not_called()
 
     def test_search_by_text_unsupported_type(
         self,
-        mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
+        service: EntityService,
     ) -> None:
         """Test ValidationError for unsupported search type."""
         text = "search text"
         filters = []
         top = 10
 
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
         # Test with an invalid search type (we'll mock it)
         with pytest.raises(ValidationError, match="Unsupported search type"):
             service.search_by_text_and_filters_with_type(
@@ -603,71 +583,3 @@ class TestEntityService:
                 top=top,
                 search_type="INVALID_TYPE",  # This will cause the validation error
             )
-
-    def test_search_by_text_sparse_encoding_error(
-        self,
-        mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
-    ) -> None:
-        """Test EmbeddingError during sparse search encoding."""
-        text = "search text"
-        filters = []
-        top = 10
-
-        mock_sparse_embedding_service.encode.side_effect = Exception(
-            "Sparse encoding failed",
-        )
-
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
-        with pytest.raises(EmbeddingError, match="Sparse encoding error"):
-            service.search_by_text_and_filters_with_type(
-                text=text,
-                filters=filters,
-                top=top,
-                search_type=SearchType.SPARSE,
-            )
-
-    def test_search_by_text_hybrid_encoding_error(
-        self,
-        mock_repository: RepositoryContract,
-        mock_embedding_service: EmbeddingServiceContract,
-        mock_sparse_embedding_service: SparseEmbeddingServiceContract,
-    ) -> None:
-        """Test EmbeddingError during hybrid search encoding."""
-        text = "search text"
-        filters = []
-        top = 10
-
-        service = EntityService(
-            mock_repository,
-            mock_embedding_service,
-            mock_sparse_embedding_service,
-        )
-
-        service.sparse_embedding_service.encode.side_effect = Exception(
-            "Sparse encoding failed",
-        )
-        with pytest.raises(EmbeddingError, match="Encoding error"):
-            service.search_by_text_and_filters_with_type(
-                text=text,
-                filters=filters,
-                top=top,
-                search_type=SearchType.HYBRID,
-            )
-
-        service.dense_embedding_service.encode.side_effect = Exception(
-            "Dense encoding failed",
-        )
-        with pytest.raises(EmbeddingError, match="Encoding error"):
-            service.search_by_text_and_filters_with_type(
-                text=text,
-                filters=filters,
-                top=top,
-                search_type=SearchType.HYBRID,
-            )
@@ -0,0 +1,43 @@
+"""Test module for Competency model."""
+
+from domain.types.competency import Competency
+from domain.types.enums import CompetencyType, Language, Provider
+
+
+class TestCompetency:
+    """Test class for Competency model."""
+
+    def test_competency_keeps_enum_members(self) -> None:
+        """Test that enum fields are stored as enum members."""
+        competency = Competency(
+            code="code",
+            lang="fr",
+            type="skill",
+            provider="esco",
+            title="Title",
+        )
+
+        assert competency.lang is Language.FR
+        assert competency.type is CompetencyType.SKILL
+        assert competency.provider is Provider.ESCO
+
+    def test_competency_json_dump_uses_enum_values(self) -> None:
+        """Test that JSON serialization outputs the enum string values."""
+        competency = Competency(
+            code="code",
+            lang=Language.EN,
+            type=CompetencyType.OCCUPATION,
+            provider=Provider.ROME,
+            title="Title",
+        )
+
+        data = competency.model_dump(mode="json", exclude_none=True)
+
+        assert data == {
+            "code": "code",
+            "lang": "en",
+            "type": "occupation",
+            "provider": "rome",
+            "title": "Title",
+        }
+        assert type(data["lang"]) is str
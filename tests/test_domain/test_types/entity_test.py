@@ -1,5 +1,7 @@
 """Test module for Entity type."""
 
+import pytest
+
 from domain.types.competency import Competency
 from domain.types.entity import Entity
 from domain.types.identifier import Identifier
@@ -9,59 +11,47 @@ from domain.types.vectors import DenseVector, SparseVector
 class TestEntity:
     """Test class for Entity."""
 
-    def test_entity_creation_with_all_fields(
-        self,
-        sample_identifier: Identifier,
-        sample_competency: Competency,
-        sample_dense_vector: DenseVector,
-        sample_sparse_vector: SparseVector,
-    ) -> None:
-        """Test creating an entity with all fields."""
-        entity = Entity(
-            identifier=sample_identifier,
-            competency=sample_competency,
-            dense_vector=sample_dense_vector,
-            sparse_vector=sample_sparse_vector,
-        )
-
-        assert entity.identifier == sample_identifier
-        assert entity.competency == sample_competency
-        assert entity.dense_vector == sample_dense_vector
-        assert entity.sparse_vector == sample_sparse_vector
-
-    def test_entity_creation_without_vectors(
+    @pytest.mark.parametrize(
+        "vector_fixtures",
+        [
+            pytest.param(
+                {
+                    "dense_vector": "sample_dense_vector",
+                    "sparse_vector": "sample_sparse_vector",
+                },
+                id="all-fields",
+            ),
+            pytest.param({}, id="without-vectors"),
+            pytest.param(
+                {"dense_vector": None, "sparse_vector": None},
+                id="none-vectors",
+            ),
+            pytest.param({"dense_vector": "sample_dense_vector"}, id="dense-only"),
+        ],
+    )
+    def test_entity_creation(
         self,
         sample_identifier: Identifier,
         sample_competency: Competency,
+        request: pytest.FixtureRequest,
+        vector_fixtures: dict[str, str | None],
     ) -> None:
-        """Test creating an entity without vectors (optional fields)."""
-        entity = Entity(
-            identifier=sample_identifier,
-            competency=sample_competency,
-        )
-
-        assert entity.identifier == sample_identifier
-        assert entity.competency == sample_competency
-        assert entity.dense_vector is None
-        assert entity.sparse_vector is None
+        """Test creating an entity with any combination of its optional vectors."""
+        vectors = {
+            field: None if name is None else request.getfixturevalue(name)
+            for field, name in vector_fixtures.items()
+        }
 
-    def test_entity_creation_with_none_vectors(
-        self,
-        sample_identifier: Identifier,
-        sample_competency: Competency,
-    ) -> None:
-        """Test creating an entity with explicit None vectors."""
         entity = Entity(
             identifier=sample_identifier,
             competency=sample_competency,
-            dense_vector=None,
-            sparse_vector=None,
+            **vectors,
         )
 
-        assert entity.identifier == sample_identifier
-        assert entity.competency == sample_competency
-        assert entity.dense_vector is None
-        assert entity.sparse_vector is None
+        assert entity.identifier is sample_identifier
+        assert entity.competency is sample_competency
+        assert entity.dense_vector is vectors.get("dense_vector")
+        assert entity.sparse_vector is vectors.get("sparse_vector")
 
     def test_entity_equality(
         self,
@@ -84,7 +74,4 @@ class TestEntity:
             sparse_vector=sample_sparse_vector,
         )
 
-        assert entity1.identifier == entity2.identifier
-        assert entity1.competency == entity2.competency
-        assert entity1.dense_vector == entity2.dense_vector
-        assert entity1.sparse_vector == entity2.sparse_vector
+        assert entity1 == entity2
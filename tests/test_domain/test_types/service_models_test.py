@@ -1,5 +1,7 @@
 """Test module for service models."""
 
+import pytest
+
 from domain.types.competency import Competency
 from domain.types.entity import Entity
 from domain.types.identifier import Identifier
@@ -10,6 +12,25 @@ from domain.types.service_models import (
 )
 from domain.types.vectors import DenseVector, SparseVector
 
+# Vector pairs shared by the create and update model tests, which do not mutate them
+_VECTOR_PAIRS = [
+    pytest.param(
+        DenseVector(values=[1.0, 2.0, 3.0]),
+        SparseVector(indices=[0, 1], values=[1.0, 2.0]),
+        id="short",
+    ),
+    pytest.param(
+        DenseVector(values=[0.1, 0.2, 0.3]),
+        SparseVector(indices=[0, 2, 4], values=[0.1, 0.3, 0.5]),
+        id="fractional",
+    ),
+    pytest.param(
+        DenseVector(values=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]),
+        SparseVector(indices=[1, 3, 5, 7, 9], values=[1.0, 2.0, 3.0, 4.0, 5.0]),
+        id="long",
+    ),
+]
+
 
 class TestSearchResult:
     """Test class for SearchResult."""
@@ -23,13 +44,15 @@ class TestSearchResult:
         assert search_result.entity == sample_entity
         assert search_result.score == score
 
-    def test_search_result_with_different_scores(self, sample_entity: Entity) -> None:
+    @pytest.mark.parametrize("score", [0.0, 0.5, 0.95, 1.0, -0.1, 1.5])
+    def test_search_result_with_different_scores(
+        self,
+        sample_entity: Entity,
+        score: float,
+    ) -> None:
         """Test SearchResult with different score values."""
-        scores = [0.0, 0.5, 0.95, 1.0, -0.1, 1.5]
-
-        for score in scores:
-            search_result = SearchResult(entity=sample_entity, score=score)
-            assert search_result.score == score
+        search_result = SearchResult(entity=sample_entity, score=score)
+        assert search_result.score == score
 
     def test_search_result_equality(self, sample_entity: Entity) -> None:
         """Test SearchResult equality."""
@@ -38,8 +61,7 @@ class TestSearchResult:
         result1 = SearchResult(entity=sample_entity, score=score)
         result2 = SearchResult(entity=sample_entity, score=score)
 
-        assert result1.score == result2.score
-        assert result1.entity.identifier == result2.entity.identifier
+        assert result1 == result2
 
 
 class TestCreateEntityModel:
@@ -58,35 +80,25 @@ class TestCreateEntityModel:
             sparse_vector=sample_sparse_vector,
         )
 
-        assert model.competency == sample_competency
-        assert model.dense_vector == sample_dense_vector
-        assert model.sparse_vector == sample_sparse_vector
+        assert model.competency is sample_competency
+        assert model.dense_vector is sample_dense_vector
+        assert model.sparse_vector is sample_sparse_vector
 
+    @pytest.mark.parametrize(("dense_vector", "sparse_vector"), _VECTOR_PAIRS)
     def test_create_entity_model_vector_types(
         self,
         sample_competency: Competency,
+        dense_vector: DenseVector,
+        sparse_vector: SparseVector,
     ) -> None:
         """Test CreateEntityModel with different vector types."""
-        dense_vectors = [
-            DenseVector(values=[1.0, 2.0, 3.0]),
-            DenseVector(values=[0.1, 0.2, 0.3]),
-            DenseVector(values=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]),
-        ]
-
-        sparse_vectors = [
-            SparseVector(indices=[0, 1], values=[1.0, 2.0]),
-            SparseVector(indices=[0, 2, 4], values=[0.1, 0.3, 0.5]),
-            SparseVector(indices=[1, 3, 5, 7, 9], values=[1.0, 2.0, 3.0, 4.0, 5.0]),
-        ]
-
-        for dense_vec, sparse_vec in zip(dense_vectors, sparse_vectors, strict=False):
-            model = CreateEntityModel(
-                competency=sample_competency,
-                dense_vector=dense_vec,
-                sparse_vector=sparse_vec,
-            )
-            assert model.dense_vector == dense_vec
-            assert model.sparse_vector == sparse_vec
+        model = CreateEntityModel(
+            competency=sample_competency,
+            dense_vector=dense_vector,
+            sparse_vector=sparse_vector,
+        )
+        assert model.dense_vector == dense_vector
+        assert model.sparse_vector == sparse_vector
 
 
 class TestUpdateEntityModel:
@@ -107,10 +119,28 @@ class TestUpdateEntityModel:
             sparse_vector=sample_sparse_vector,
         )
 
-        assert model.identifier == sample_identifier
-        assert model.competency == sample_competency
-        assert model.dense_vector == sample_dense_vector
-        assert model.sparse_vector == sample_sparse_vector
+        assert model.identifier is sample_identifier
+        assert model.competency is sample_competency
+        assert model.dense_vector is sample_dense_vector
+        assert model.sparse_vector is sample_sparse_vector
+
+    @pytest.mark.parametrize(("dense_vector", "sparse_vector"), _VECTOR_PAIRS)
+    def test_update_entity_model_vector_types(
+        self,
+        sample_identifier: Identifier,
+        sample_competency: Competency,
+        dense_vector: DenseVector,
+        sparse_vector: SparseVector,
+    ) -> None:
+        """Test UpdateEntityModel with different vector types."""
+        model = UpdateEntityModel(
+            identifier=sample_identifier,
+            competency=sample_competency,
+            dense_vector=dense_vector,
+            sparse_vector=sparse_vector,
+        )
+        assert model.dense_vector == dense_vector
+        assert model.sparse_vector == sparse_vector
 
     def test_update_entity_model_equality(
         self,
@@ -134,8 +164,4 @@ class TestUpdateEntityModel:
             sparse_vector=sample_sparse_vector,
         )
 
-        # Test individual components
-        assert model1.identifier == model2.identifier
-        assert model1.competency == model2.competency
-        assert model1.dense_vector == model2.dense_vector
-        assert model1.sparse_vector == model2.sparse_vector
+        assert model1 == model2
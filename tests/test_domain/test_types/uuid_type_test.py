@@ -4,6 +4,12 @@ from uuid import UUID, uuid4
 
 from domain.types.identifier import Identifier
 
+_UUID_STRING = "550e8400-e29b-41d4-a716-446655440000"
+# Same UUID as a 128-bit integer, to check parsing without formatting back
+_UUID_INT = 0x550E8400_E29B_41D4_A716_446655440000
+# Parsed once, UUIDs are immutable
+_UUID = Identifier(_UUID_STRING)
+
 
 class TestIdentifier:
     """Test class for Identifier type alias."""
@@ -18,26 +24,17 @@ class TestIdentifier:
         # Using uuid4() to create a random UUID
         identifier = uuid4()
 
-        # Should be an instance of both UUID and Identifier
-        assert isinstance(identifier, UUID)
         assert isinstance(identifier, Identifier)
 
     def test_identifier_from_string(self) -> None:
         """Test creating Identifier from string."""
-        uuid_string = "550e8400-e29b-41d4-a716-446655440000"
-        identifier = Identifier(uuid_string)
+        identifier = Identifier(_UUID_STRING)
 
-        assert isinstance(identifier, UUID)
         assert isinstance(identifier, Identifier)
-        assert str(identifier) == uuid_string
+        assert identifier.int == _UUID_INT
+        assert str(identifier) == _UUID_STRING
 
     def test_identifier_equality(self) -> None:
         """Test Identifier equality."""
-        uuid_string = "550e8400-e29b-41d4-a716-446655440000"
-
-        identifier1 = Identifier(uuid_string)
-        identifier2 = Identifier(uuid_string)
-        identifier3 = uuid4()
-
-        assert identifier1 == identifier2
-        assert identifier1 != identifier3
+        assert Identifier(int=_UUID_INT) == _UUID
+        assert uuid4() != _UUID
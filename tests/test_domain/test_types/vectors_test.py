@@ -1,5 +1,7 @@
 """Test module for vector types."""
 
+import pytest
+
 from domain.types.vectors import DenseVector, SparseVector, VectorName
 
 
@@ -22,6 +24,12 @@ class TestDenseVector:
         assert dense_vector.values == []
         assert len(dense_vector.values) == 0
 
+    def test_dense_vector_uses_slots(self) -> None:
+        """Test DenseVector instances do not carry a __dict__."""
+        dense_vector = DenseVector(values=[1.0])
+
+        assert not hasattr(dense_vector, "__dict__")
+
 
 class TestSparseVector:
     """Test class for SparseVector."""
@@ -45,35 +53,27 @@ class TestSparseVector:
         assert len(sparse_vector.indices) == 0
         assert len(sparse_vector.values) == 0
 
+    def test_sparse_vector_uses_slots(self) -> None:
+        """Test SparseVector instances do not carry a __dict__."""
+        sparse_vector = SparseVector(indices=[0], values=[1.0])
+
+        assert not hasattr(sparse_vector, "__dict__")
+
 
 class TestVectorName:
     """Test class for VectorName enum."""
 
-    def test_vector_name_dense_value(self) -> None:
-        """Test that DENSE vector name has correct value."""
-        assert VectorName.DENSE == "dense"
-        assert VectorName.DENSE.value == "dense"
-
-    def test_vector_name_sparse_value(self) -> None:
-        """Test that SPARSE vector name has correct value."""
-        assert VectorName.SPARSE == "sparse"
-        assert VectorName.SPARSE.value == "sparse"
-
-    def test_vector_name_membership(self) -> None:
-        """Test VectorName enum membership."""
-        assert VectorName.DENSE in VectorName
-        assert VectorName.SPARSE in VectorName
-
-    def test_vector_name_count(self) -> None:
-        """Test that VectorName has exactly 2 members."""
-        assert len(VectorName) == 2
-
-    def test_vector_name_from_string(self) -> None:
-        """Test creating VectorName from string value."""
-        assert VectorName("dense") == VectorName.DENSE
-        assert VectorName("sparse") == VectorName.SPARSE
-
-    def test_vector_name_str_representation(self) -> None:
-        """Test string representation of VectorName."""
-        assert str(VectorName.DENSE) == "dense"
-        assert str(VectorName.SPARSE) == "sparse"
+    @pytest.mark.parametrize(
+        ("member", "value"),
+        [(VectorName.DENSE, "dense"), (VectorName.SPARSE, "sparse")],
+    )
+    def test_vector_name_member(self, member: VectorName, value: str) -> None:
+        """Test the value, string form and lookup of a VectorName member."""
+        assert member == value
+        assert member.value == value
+        assert str(member) == value
+        assert VectorName(value) is member
+
+    def test_vector_name_members(self) -> None:
+        """Test that VectorName has exactly the dense and sparse members."""
+        assert list(VectorName) == [VectorName.DENSE, VectorName.SPARSE]